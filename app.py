@@ -24,7 +24,7 @@ from logger import info, error, exception
 from config_manager import ConfigManager
 from utils.error_handler import show_error_dialog
 from utils.health_monitor import HealthMonitor
-from main import ZoneManagerGUI
+from main import ZoneManagerGUI, exit_process
 
 # Application metadata
 APP_DISPLAY_NAME = "Traffic Vision"
@@ -226,7 +226,8 @@ def main():
     """Application entry point."""
     try:
         app = Application()
-        sys.exit(app.run())
+        # Resources and the database are already cleaned up on aboutToQuit
+        exit_process(app.run())
     except Exception as e:
         exception(f"Fatal error: {e}")
         sys.exit(1)
@@ -2,7 +2,9 @@ import json
 import os
 from typing import Dict, Any
 
-from logger import logger
+from logger import get_logger
+
+logger = get_logger()
 
 class ConfigManager:
     """
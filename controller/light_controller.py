@@ -4,8 +4,9 @@ from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 import json
 import os
-from logger import logger
-import cv2
+from logger import get_logger
+
+logger = get_logger()
 
 class TrafficLightState(Enum):
     """Represents the possible states of a traffic light."""
@@ -642,6 +643,8 @@ class TrafficLightPositionSelector:
 
     def select_position(self, light_name: str) -> tuple:
         """Interactively select a position on the video frame."""
+        import cv2
+
         cap = cv2.VideoCapture(self.video_path)
         if not cap.isOpened():
             logger.error("Error opening video stream")
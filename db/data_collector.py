@@ -1,13 +1,15 @@
 import time
+import sqlite3
 import threading
 import numpy as np
 from typing import Dict, List, Any, Optional
-from queue import Queue
-import cv2
+from queue import Queue, Empty
 import traceback
 
 from db.database import TrafficDatabase
-from logger import logger
+from logger import get_logger
+
+logger = get_logger()
 
 
 class TrafficDataCollector:
@@ -15,6 +17,10 @@ class TrafficDataCollector:
     Collects and stores traffic data for analysis and visualization.
     Runs continuously in a background thread and stores data in SQLite.
     """
+    # Queued records are written in one transaction per batch of up to this many records or seconds
+    WRITE_BATCH_SIZE = 256
+    WRITE_BATCH_INTERVAL = 0.25
+
     def __init__(self, db_path: str = "data/traffic_data.db", collection_interval: float = 5.0):
         """
         Initialize data collector with specified collection interval.
@@ -38,41 +44,65 @@ class TrafficDataCollector:
         self.processing_thread.start()
 
     def _process_queue(self):
-        """Process queued data records in background."""
-        while not self.stop_event.is_set():
-            try:
-                if self.data_queue.empty():
-                    time.sleep(0.1)
-                    continue
-
-                record_type, data = self.data_queue.get()
-                session_id = self.current_session_id
-
-                if session_id is None:
-                    self.data_queue.task_done()
-                    continue
-
-                if record_type == "vehicle_counts":
-                    self.database.record_vehicle_counts(session_id, data)
-                elif record_type == "pedestrian_counts":
-                    self.database.record_pedestrian_counts(session_id, data)
-                elif record_type == "vehicle_speeds":
-                    self.database.record_vehicle_speeds(session_id, data)
-                elif record_type == "traffic_lights":
-                    self.database.record_traffic_light_states(session_id, data)
-                elif record_type == "event":
-                    event_type, details = data
-                    self.database.record_event(session_id, event_type, details)
-                elif record_type == "heatmap":
-                    zone_name, avg, max_val = data
-                    self.database.record_heatmap_data(session_id, zone_name, avg, max_val)
-
-                self.data_queue.task_done()
+        """Process queued data records in background, committing them in batches."""
+        # Records still queued at shutdown are written before the thread exits
+        while not (self.stop_event.is_set() and self.data_queue.empty()):
+            batch = self._drain_queue()
+            if not batch:
+                continue
 
+            try:
+                for session_id, record_type, data in batch:
+                    self._write_record(session_id, record_type, data)
+                self.database.commit()
+            except sqlite3.Error as e:
+                # Records are written without committing, so the failed batch is discarded as a whole
+                self.database.rollback()
+                logger.error(f"Error writing {len(batch)} queued records, batch discarded: {e}")
             except Exception as e:
                 logger.error(f"Error processing data queue: {e}")
                 logger.error(traceback.format_exc())
                 time.sleep(1)
+            finally:
+                for _ in batch:
+                    self.data_queue.task_done()
+
+    def _drain_queue(self):
+        """Collects queued records until the batch is full or the batch interval has passed."""
+        batch = []
+        deadline = time.time() + self.WRITE_BATCH_INTERVAL
+        while len(batch) < self.WRITE_BATCH_SIZE:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.data_queue.get(timeout=min(remaining, 0.05)))
+            except Empty:
+                continue
+        return batch
+
+    def _write_record(self, session_id, record_type, data):
+        """Writes one queued record without committing it."""
+        if record_type == "vehicle_counts":
+            self.database.record_vehicle_counts(session_id, data, commit=False)
+        elif record_type == "pedestrian_counts":
+            self.database.record_pedestrian_counts(session_id, data, commit=False)
+        elif record_type == "vehicle_speeds":
+            self.database.record_vehicle_speeds(session_id, data, commit=False)
+        elif record_type == "traffic_lights":
+            self.database.record_traffic_light_states(session_id, data, commit=False)
+        elif record_type == "event":
+            event_type, details = data
+            self.database.record_event(session_id, event_type, details, commit=False)
+        elif record_type == "heatmap":
+            zone_name, avg, max_val = data
+            self.database.record_heatmap_data(session_id, zone_name, avg, max_val, commit=False)
+
+    def _enqueue(self, record_type, data):
+        """Queues a record for the writer thread, tagged with the session it was collected in."""
+        session_id = self.current_session_id
+        if session_id is not None:
+            self.data_queue.put((session_id, record_type, data))
 
     def set_zone_manager(self, zone_manager):
         """Set reference to the ZoneManager instance."""
@@ -108,6 +138,9 @@ class TrafficDataCollector:
             self.collection_thread.join(timeout=2.0)
             self.collection_thread = None
 
+        # Let the writer store the session's last records before the session is closed
+        self.data_queue.join()
+
         if self.current_session_id:
             self.database.end_session(self.current_session_id)
             session_id = self.current_session_id
@@ -152,7 +185,7 @@ class TrafficDataCollector:
         try:
             zone_vehicle_counts = self.zone_manager.get_zone_vehicle_counts()
             if zone_vehicle_counts:
-                self.data_queue.put(("vehicle_counts", zone_vehicle_counts))
+                self._enqueue("vehicle_counts", zone_vehicle_counts)
         except Exception as e:
             logger.error(f"Error collecting vehicle counts: {e}")
 
@@ -164,7 +197,7 @@ class TrafficDataCollector:
         try:
             zone_pedestrian_counts = self.zone_manager.get_zone_pedestrian_counts()
             if zone_pedestrian_counts:
-                self.data_queue.put(("pedestrian_counts", zone_pedestrian_counts))
+                self._enqueue("pedestrian_counts", zone_pedestrian_counts)
         except Exception as e:
             logger.error(f"Error collecting pedestrian counts: {e}")
 
@@ -206,7 +239,7 @@ class TrafficDataCollector:
                     })
 
                 if speeds_data:
-                    self.data_queue.put(("vehicle_speeds", speeds_data))
+                    self._enqueue("vehicle_speeds", speeds_data)
         except Exception as e:
             logger.error(f"Error collecting vehicle speeds: {e}")
 
@@ -223,17 +256,17 @@ class TrafficDataCollector:
                 # Check if we have valid intersection data
                 if intersection_data:
                     # Record the current state
-                    self.data_queue.put(("traffic_lights", intersection_data))
+                    self._enqueue("traffic_lights", intersection_data)
 
                     # Explicitly record mode changes as separate events
                     for intersection_id, data in intersection_data.items():
                         if data.get('adaptive_mode_changed', False):
                             is_adaptive = data.get('is_adaptive_mode', True)
                             mode_str = "Adaptive" if is_adaptive else "Fixed"
-                            self.data_queue.put((
+                            self._enqueue(
                                 "event",
                                 ("traffic_light_mode_change", f"Traffic light mode changed to {mode_str}")
-                            ))
+                            )
         except Exception as e:
             logger.error(f"Error collecting traffic light states: {e}")
 
@@ -252,11 +285,11 @@ class TrafficDataCollector:
                 for vehicle_type, count in emergency_vehicles.items():
                     if count > 0:
                         details = f"{vehicle_type.capitalize()} detected (count: {count})"
-                        self.data_queue.put(("event", ("emergency", details)))
+                        self._enqueue("event", ("emergency", details))
 
             # Check for accidents
             if self.zone_manager.is_accident_detected():
-                self.data_queue.put(("event", ("accident", "Accident detected")))
+                self._enqueue("event", ("accident", "Accident detected"))
         except Exception as e:
             logger.error(f"Error collecting events: {e}")
 
@@ -267,18 +300,12 @@ class TrafficDataCollector:
 
         try:
             # Calculate heatmap stats per vehicle zone
-            heatmap = self.zone_manager.persistent_heatmap
+            heatmap = self.zone_manager.get_heatmap_array()
 
             for zone_type in self.zone_manager.zones:
                 for zone_name, zone_info in self.zone_manager.zones[zone_type].items():
-                    zone = zone_info['zone']
-                    # Create a mask for this zone
-                    mask = np.zeros_like(heatmap, dtype=np.uint8)
-                    polygon = zone.polygon.reshape((-1, 1, 2))
-                    cv2.fillPoly(mask, [polygon.astype(np.int32)], 1)
-
-                    # Apply mask to heatmap
-                    zone_heatmap = heatmap * mask
+                    # Select the heatmap values inside the zone's cached mask
+                    zone_heatmap = heatmap[zone_info['mask']]
 
                     # Calculate statistics (ignore zeros)
                     nonzero = zone_heatmap[zone_heatmap > 0] if np.any(zone_heatmap > 0) else np.array([0])
@@ -286,7 +313,7 @@ class TrafficDataCollector:
                     max_intensity = float(np.max(nonzero)) if np.any(nonzero) else 0
 
                     # Record zone heatmap data
-                    self.data_queue.put(("heatmap", (zone_name, avg_intensity, max_intensity)))
+                    self._enqueue("heatmap", (zone_name, avg_intensity, max_intensity))
         except Exception as e:
             logger.error(f"Error collecting heatmap data: {e}")
 
@@ -305,13 +332,16 @@ class TrafficDataCollector:
         return self.database.get_available_sessions()
 
     def shutdown(self):
-        """Clean up resources and close database connection."""
+        """
+        Clean up resources and close database connection.
+        Returns once the writer thread has stored every queued record, so the process can exit right after.
+        """
         self.stop_collection()
 
-        # Stop processing thread
+        # The writer exits once the queue is empty; waiting without a timeout keeps the last batch
         self.stop_event.set()
         if self.processing_thread:
-            self.processing_thread.join(timeout=2.0)
+            self.processing_thread.join()
 
         # Close database connection
         self.database.close()
@@ -3,7 +3,9 @@ import threading
 import os
 from datetime import datetime, timezone
 from typing import Dict, List, Any
-from logger import logger
+from logger import get_logger
+
+logger = get_logger()
 
 
 class TrafficDatabase:
@@ -213,19 +215,18 @@ class TrafficDatabase:
             self.local.conn.rollback()
             return False
 
-    def record_vehicle_counts(self, session_id: int, zone_counts: Dict[str, Dict[str, int]]) -> bool:
+    def record_vehicle_counts(self, session_id: int, zone_counts: Dict[str, Dict[str, int]], commit: bool = True) -> bool:
         """Record vehicle counts for all zones."""
         self.ensure_connection()
         current_time = self.get_current_time()
         try:
-            for zone_name, counts in zone_counts.items():
-                total = sum(counts.values())
-                self.local.cursor.execute(
-                    """
-                    INSERT INTO zone_vehicle_counts
-                    (session_id, timestamp, zone_name, car, truck, bus, motorcycle, bicycle, total)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+            self.local.cursor.executemany(
+                """
+                INSERT INTO zone_vehicle_counts
+                (session_id, timestamp, zone_name, car, truck, bus, motorcycle, bicycle, total)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         session_id,
                         current_time,
@@ -235,12 +236,17 @@ class TrafficDatabase:
                         counts.get("bus", 0),
                         counts.get("motorcycle", 0),
                         counts.get("bicycle", 0),
-                        total
+                        sum(counts.values())
                     )
-                )
-            self.local.conn.commit()
+                    for zone_name, counts in zone_counts.items()
+                ]
+            )
+            if commit:
+                self.local.conn.commit()
             return True
         except sqlite3.Error as e:
+            if not commit:
+                raise
             logger.error(f"Error recording vehicle counts: {e}")
             try:
                 self.local.conn.rollback()
@@ -248,19 +254,21 @@ class TrafficDatabase:
                 self.connect()
             return False
 
-    def record_pedestrian_counts(self, session_id: int, zone_counts: Dict[str, int]) -> bool:
+    def record_pedestrian_counts(self, session_id: int, zone_counts: Dict[str, int], commit: bool = True) -> bool:
         """Record pedestrian counts for all zones."""
         self.ensure_connection()
         current_time = self.get_current_time()
         try:
-            for zone_name, count in zone_counts.items():
-                self.local.cursor.execute(
-                    "INSERT INTO zone_pedestrian_counts (session_id, timestamp, zone_name, count) VALUES (?, ?, ?, ?)",
-                    (session_id, current_time, zone_name, count)
-                )
-            self.local.conn.commit()
+            self.local.cursor.executemany(
+                "INSERT INTO zone_pedestrian_counts (session_id, timestamp, zone_name, count) VALUES (?, ?, ?, ?)",
+                [(session_id, current_time, zone_name, count) for zone_name, count in zone_counts.items()]
+            )
+            if commit:
+                self.local.conn.commit()
             return True
         except sqlite3.Error as e:
+            if not commit:
+                raise
             logger.error(f"Error recording pedestrian counts: {e}")
             try:
                 self.local.conn.rollback()
@@ -268,7 +276,7 @@ class TrafficDatabase:
                 self.connect()
             return False
 
-    def record_vehicle_speeds(self, session_id: int, speeds_data: List[Dict[str, Any]]) -> bool:
+    def record_vehicle_speeds(self, session_id: int, speeds_data: List[Dict[str, Any]], commit: bool = True) -> bool:
         """
         Record individual vehicle speeds.
         """
@@ -278,13 +286,13 @@ class TrafficDatabase:
 
         current_time = self.get_current_time()
         try:
-            for data in speeds_data:
-                self.local.cursor.execute(
-                    """
-                    INSERT INTO vehicle_speeds
-                    (session_id, timestamp, vehicle_type, speed, tracker_id, zone_name)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
+            self.local.cursor.executemany(
+                """
+                INSERT INTO vehicle_speeds
+                (session_id, timestamp, vehicle_type, speed, tracker_id, zone_name)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         session_id,
                         current_time,
@@ -293,10 +301,15 @@ class TrafficDatabase:
                         data.get("tracker_id", -1),
                         data.get("zone_name")
                     )
-                )
-            self.local.conn.commit()
+                    for data in speeds_data
+                ]
+            )
+            if commit:
+                self.local.conn.commit()
             return True
         except sqlite3.Error as e:
+            if not commit:
+                raise
             logger.error(f"Error recording vehicle speeds: {e}")
             try:
                 self.local.conn.rollback()
@@ -304,33 +317,37 @@ class TrafficDatabase:
                 self.connect()
             return False
 
-    def record_traffic_light_states(self, session_id: int, light_states: Dict[str, Any]) -> bool:
+    def record_traffic_light_states(self, session_id: int, light_states: Dict[str, Any], commit: bool = True) -> bool:
         """Record traffic light states for all intersections."""
         self.ensure_connection()
         current_time = self.get_current_time()
         try:
-            for intersection_id, data in light_states.items():
-                is_adaptive = data.get("is_adaptive_mode", True)
-                for light in data.get("lights", []):
-                    self.local.cursor.execute(
-                        """
-                        INSERT INTO traffic_light_states
-                        (session_id, timestamp, intersection_id, light_id, state, duration, is_adaptive_mode)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            session_id,
-                            current_time,
-                            intersection_id,
-                            light.get("id", "unknown"),
-                            light.get("state", "UNKNOWN"),
-                            light.get("remaining", 0),
-                            is_adaptive
-                        )
+            self.local.cursor.executemany(
+                """
+                INSERT INTO traffic_light_states
+                (session_id, timestamp, intersection_id, light_id, state, duration, is_adaptive_mode)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        session_id,
+                        current_time,
+                        intersection_id,
+                        light.get("id", "unknown"),
+                        light.get("state", "UNKNOWN"),
+                        light.get("remaining", 0),
+                        data.get("is_adaptive_mode", True)
                     )
-            self.local.conn.commit()
+                    for intersection_id, data in light_states.items()
+                    for light in data.get("lights", [])
+                ]
+            )
+            if commit:
+                self.local.conn.commit()
             return True
         except sqlite3.Error as e:
+            if not commit:
+                raise
             logger.error(f"Error recording traffic light states: {e}")
             try:
                 self.local.conn.rollback()
@@ -338,7 +355,8 @@ class TrafficDatabase:
                 self.connect()
             return False
 
-    def record_event(self, session_id: int, event_type: str, details: str = None, duration: int = None) -> bool:
+    def record_event(self, session_id: int, event_type: str, details: str = None, duration: int = None,
+                     commit: bool = True) -> bool:
         """Record emergency or accident events."""
         self.ensure_connection()
         current_time = self.get_current_time()
@@ -347,9 +365,12 @@ class TrafficDatabase:
                 "INSERT INTO events (session_id, timestamp, event_type, details, duration) VALUES (?, ?, ?, ?, ?)",
                 (session_id, current_time, event_type, details, duration)
             )
-            self.local.conn.commit()
+            if commit:
+                self.local.conn.commit()
             return True
         except sqlite3.Error as e:
+            if not commit:
+                raise
             logger.error(f"Error recording event: {e}")
             try:
                 self.local.conn.rollback()
@@ -357,7 +378,8 @@ class TrafficDatabase:
                 self.connect()
             return False
 
-    def record_heatmap_data(self, session_id: int, zone_name: str, avg_intensity: float, max_intensity: float) -> bool:
+    def record_heatmap_data(self, session_id: int, zone_name: str, avg_intensity: float, max_intensity: float,
+                            commit: bool = True) -> bool:
         """Record heatmap intensity data for traffic density analysis."""
         self.ensure_connection()
         current_time = self.get_current_time()
@@ -370,9 +392,12 @@ class TrafficDatabase:
                 """,
                 (session_id, current_time, zone_name, avg_intensity, max_intensity)
             )
-            self.local.conn.commit()
+            if commit:
+                self.local.conn.commit()
             return True
         except sqlite3.Error as e:
+            if not commit:
+                raise
             logger.error(f"Error recording heatmap data: {e}")
             try:
                 self.local.conn.rollback()
@@ -380,6 +405,32 @@ class TrafficDatabase:
                 self.connect()
             return False
 
+    def rollback(self):
+        """
+        Discards records written with commit=False since the last commit.
+        Those writes raise sqlite3.Error instead of rolling back themselves, so a failing
+        record lets the caller roll back and report the whole batch once.
+        """
+        self.ensure_connection()
+        try:
+            self.local.conn.rollback()
+        except sqlite3.Error:
+            self.connect()
+
+    def commit(self) -> bool:
+        """Commit records written with commit=False as a single transaction."""
+        self.ensure_connection()
+        try:
+            self.local.conn.commit()
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Error committing records: {e}")
+            try:
+                self.local.conn.rollback()
+            except:
+                self.connect()
+            return False
+
     def close(self):
         """Close database connection."""
         if hasattr(self.local, 'conn') and self.local.conn:
@@ -1,25 +1,120 @@
 from PyQt6.QtCore import QThread, pyqtSignal
-import cv2
+from PyQt6.QtGui import QImage
+import queue
+import threading
 import time
+from collections import deque
+
+import cv2
+import numpy as np
+import torch
+
+from utils.constants import (DEFAULT_BATCH_SIZE, DEFAULT_CAMERA_BUFFER_LEN, DEFAULT_DISPLAY_FPS, DEFAULT_HW_DECODE,
+                             DECODE_BACKEND_OPENCV, DISPLAY_DELAY_SMOOTHING)
+from utils.video import is_live_source, open_video_capture
+from logger import get_logger
+
+logger = get_logger()
+
+# Queued by the capture thread after the last frame of the video
+END_OF_STREAM = None
+
+class CaptureThread(QThread):
+    """
+    Thread that reads frames from an opened capture into a bounded queue.
+    For live sources the oldest frame is dropped when the queue is full, so a slow consumer
+    never stalls the stream and always sees the most recent frames. Video files block
+    instead, so every frame is processed and tracking, counts and speeds stay continuous.
+    """
+    def __init__(self, cap, frame_queue, stop_event, vid_stride=1, drop_frames=False):
+        super().__init__()
+        self.cap = cap
+        self.frame_queue = frame_queue
+        self.stop_event = stop_event
+        self.vid_stride = max(1, vid_stride)
+        self.drop_frames = drop_frames
+        self.dropped_frames = 0
+
+    def _put(self, item):
+        """Queues an item using the overflow policy for this source."""
+        if self.drop_frames:
+            self._put_drop_oldest(item)
+        else:
+            self._put_blocking(item)
+
+    def _put_blocking(self, item):
+        """Queues an item, waiting for space until a stop is requested."""
+        while not self.stop_event.is_set():
+            try:
+                self.frame_queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _put_drop_oldest(self, item):
+        """Queues an item, discarding the oldest queued frame if the queue is full."""
+        while True:
+            try:
+                self.frame_queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.frame_queue.get_nowait()
+                    self.dropped_frames += 1
+                except queue.Empty:
+                    pass
+
+    def run(self):
+        """Reads frames until the video ends or a stop is requested."""
+        frame_count_total = 0
+        try:
+            while not self.stop_event.is_set():
+                ret, frame = self.cap.read()
+                if not ret:
+                    break
+
+                frame_count_total += 1
 
-from logger import logger
+                # Process only every vid_stride frames
+                if (frame_count_total - 1) % self.vid_stride != 0:
+                    continue
+
+                self._put((frame_count_total, frame))
+        except Exception as e:
+            logger.error(f"Error reading video frames: {e}")
+        finally:
+            self._put(END_OF_STREAM)
+            if self.dropped_frames:
+                logger.debug(f"Capture thread dropped {self.dropped_frames} frames")
 
 class InferenceThread(QThread):
     """
     Thread for running inference to avoid blocking the GUI.
     """
-    frame_processed_signal = pyqtSignal(object, object, object, float)
+    frame_processed_signal = pyqtSignal(object, object, float)
+    detection_data_signal = pyqtSignal(object, object, object, object)
     status_message_signal = pyqtSignal(str)
 
-    def __init__(self, zone_manager, video_path, inference_settings):
+    def __init__(self, zone_manager, video_path, inference_settings, decode_backend=DECODE_BACKEND_OPENCV):
         super().__init__()
         self.zone_manager = zone_manager
         self.video_path = video_path
         self.inference_settings = inference_settings
+        self.decode_backend = decode_backend
         self.cap = None
+        self.capture_thread = None
+        self.stop_event = threading.Event()
         self.is_running = False
         self.fps_values = []
         self.last_frame_time = None
+        self.last_emit_time = 0.0
+        self.display_interval = 1.0 / DEFAULT_DISPLAY_FPS
+        # Smoothed time between emitting a frame and the GUI showing it
+        self.display_delay = 0.0
+        # Set while an emitted frame has not been acknowledged by the GUI yet
+        self.display_pending = False
+        # Sizes the video and heatmap frames are drawn at; frames are downscaled to them before emitting
+        self.display_sizes = (None, None)
         self.frame_count = 0
         self.start_time = 0
 
@@ -32,17 +127,122 @@ class InferenceThread(QThread):
     def stop_inference(self):
         """Stop the inference thread and release resources."""
         self.is_running = False
-        if self.cap and self.cap.isOpened():
-            self.cap.release()
+        self.stop_event.set()
         self.wait()
         logger.info("Inference thread stopped")
 
+    def set_display_fps(self, display_fps):
+        """Sets the target rate at which processed frames are sent to the display."""
+        self.display_interval = 1.0 / max(1, display_fps)
+
+    def frame_displayed(self):
+        """Called by the GUI once an emitted frame has been handed to the views; feeds display pacing."""
+        delay = time.time() - self.last_emit_time
+        self.display_delay += DISPLAY_DELAY_SMOOTHING * (delay - self.display_delay)
+        self.display_pending = False
+
+    def set_display_sizes(self, video_size, heatmap_size):
+        """Sets the (width, height) the video and heatmap views draw frames at."""
+        self.display_sizes = (video_size, heatmap_size)
+
+    @staticmethod
+    def _fit_to_display(frame, size):
+        """Downscales a frame to the size it is drawn at; frames already small enough pass through."""
+        if size is None:
+            return frame
+        width, height = size
+        if width <= 0 or height <= 0 or (width >= frame.shape[1] and height >= frame.shape[0]):
+            return frame
+        return cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+
+    @staticmethod
+    def _to_display_image(frame, size):
+        """
+        Builds the QImage a view draws from a BGR frame, downscaled to the view size.
+        The frame is converted straight into the image's own 32-bit buffer, a layout Qt draws
+        and uploads without conversion, and the image stays valid once the frame is reused.
+        """
+        frame = InferenceThread._fit_to_display(frame, size)
+        h, w = frame.shape[:2]
+        image = QImage(w, h, QImage.Format.Format_RGB32)
+        bits = image.bits()
+        bits.setsize(image.sizeInBytes())
+        # Format_RGB32 is stored as B, G, R, 0xFF bytes, which is exactly OpenCV's BGRA
+        pixels = np.ndarray((h, w, 4), dtype=np.uint8, buffer=bits, strides=(image.bytesPerLine(), 4, 1))
+        cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA, dst=pixels)
+        return image
+
+    def _display_wait(self):
+        """
+        Returns the minimum time between frame emissions. When the GUI takes longer than the
+        target interval to show frames, frames are sent at the rate it actually keeps up with.
+        """
+        return max(self.display_interval, self.display_delay)
+
+    def _build_detection_data(self):
+        """
+        Collects the zone manager state for the frame that was just processed as
+        (vehicle_counts, pedestrian_counts, alert_flags, intersections) arrays.
+        """
+        vehicle_counts, pedestrian_counts, alert_flags = self.zone_manager.get_count_snapshot()
+
+        # Add traffic light information if available
+        intersections = None
+        if (hasattr(self.zone_manager, 'traffic_light_controller') and
+            self.zone_manager.traffic_light_controller):
+            intersections = self.zone_manager.traffic_light_controller.get_intersections_info()
+        return vehicle_counts, pedestrian_counts, alert_flags, intersections
+
+    def _process_batch(self, frames, frame_indices, current_fps):
+        """
+        Runs a batch of frames through the zone manager, emits each result and returns the updated FPS.
+        frame_indices are the frames' 1-based positions in the video, which time the speed estimates.
+        """
+        processing_start_time = time.time()
+        try:
+            with torch.inference_mode():
+                for annotated_frame, heatmap_frame in self.zone_manager.process_batch(frames, frame_indices):
+                    # Detection data is cheap and goes out for every frame
+                    self.detection_data_signal.emit(*self._build_detection_data())
+
+                    # Frames are only sent when the display is due to redraw and has taken the previous one,
+                    # so at most one frame is ever queued for the GUI
+                    now = time.time()
+                    if not self.display_pending and now - self.last_emit_time >= self._display_wait():
+                        self.last_emit_time = now
+                        self.display_pending = True
+                        # Images are scaled to the views and built here, leaving the GUI thread only to draw them
+                        video_size, heatmap_size = self.display_sizes
+                        self.frame_processed_signal.emit(self._to_display_image(annotated_frame, video_size),
+                                                         self._to_display_image(heatmap_frame, heatmap_size),
+                                                         current_fps)
+        except Exception as e:
+            logger.error(f"Error processing frames up to {frame_indices[-1]}: {e}")
+            return current_fps
+
+        # Calculate and update FPS stats, amortizing the batch time over its frames
+        if self.last_frame_time is not None:
+            frame_processing_time = (time.time() - processing_start_time) / len(frames)
+            instant_fps = 1.0 / frame_processing_time if frame_processing_time > 0 else 0
+            self.fps_values.append(instant_fps)
+            if len(self.fps_values) > 30:
+                self.fps_values.pop(0)
+            if self.fps_values:
+                current_fps = sum(self.fps_values) / len(self.fps_values)
+            else:
+                current_fps = 0.0
+
+        self.last_frame_time = processing_start_time
+        return current_fps
+
     def run(self):
         """Main thread execution function for processing video frames."""
         self.is_running = True
+        self.stop_event.clear()
 
         try:
-            self.cap = cv2.VideoCapture(self.video_path)
+            self.cap = open_video_capture(self.video_path, self.inference_settings.get("hw_decode", DEFAULT_HW_DECODE),
+                                          self.decode_backend)
             if not self.cap.isOpened():
                 error_msg = f"Error: Could not open video file: {self.video_path}"
                 logger.error(error_msg)
@@ -52,77 +252,56 @@ class InferenceThread(QThread):
             # Initialize state
             self.zone_manager.reset_heatmap()
             self.last_frame_time = None
+            self.last_emit_time = 0.0
+            self.display_delay = 0.0
+            self.display_pending = False
             self.fps_values = []
 
             # Ensure settings are updated
             if hasattr(self.zone_manager, 'inference_settings'):
                 self.zone_manager.inference_settings = self.inference_settings
 
-            # Get video stride with safe default
+            # Get video stride, batch size and capture buffer length with safe defaults
             vid_stride = max(1, self.inference_settings.get("vid_stride", 1))
+            batch_size = max(1, self.inference_settings.get("batch_size", DEFAULT_BATCH_SIZE))
+            buffer_len = max(1, self.inference_settings.get("camera_buffer_len", DEFAULT_CAMERA_BUFFER_LEN))
+
+            # Decode on a separate thread so capture and inference overlap
+            frame_queue = queue.Queue(maxsize=buffer_len)
+            self.capture_thread = CaptureThread(self.cap, frame_queue, self.stop_event, vid_stride,
+                                                drop_frames=is_live_source(self.video_path))
+            self.capture_thread.start()
 
-            frame_count_total = 0
-            fps_update_interval = 1
-            last_fps_update = time.time()
             current_fps = 0.0
+            frame_buffer = deque(maxlen=batch_size)
+            index_buffer = deque(maxlen=batch_size)
 
-            logger.info(f"Inference started with vid_stride={vid_stride}")
+            logger.info(f"Inference started with vid_stride={vid_stride}, batch_size={batch_size}, "
+                        f"camera_buffer_len={buffer_len}")
 
             while self.is_running:
-                ret, frame = self.cap.read()
-                if not ret:
-                    # End of video
+                try:
+                    item = frame_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+
+                if item is END_OF_STREAM:
+                    # End of video: flush the partially filled batch
+                    if frame_buffer:
+                        current_fps = self._process_batch(list(frame_buffer), list(index_buffer), current_fps)
                     logger.info("End of video reached")
                     self.status_message_signal.emit("End of video reached")
                     break
 
-                frame_count_total += 1
-
-                # Process only every vid_stride frames
-                if (frame_count_total - 1) % vid_stride != 0:
+                frame_index, frame = item
+                frame_buffer.append(frame)
+                index_buffer.append(frame_index)
+                if len(frame_buffer) < batch_size:
                     continue
 
-                processing_start_time = time.time()
-
-                # Process frame and collect detection data
-                try:
-                    annotated_frame, heatmap_frame = self.zone_manager.process_frame(frame)
-
-                    detection_data = {
-                        "vehicle_counts": self.zone_manager.get_vehicle_counts(),
-                        "pedestrian_count": self.zone_manager.get_pedestrian_count(),
-                        "zone_vehicle_counts": self.zone_manager.get_zone_vehicle_counts(),
-                        "zone_pedestrian_counts": self.zone_manager.get_zone_pedestrian_counts(),
-                        "emergency_detected": self.zone_manager.is_emergency_detected(),
-                        "accident_detected": self.zone_manager.is_accident_detected()
-                    }
-
-                    # Add traffic light information if available
-                    if (hasattr(self.zone_manager, 'traffic_light_controller') and
-                        self.zone_manager.traffic_light_controller):
-                        intersections = self.zone_manager.traffic_light_controller.get_intersections_info()
-                        detection_data["intersections"] = intersections
-
-                    # Emit processed frame to main thread, passing the calculated current_fps
-                    self.frame_processed_signal.emit(annotated_frame, heatmap_frame, detection_data, current_fps)
-
-                    # Calculate and update FPS stats
-                    if self.last_frame_time is not None:
-                        frame_processing_time = time.time() - processing_start_time
-                        instant_fps = 1.0 / frame_processing_time if frame_processing_time > 0 else 0
-                        self.fps_values.append(instant_fps)
-                        if len(self.fps_values) > 30:
-                            self.fps_values.pop(0)
-                        if self.fps_values:
-                            current_fps = sum(self.fps_values) / len(self.fps_values)
-                        else:
-                            current_fps = 0.0
-
-                    self.last_frame_time = processing_start_time
-
-                except Exception as e:
-                    logger.error(f"Error processing frame {frame_count_total}: {e}")
-                    continue
+                current_fps = self._process_batch(list(frame_buffer), list(index_buffer), current_fps)
+                frame_buffer.clear()
+                index_buffer.clear()
 
         except Exception as e:
             error_message = f"Error processing video: {str(e)}"
@@ -130,6 +309,12 @@ class InferenceThread(QThread):
             logger.exception("Inference thread exception details")
             self.status_message_signal.emit("Error during inference!")
         finally:
+            # Stop the capture thread before releasing the capture it reads from
+            self.stop_event.set()
+            if self.capture_thread:
+                self.capture_thread.wait()
+                self.capture_thread = None
+
             # Clean up resources
             if self.cap and self.cap.isOpened():
                 self.cap.release()
@@ -1,13 +1,68 @@
+import atexit
 import logging
+import multiprocessing
 import os
 import sys
+import time
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from utils.msgpack_handler import MsgpackFileHandler
+from utils.uring_handler import IoUringFileHandler
+
+LOG_FORMAT_MSGPACK = "msgpack"
+LOG_FORMAT_TEXT = "text"
+
+LOGGER_NAME = "TrafficVision"
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders the asctime string at most once per second.
+    Bursts of records within the same second reuse the cached date portion.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        """Returns the record time, recomputing strftime only when the second changes."""
+        second = int(record.created)
+        cached_second, cached_time = self._time_cache
+        if second != cached_second:
+            cached_time = time.strftime(datefmt or self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, cached_time)
+
+        if datefmt:
+            return cached_time
+        return self.default_msec_format % (cached_time, record.msecs)
+
+class SampledRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that only checks the file size every ROLLOVER_CHECK_INTERVAL
+    records. The file may overshoot maxBytes by at most that many records.
+    """
+    ROLLOVER_CHECK_INTERVAL = 256
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._emit_count = 0
+
+    def shouldRollover(self, record):
+        """Skips the seek/size check for all but one in ROLLOVER_CHECK_INTERVAL records."""
+        self._emit_count = (self._emit_count + 1) % self.ROLLOVER_CHECK_INTERVAL
+        if self._emit_count:
+            return False
+        return super().shouldRollover(record)
 
 class AppLogger:
     """
     Application-wide logger that provides consistent logging across all modules
     with file and console output.
+
+    For multi-process use, the parent creates the logger with ``is_listener=True``
+    and passes ``AppLogger().queue`` to its workers, which create the logger with
+    ``queue=...``. Workers then only enqueue records and the parent's listener is
+    the single writer of the rotating log file.
     """
     _instance = None
 
@@ -17,15 +72,33 @@ class AppLogger:
             cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self, log_level=logging.INFO, log_dir="logs"):
+    def __init__(self, log_level=logging.INFO, log_dir="logs", queue=None, is_listener=False,
+                 use_io_uring=False, log_format=LOG_FORMAT_MSGPACK):
         if self._initialized:
+            self._configure_queue(queue, is_listener)
             return
 
         self._initialized = True
-        self.logger = logging.getLogger("TrafficVision")
+        self.logger = logging.getLogger(LOGGER_NAME)
         self.logger.setLevel(log_level)
         self.log_dir = log_dir
-        self.setup_logger()
+        self.use_io_uring = use_io_uring
+        self.log_format = log_format
+        self.queue = None
+        self.listener = None
+        if queue is None:
+            self.setup_logger()
+        # Replace the list rather than removing in place, so a record being dispatched still reaches the new handlers
+        self.logger.handlers = [handler for handler in self.logger.handlers
+                                if not isinstance(handler, _DeferredSetupHandler)]
+        self._configure_queue(queue, is_listener)
+
+    def _configure_queue(self, queue, is_listener):
+        """Switches to queue-based logging when requested by the caller."""
+        if queue is not None:
+            self.attach_to_queue(queue)
+        elif is_listener:
+            self.start_listener()
 
     def setup_logger(self):
         """Set up logging to file and console."""
@@ -37,12 +110,17 @@ class AppLogger:
                 sys.stderr.write(f"Error creating log directory: {e}\n")
                 return
 
+        # Binary logs need msgpack; fall back to text when it is not installed
+        if self.log_format == LOG_FORMAT_MSGPACK and not MsgpackFileHandler.is_supported():
+            self.log_format = LOG_FORMAT_TEXT
+
         # Log file path with timestamp
         timestamp = datetime.now().strftime("%Y%m%d")
-        log_file = os.path.join(self.log_dir, f"traffic_vision_{timestamp}.log")
+        extension = "mpk" if self.log_format == LOG_FORMAT_MSGPACK else "log"
+        log_file = os.path.join(self.log_dir, f"traffic_vision_{timestamp}.{extension}")
 
         # Create formatters
-        file_formatter = logging.Formatter(
+        file_formatter = CachedTimeFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
         )
         console_formatter = logging.Formatter(
@@ -51,9 +129,7 @@ class AppLogger:
 
         # File handler with rotation (10MB max size, keep 10 backup files)
         try:
-            file_handler = RotatingFileHandler(
-                log_file, maxBytes=10*1024*1024, backupCount=10
-            )
+            file_handler = self._create_file_handler(log_file, maxBytes=10*1024*1024, backupCount=10)
             file_handler.setFormatter(file_formatter)
             self.logger.addHandler(file_handler)
         except Exception as e:
@@ -64,28 +140,88 @@ class AppLogger:
         console_handler.setFormatter(console_formatter)
         self.logger.addHandler(console_handler)
 
+    def _create_file_handler(self, log_file, maxBytes, backupCount):
+        """Returns the msgpack or io_uring handler when selected and supported, else a RotatingFileHandler."""
+        if self.log_format == LOG_FORMAT_MSGPACK:
+            return MsgpackFileHandler(log_file, maxBytes=maxBytes, backupCount=backupCount)
+        if self.use_io_uring and IoUringFileHandler.is_supported():
+            try:
+                return IoUringFileHandler(log_file, maxBytes=maxBytes, backupCount=backupCount)
+            except OSError as e:
+                sys.stderr.write(f"io_uring log handler unavailable, falling back: {e}\n")
+        return SampledRotatingFileHandler(log_file, maxBytes=maxBytes, backupCount=backupCount)
+
+    def _detach_handlers(self):
+        """Removes and returns the handlers currently attached to the logger."""
+        handlers = list(self.logger.handlers)
+        for handler in handlers:
+            self.logger.removeHandler(handler)
+        return handlers
+
+    def start_listener(self):
+        """
+        Moves the file and console handlers behind a QueueListener so that
+        records from this and any child processes are written by a single thread.
+        """
+        if self.listener is not None:
+            return self.queue
+
+        self.queue = multiprocessing.Queue(-1)
+        handlers = self._detach_handlers()
+        self.listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        self.logger.addHandler(QueueHandler(self.queue))
+        atexit.register(self.stop_listener)
+        return self.queue
+
+    def stop_listener(self):
+        """Flushes pending records and stops the queue listener, if running."""
+        if self.listener is None:
+            return
+        self.listener.stop()
+        self.listener = None
+
+    def attach_to_queue(self, queue):
+        """Replaces local handlers with a QueueHandler feeding the parent's listener."""
+        if self.queue is queue:
+            return
+        for handler in self._detach_handlers():
+            handler.close()
+        self.queue = queue
+        self.logger.addHandler(QueueHandler(queue))
+
     def get_logger(self):
         """Returns the logger instance."""
         return self.logger
 
-# Create a global logger instance
-logger = AppLogger().get_logger()
+class _DeferredSetupHandler(logging.Handler):
+    """
+    Placeholder handler that installs the real handlers when the first record is logged.
+    They are appended to the handler list the logger is iterating, so they also receive that record.
+    """
+    def handle(self, record):
+        # Threads logging their first record at the same time must not install the handlers twice
+        with self.lock:
+            AppLogger()
+        return True
 
-# Define convenience methods
-def debug(message):
-    logger.debug(message)
+    def emit(self, record):
+        pass
 
-def info(message):
-    logger.info(message)
+# Only the named logger and a placeholder exist at import; files and handlers wait for the first record
+_logger = logging.getLogger(LOGGER_NAME)
+_logger.setLevel(logging.INFO)
+_logger.addHandler(_DeferredSetupHandler())
 
-def warning(message):
-    logger.warning(message)
+def get_logger():
+    """Returns the application logger; its handlers are installed when the first record is logged."""
+    return _logger
 
-def error(message):
-    logger.error(message)
+logger = _logger
 
-def critical(message):
-    logger.critical(message)
+# Convenience methods are the logger's bound methods, so records report the caller's file and line
+debug, info, warning, error, critical, exception = (
+    _logger.debug, _logger.info, _logger.warning, _logger.error, _logger.critical, _logger.exception
+)
 
-def exception(message):
-    logger.exception(message)
+__all__ = ['get_logger', 'logger', 'debug', 'info', 'warning', 'error', 'critical', 'exception']
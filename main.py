@@ -1,28 +1,67 @@
 import sys
 import os
+import gc
 import time
 import json
-import torch
-import cv2
+import argparse
+import logging
 import subprocess
 from typing import Dict
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout,
                             QHBoxLayout, QLabel, QWidget, QMessageBox,
-                            QTabWidget, QFileDialog, QSizePolicy, QFrame)
-from PyQt6.QtGui import QImage, QPixmap, QIcon
-from PyQt6.QtCore import Qt
+                            QTabWidget, QFileDialog, QFrame)
+from PyQt6.QtGui import QGuiApplication, QIcon
+from PyQt6.QtCore import Qt, QTimer
 
-from inference import InferenceThread
-from manager import ZoneManager
+from model_export import (ModelExportThread, EXPORT_FORMAT_NAMES, get_engine_path, get_export_path,
+                          get_openvino_int8_path, has_calibration_data)
 from utils.constants import *
 from static.styles.styles import get_stylesheet
 from ui.controls import ControlPanel
 from ui.settings import SettingsTab
 from ui.monitoring import MonitoringTab
+from ui.frame_view import FrameView
 from ui.traffic_light import TrafficLightConfigTab
-from db.data_collector import TrafficDataCollector
 from logger import info, error, debug, warning, exception
-from utils.health_monitor import HealthMonitor
+from utils.json_io import load_json_file, save_json_file
+
+# Resolved once at launch so a later working directory change cannot break restarts
+_SCRIPT_PATH = os.path.abspath(sys.argv[0])
+_LAUNCH_ARGV = list(sys.argv[1:])
+
+# Inference device, probed once per process; probing CUDA again on every settings save stalls the GUI
+_DETECTED_DEVICE = None
+
+def _detect_device():
+    """Returns the best available inference device. TV_FORCE_DEVICE overrides the probe."""
+    global _DETECTED_DEVICE
+    if _DETECTED_DEVICE is None:
+        import torch
+
+        forced_device = os.environ.get("TV_FORCE_DEVICE")
+        if forced_device:
+            _DETECTED_DEVICE = forced_device
+            info(f"Inference device forced by TV_FORCE_DEVICE: {forced_device}")
+        elif sys.platform == "darwin":
+            # macOS builds of PyTorch have no CUDA, so only MPS is worth probing
+            if torch.backends.mps.is_available():
+                _DETECTED_DEVICE = DEVICE_MPS
+                info("Apple Silicon MPS acceleration available")
+            else:
+                _DETECTED_DEVICE = DEVICE_CPU
+                info("Using CPU for inference")
+        elif torch.cuda.is_available():
+            _DETECTED_DEVICE = DEVICE_CUDA
+            info(f"CUDA available: {torch.cuda.get_device_name(0)}")
+        else:
+            _DETECTED_DEVICE = DEVICE_CPU
+            info("Using CPU for inference")
+    return _DETECTED_DEVICE
+
+_ASPECT_MODE_MAP = {
+    "KeepAspectRatio": Qt.AspectRatioMode.KeepAspectRatio,
+    "IgnoreAspectRatio": Qt.AspectRatioMode.IgnoreAspectRatio,
+}
 
 class ZoneManagerGUI(QMainWindow):
     """
@@ -30,7 +69,13 @@ class ZoneManagerGUI(QMainWindow):
     Handles GUI interactions, settings, and video processing.
     Includes separate vehicle and pedestrian zones.
     """
+    _DATA_VIEWER_MSG = "The data viewer has been removed. The data is still being collected in the SQLite database."
+
     def __init__(self):
+        # Imported here so argument parsing in main() does not pay for numpy, OpenCV and torch
+        from db.data_collector import TrafficDataCollector
+        from utils.health_monitor import HealthMonitor
+
         super().__init__()
         self.setWindowTitle("Traffic Vision")
 
@@ -60,6 +105,26 @@ class ZoneManagerGUI(QMainWindow):
         self.fps_label = QLabel(" FPS: 0.0 ")
         self.status_bar.addPermanentWidget(self.fps_label)
 
+        # Inference status and FPS updates are applied at most every STATUS_REFRESH_INTERVAL_MS
+        self.pending_status_message = None
+        self.pending_fps = None
+        self.status_refresh_timer = QTimer(self)
+        self.status_refresh_timer.setSingleShot(True)
+        self.status_refresh_timer.setInterval(STATUS_REFRESH_INTERVAL_MS)
+        self.status_refresh_timer.timeout.connect(self._flush_status)
+
+        # Both indicator stylesheets are built once; Red for alert, Green for OK
+        self._health_styles = {
+            alert_active: f"""
+            QFrame {{
+                border: 1px solid gray;
+                border-radius: 7px;
+                background-color: {"#FF0000" if alert_active else "#00FF00"};
+            }}
+        """
+            for alert_active in (False, True)
+        }
+        self._health_alert_active = None
         self.health_status_indicator = QFrame()
         self.health_status_indicator.setFixedSize(15, 15)
         self.health_status_indicator.setToolTip("System Health Status (Green=OK, Red=Alert)")
@@ -67,19 +132,36 @@ class ZoneManagerGUI(QMainWindow):
         self.status_bar.addPermanentWidget(QLabel(" Health: "))
         self.status_bar.addPermanentWidget(self.health_status_indicator)
 
+        self.video_path = None
+        self.export_threads = {}
+        self.pending_int8_exports = {}
+        self.model_loader = None
+        self.pending_model_load = None
+        self.start_inference_pending = False
+        self.settings_save_timer = QTimer(self)
+        self.settings_save_timer.setSingleShot(True)
+        self.settings_save_timer.setInterval(SETTINGS_SAVE_DELAY_MS)
+        self.settings_save_timer.timeout.connect(self.flush_settings)
         self.settings = self.load_settings()
+        self.update_display_settings()
         self.check_initial_configuration()
         self.apply_settings_to_models()
         self.setup_ui()
 
-        self.video_path = None
         self.zone_manager = None
         self.is_inferencing = False
         self.last_update_time = time.time()
-        self.update_interval = 1.0 / 30.0
+        self.update_interval = 1.0 / DEFAULT_DISPLAY_FPS
 
         self.inference_thread = None
 
+        # Frames are never sent faster than the screen can show them
+        self.screen_refresh_rate = None
+        screen = QGuiApplication.primaryScreen()
+        if screen is not None:
+            self.screen_refresh_rate = screen.refreshRate()
+            screen.refreshRateChanged.connect(self._on_refresh_rate_changed)
+
         self.health_monitor = HealthMonitor(check_interval=30.0)
         self.health_monitor.set_alert_callback(self._health_alert_callback)
         self.health_monitor.start_monitoring()
@@ -88,27 +170,32 @@ class ZoneManagerGUI(QMainWindow):
 
     def setup_ui(self):
         """Sets up the user interface of the application."""
-        self.setStyleSheet(get_stylesheet())
+        # Apply the stylesheet after the first paint so the window appears sooner
+        QTimer.singleShot(0, lambda: self.setStyleSheet(get_stylesheet()))
         central_widget = QWidget()
         main_layout = QHBoxLayout()
 
-        tabs = QTabWidget()
+        self.tabs = QTabWidget()
         self.control_panel = ControlPanel(self)
-        tabs.addTab(self.control_panel, "Controls")
+        self.tabs.addTab(self.control_panel, "Controls")
         self.settings_tab = SettingsTab(self)
-        tabs.addTab(self.settings_tab, "Settings")
+        self.tabs.addTab(self.settings_tab, "Settings")
 
         # Add Traffic Light Config tab
         self.traffic_light_tab = TrafficLightConfigTab(self)
-        tabs.addTab(self.traffic_light_tab, "Traffic Lights")
+        self.tabs.addTab(self.traffic_light_tab, "Traffic Lights")
 
         # Add Monitoring tab
         if self.monitoring_tab:
-            tabs.addTab(self.monitoring_tab, "Monitoring")
+            self.tabs.addTab(self.monitoring_tab, "Monitoring")
+
+        # Monitoring widgets are only refreshed while their tab is showing
+        self._monitoring_visible = False
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         displays_layout = self.create_displays_layout()
 
-        main_layout.addWidget(tabs, 0)
+        main_layout.addWidget(self.tabs, 0)
         main_layout.addLayout(displays_layout, 1)
 
         central_widget.setLayout(main_layout)
@@ -126,22 +213,21 @@ class ZoneManagerGUI(QMainWindow):
         video_container.setObjectName("videoDisplay")
         video_layout = QVBoxLayout(video_container)
         video_layout.setContentsMargins(0, 0, 0, 0)
-        self.video_label = QLabel()
-        self.video_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.video_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.video_label.setMinimumSize(320, 240)
+        self.video_label = FrameView()
+        self.video_label.set_aspect_ratio_mode(self.get_aspect_ratio_mode())
         video_layout.addWidget(self.video_label)
 
         heatmap_container = QWidget()
         heatmap_container.setObjectName("heatmapDisplay")
         heatmap_layout = QVBoxLayout(heatmap_container)
         heatmap_layout.setContentsMargins(0, 0, 0, 0)
-        self.heatmap_label = QLabel()
-        self.heatmap_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.heatmap_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.heatmap_label.setMinimumSize(320, 240)
+        self.heatmap_label = FrameView()
+        self.heatmap_label.set_aspect_ratio_mode(self.get_aspect_ratio_mode())
         heatmap_layout.addWidget(self.heatmap_label)
 
+        self.video_label.display_size_changed.connect(self.update_inference_display_sizes)
+        self.heatmap_label.display_size_changed.connect(self.update_inference_display_sizes)
+
         # Set layout stretch factors to maintain equal height ratio (1:1)
         displays_layout.addWidget(video_container, 1)
         displays_layout.addWidget(heatmap_container, 1)
@@ -162,11 +248,8 @@ class ZoneManagerGUI(QMainWindow):
         default_settings = self.get_default_settings()
         try:
             if os.path.exists(SETTINGS_FILE):
-                with open(SETTINGS_FILE, 'r') as f:
-                    settings = json.load(f)
-                    full_settings = default_settings.copy()
-                    full_settings.update(settings)
-                    return self.ensure_settings_compatibility(full_settings, default_settings)
+                settings = load_json_file(SETTINGS_FILE)
+                return self.ensure_settings_compatibility(settings, default_settings)
             else:
                 return default_settings
         except json.JSONDecodeError as e:
@@ -184,7 +267,8 @@ class ZoneManagerGUI(QMainWindow):
             "model_paths": {
                 MODEL_TYPE_ZONE: "",
                 MODEL_TYPE_EMERGENCY: "",
-                MODEL_TYPE_ACCIDENT: ""
+                MODEL_TYPE_ACCIDENT: "",
+                MODEL_TYPE_FUSED: ""
             },
             "inference_settings": {
                 MODEL_TYPE_ZONE: {
@@ -204,7 +288,24 @@ class ZoneManagerGUI(QMainWindow):
                 "agnostic_nms": DEFAULT_AGNOSTIC_NMS,
                 "max_det": DEFAULT_MAX_DETECTIONS,
                 "vid_stride": DEFAULT_VIDEO_STRIDE,
-                "stream_buffer": DEFAULT_STREAM_BUFFER
+                "stream_buffer": DEFAULT_STREAM_BUFFER,
+                "batch_size": DEFAULT_BATCH_SIZE,
+                "camera_buffer_len": DEFAULT_CAMERA_BUFFER_LEN,
+                "hw_decode": DEFAULT_HW_DECODE,
+                "decode_backend": DEFAULT_DECODE_BACKEND,
+                "tensorrt_export": DEFAULT_TENSORRT_EXPORT,
+                "tensorrt_int8": DEFAULT_TENSORRT_INT8,
+                "int8_calibration_data": DEFAULT_INT8_CALIBRATION_DATA,
+                "tensorrt_workspace": DEFAULT_TENSORRT_WORKSPACE,
+                "onnx_export": DEFAULT_ONNX_EXPORT,
+                "jit_compile": DEFAULT_JIT_COMPILE,
+                "torch_compile": DEFAULT_TORCH_COMPILE,
+                "quantize_int8": DEFAULT_QUANTIZE_INT8,
+                "fused_class_map": {
+                    MODEL_TYPE_ZONE: [],
+                    MODEL_TYPE_EMERGENCY: [],
+                    MODEL_TYPE_ACCIDENT: []
+                }
             },
             "heatmap_settings": {
                 "kernel_sigma": DEFAULT_KERNEL_SIGMA,
@@ -214,7 +315,8 @@ class ZoneManagerGUI(QMainWindow):
                 "heatmap_decay": DEFAULT_HEATMAP_DECAY
             },
             "display_settings": {
-                "aspect_ratio_mode": DEFAULT_ASPECT_RATIO_MODE
+                "aspect_ratio_mode": DEFAULT_ASPECT_RATIO_MODE,
+                "display_fps": DEFAULT_DISPLAY_FPS
             },
             "telegram_settings": {
                 TELEGRAM_ENABLED_KEY: TELEGRAM_ENABLED_DEFAULT,
@@ -224,19 +326,34 @@ class ZoneManagerGUI(QMainWindow):
         }
 
     def ensure_settings_compatibility(self, loaded_settings: Dict, default_settings: Dict) -> Dict:
-        """Ensures backward compatibility of settings by adding missing keys from default settings."""
-        full_settings = default_settings.copy()
-
-        # Recursive function to deeply update nested dictionaries
-        def deep_update(target, source):
-            for key, value in source.items():
-                if key in target and isinstance(value, dict) and isinstance(target[key], dict):
-                    deep_update(target[key], value)
-                else:
+        """
+        Merges loaded settings over the defaults in a single pass. Loaded values replace
+        defaults when their types agree; keys unknown to the defaults are kept as loaded.
+        """
+        full_settings = {}
+        pending = [(full_settings, default_settings, loaded_settings)]
+        while pending:
+            target, defaults, loaded = pending.pop()
+            for key, default_value in defaults.items():
+                if key not in loaded:
+                    target[key] = default_value
+                    continue
+
+                value = loaded[key]
+                if isinstance(default_value, dict):
+                    if isinstance(value, dict):
+                        target[key] = {}
+                        pending.append((target[key], default_value, value))
+                    else:
+                        target[key] = default_value
+                elif (isinstance(value, type(default_value))
+                      or (isinstance(value, (int, float)) and isinstance(default_value, (int, float)))):
                     target[key] = value
+                else:
+                    target[key] = default_value
 
-        # Deep update with loaded settings
-        deep_update(full_settings, loaded_settings)
+            for key in loaded.keys() - defaults.keys():
+                target[key] = loaded[key]
 
         # Ensure vid_stride is valid
         vid_stride = full_settings["inference_settings"].get("vid_stride", DEFAULT_VIDEO_STRIDE)
@@ -247,10 +364,17 @@ class ZoneManagerGUI(QMainWindow):
         return full_settings
 
     def save_settings(self):
-        """Saves current settings to settings.json."""
+        """
+        Schedules a save of the current settings to settings.json.
+        Saves requested in quick succession are coalesced into a single write.
+        """
+        self.settings_save_timer.start()
+
+    def flush_settings(self):
+        """Writes the current settings to settings.json now."""
+        self.settings_save_timer.stop()
         try:
-            with open(SETTINGS_FILE, 'w') as f:
-                json.dump(self.settings, f, indent=4)
+            save_json_file(self.settings, SETTINGS_FILE)
             info("Settings saved successfully")
         except Exception as e:
             QMessageBox.critical(self, "Settings Error", f"Failed to save settings. Error: {e}")
@@ -285,85 +409,353 @@ class ZoneManagerGUI(QMainWindow):
 
     def apply_settings_to_models(self):
         """Loads models based on paths from settings.json, supporting multiple formats."""
-        model_paths = self.settings.get("model_paths", {})
+        import torch
+        from utils.preprocess import FramePreprocessor, PinnedFramePreprocessor
+
+        # The configured paths stay the source weights; cached exports are substituted for this load only
+        model_paths = dict(self.settings.get("model_paths", {}))
 
         # Determine the optimal device for inference
-        if torch.cuda.is_available():
-            inference_device = "cuda"
-            info(f"CUDA available: {torch.cuda.get_device_name(0)}")
-        elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-            inference_device = "mps"
-            info("Apple Silicon MPS acceleration available")
-        else:
-            inference_device = "cpu"
-            info("Using CPU for inference")
+        inference_device = _detect_device()
 
         info(f"Using device for inference: {inference_device}")
+        self.inference_device = inference_device
+
+        # Input shapes are fixed by imgsz, so let cuDNN pick the fastest kernels once
+        if inference_device == DEVICE_CUDA:
+            torch.backends.cudnn.benchmark = True
+            torch.set_float32_matmul_precision('high')
+
+        # Letterbox each batch once for all three models; on CUDA, stage frames in pinned memory
+        # so host-to-device copies run asynchronously
+        inference_settings = self.settings["inference_settings"]
+        preprocessor_class = PinnedFramePreprocessor if inference_device == DEVICE_CUDA else FramePreprocessor
+        self.frame_preprocessor = preprocessor_class(
+            batch_size=inference_settings.get("batch_size", DEFAULT_BATCH_SIZE),
+            imgsz=inference_settings["imgsz"],
+            device=inference_device
+        )
+
+        # On CUDA, give each model its own stream so the three detectors can overlap
+        self.cuda_streams = None
+        if inference_device == DEVICE_CUDA:
+            self.cuda_streams = {
+                model_type: torch.cuda.Stream()
+                for model_type in (MODEL_TYPE_ZONE, MODEL_TYPE_EMERGENCY, MODEL_TYPE_ACCIDENT)
+            }
+
+        # On CUDA, prefer cached TensorRT engines and export missing ones in the background
+        if inference_device == DEVICE_CUDA:
+            for model_type in list(model_paths):
+                model_paths[model_type] = self.resolve_tensorrt_model_path(model_type, model_paths[model_type])
+        # On CPU and MPS, prefer cached ONNX or TorchScript exports over the eager PyTorch model
+        else:
+            export_format = self.get_cached_export_format(inference_device)
+            if export_format:
+                for model_type in list(model_paths):
+                    model_paths[model_type] = self.resolve_cached_export_path(
+                        model_type, model_paths[model_type], export_format)
 
         # Reset models first
         self.zone_model = None
         self.emergency_model = None
         self.accident_model = None
 
-        # Load all models with status reporting
-        self.zone_model = self.load_model_with_status(model_paths[MODEL_TYPE_ZONE], "zone", inference_device)
-        self.emergency_model = self.load_model_with_status(model_paths[MODEL_TYPE_EMERGENCY], "emergency", inference_device)
-        self.accident_model = self.load_model_with_status(model_paths[MODEL_TYPE_ACCIDENT], "accident", inference_device)
-
-        # Update ZoneManager with new models if it exists
+        # Update ZoneManager with new settings if it exists; models are handed over as they load
         if hasattr(self, 'zone_manager') and self.zone_manager:
-            self.zone_manager.zone_model = self.zone_model
-            self.zone_manager.emergency_model = self.emergency_model
-            self.zone_manager.accident_model = self.accident_model
             self.zone_manager.inference_settings = self.settings["inference_settings"]
             self.zone_manager.heatmap_settings = self.settings["heatmap_settings"]
+            self.zone_manager.preprocessor = self.frame_preprocessor
+            self.zone_manager.cuda_streams = self.cuda_streams
+            self.zone_manager.set_heatmap_device(self._get_heatmap_device())
+
+        self.start_model_loader(model_paths, inference_device)
+
+    def start_model_loader(self, model_paths, device, supersede=True):
+        """
+        Loads and warms up the models on a worker thread so the window stays responsive.
+        model_paths may cover only some models; the others stay as they are.
+        """
+        if self.model_loader and self.model_loader.isRunning():
+            # A newer full load supersedes the one in flight: that one stops after its current model
+            # and its models are no longer assigned. Partial loads wait for it to finish instead.
+            if supersede and not self.model_loader.isInterruptionRequested():
+                self.model_loader.model_loaded.disconnect(self.assign_model)
+                self.model_loader.requestInterruption()
+            # Queued loads are merged, so a queued swap is not lost to a later one; both start from all_done
+            queued_paths = {}
+            if self.pending_model_load is not None and self.pending_model_load[1] == device:
+                queued_paths = dict(self.pending_model_load[0])
+            queued_paths.update(model_paths)
+            self.pending_model_load = (queued_paths, device)
+            return
+
+        self._create_model_loader(model_paths, device)
+
+    def _create_model_loader(self, model_paths, device):
+        """Starts a model loader worker for the given paths."""
+        from model_loader import ModelLoaderWorker
+
+        # A previous worker has at most its final signal left to return from
+        if self.model_loader:
+            self.model_loader.wait()
+
+        self.model_loader = ModelLoaderWorker(model_paths, device, self.create_model, self.warmup_model)
+        self.model_loader.model_loaded.connect(self.assign_model)
+        self.model_loader.model_failed.connect(self.on_model_load_failed)
+        self.model_loader.status_message_signal.connect(lambda msg: self.status_bar.showMessage(msg, 0))
+        self.model_loader.all_done.connect(self.on_models_loaded)
+        self.model_loader.start()
+
+    def assign_model(self, model_type, model):
+        """Makes a loaded model the active one for its role, in the window and the zone manager."""
+        # A fused model stands in for all three models
+        if model_type == MODEL_TYPE_FUSED:
+            target_types = (MODEL_TYPE_ZONE, MODEL_TYPE_EMERGENCY, MODEL_TYPE_ACCIDENT)
+        else:
+            target_types = (model_type,)
+        for target_type in target_types:
+            setattr(self, target_type, model)
+            if getattr(self, 'zone_manager', None):
+                setattr(self.zone_manager, target_type, model)
+
+    def on_model_load_failed(self, model_type, model_path, message):
+        """Reports a model that could not be loaded."""
+        label = model_type.replace("_model", "")
+        QMessageBox.critical(self, "Model Load Error", f"Failed to load model {model_path}: {message}")
+        self.status_bar.showMessage(f"Failed to load {label} model", 3000)
+
+    def on_models_loaded(self):
+        """Reports the load result and starts inference if it was requested while loading."""
+        # A superseded load finished; start the queued one before reporting anything
+        if self.pending_model_load is not None:
+            model_paths, device = self.pending_model_load
+            self.pending_model_load = None
+            self._create_model_loader(model_paths, device)
+            return
 
         models_loaded = any([self.zone_model, self.emergency_model, self.accident_model])
         status_msg = "Models loaded successfully" if models_loaded else "No models loaded - please check settings"
         self.status_bar.showMessage(status_msg, 3000)
 
-    def load_model_with_status(self, model_path, model_type, inference_device):
-        """Loads a model with status reporting."""
-        if model_path and os.path.exists(model_path):
-            self.status_bar.showMessage(f"Loading {model_type} model...", 0)
-            model = self.load_model(model_path, inference_device)
-            if not model:
-                self.status_bar.showMessage(f"Failed to load {model_type} model", 3000)
-            return model
-        elif model_path:
-            self.status_bar.showMessage(f"{model_type.capitalize()} model path not found: {model_path}", 3000)
-            warning(f"{model_type.capitalize()} model path not found: {model_path}")
-        else:
-            debug(f"{model_type.capitalize()} model path not set")
-        return None
+        if self.start_inference_pending:
+            self.start_inference_pending = False
+            self.start_inference()
 
-    def load_model(self, model_path, device):
+    def resolve_tensorrt_model_path(self, model_type, model_path):
         """
-        Loads a model based on its file extension.
+        Returns the cached TensorRT engine for PyTorch weights if one exists.
+        Otherwise starts a background export and returns the original path.
         """
-        if not model_path:
+        inference_settings = self.settings["inference_settings"]
+        if (not model_path or not os.path.exists(model_path)
+                or not inference_settings.get("tensorrt_export", DEFAULT_TENSORRT_EXPORT)
+                or os.path.splitext(model_path)[1].lower() not in MODEL_FORMAT_INFO[MODEL_FORMAT_PYTORCH]["extensions"]):
+            return model_path
+
+        # INT8 without a calibration set is deferred until a video is available to sample from
+        calibrate_from_video = (inference_settings.get("tensorrt_int8", DEFAULT_TENSORRT_INT8)
+                                and not has_calibration_data(inference_settings))
+        engine_path = self.get_export_target_path(model_path, EXPORT_FORMAT_ENGINE)
+        if os.path.exists(engine_path):
+            info(f"Using cached TensorRT engine: {engine_path}")
+            return engine_path
+
+        if calibrate_from_video and not self.video_path:
+            self.pending_int8_exports[model_type] = (model_path, EXPORT_FORMAT_ENGINE)
+            return model_path
+
+        self.start_tensorrt_export(model_type, model_path, calibration_video=self.video_path if calibrate_from_video else None)
+        return model_path
+
+    def get_export_target_path(self, model_path, export_format):
+        """
+        Returns the cache path an export of the given weights has under the current settings.
+        Keys match ModelExportThread, so a changed precision, image size or batch size selects a new export.
+        """
+        inference_settings = self.settings["inference_settings"]
+        imgsz = inference_settings["imgsz"]
+        batch = inference_settings.get("batch_size", DEFAULT_BATCH_SIZE)
+        if export_format == EXPORT_FORMAT_OPENVINO:
+            return get_openvino_int8_path(model_path, imgsz, batch)
+        if export_format != EXPORT_FORMAT_ENGINE:
+            return get_export_path(model_path, imgsz, batch, export_format)
+        # INT8 without a calibration set is calibrated on the video later, so INT8 is still the target
+        if inference_settings.get("tensorrt_int8", DEFAULT_TENSORRT_INT8):
+            return get_engine_path(model_path, imgsz, batch, int8=True, half=False)
+        return get_engine_path(model_path, imgsz, batch, half=inference_settings.get("half", True))
+
+    def get_active_export_format(self):
+        """Returns the export format models are run as on the current device, or None for plain PyTorch."""
+        if self.inference_device == DEVICE_CUDA:
+            if self.settings["inference_settings"].get("tensorrt_export", DEFAULT_TENSORRT_EXPORT):
+                return EXPORT_FORMAT_ENGINE
             return None
+        return self.get_cached_export_format(self.inference_device)
+
+    def get_cached_export_format(self, device):
+        """
+        Returns the export format to run PyTorch weights as on a non-CUDA device, or None.
+        On CPU, INT8 OpenVINO comes first when quantization is enabled, then ONNX Runtime;
+        TorchScript is used on MPS or when neither is enabled.
+        """
+        inference_settings = self.settings["inference_settings"]
+        if device == DEVICE_CPU and inference_settings.get("quantize_int8", DEFAULT_QUANTIZE_INT8):
+            return EXPORT_FORMAT_OPENVINO
+        if device == DEVICE_CPU and inference_settings.get("onnx_export", DEFAULT_ONNX_EXPORT):
+            return EXPORT_FORMAT_ONNX
+        if inference_settings.get("jit_compile", DEFAULT_JIT_COMPILE):
+            return EXPORT_FORMAT_TORCHSCRIPT
+        return None
+
+    def resolve_cached_export_path(self, model_type, model_path, export_format):
+        """
+        Returns the cached ONNX, TorchScript or INT8 OpenVINO export of PyTorch weights if one exists.
+        Otherwise starts a background export and returns the original path.
+        """
+        if (not model_path or not os.path.exists(model_path)
+                or os.path.splitext(model_path)[1].lower() not in MODEL_FORMAT_INFO[MODEL_FORMAT_PYTORCH]["extensions"]):
+            return model_path
+
+        inference_settings = self.settings["inference_settings"]
+        quantized = export_format == EXPORT_FORMAT_OPENVINO
+        export_path = self.get_export_target_path(model_path, export_format)
+        if os.path.exists(export_path):
+            info(f"Using cached {EXPORT_FORMAT_NAMES[export_format]} model: {export_path}")
+            return export_path
+
+        # Like TensorRT INT8, quantization without a calibration set waits for a video to sample from
+        calibrate_from_video = quantized and not has_calibration_data(inference_settings)
+        if calibrate_from_video and not self.video_path:
+            self.pending_int8_exports[model_type] = (model_path, export_format)
+            return model_path
+
+        self.start_tensorrt_export(model_type, model_path, export_format=export_format,
+                                   calibration_video=self.video_path if calibrate_from_video else None)
+        return model_path
+
+    def start_pending_int8_exports(self):
+        """Starts INT8 exports that were waiting for a video to calibrate on."""
+        if not self.video_path:
+            return
+        for model_type, (model_path, export_format) in list(self.pending_int8_exports.items()):
+            self.start_tensorrt_export(model_type, model_path, calibration_video=self.video_path,
+                                       export_format=export_format)
+        self.pending_int8_exports.clear()
+
+    def start_tensorrt_export(self, model_type, model_path, calibration_video=None,
+                              export_format=EXPORT_FORMAT_ENGINE):
+        """Exports a model to TensorRT, or to ONNX or TorchScript when requested, in a background thread."""
+        if model_type in self.export_threads:
+            return
+
+        export_thread = ModelExportThread(model_type, model_path, self.settings["inference_settings"],
+                                          calibration_video=calibration_video, export_format=export_format)
+        export_thread.export_finished_signal.connect(self.on_tensorrt_export_finished)
+        export_thread.export_failed_signal.connect(self.on_tensorrt_export_failed)
+        export_thread.status_message_signal.connect(self.status_bar.showMessage)
+        export_thread.finished.connect(lambda: self.export_threads.pop(model_type, None))
+        self.export_threads[model_type] = export_thread
+        export_thread.start()
+
+    def on_tensorrt_export_finished(self, model_type, engine_path):
+        """
+        Swaps the running model for the exported one. The export stays cached next to the weights
+        and is picked up on later loads, while the configured path keeps pointing at the weights.
+        """
+        # Settings or the device may have changed during the export; only load what they still select
+        source_path = self.settings["model_paths"].get(model_type)
+        export_format = self.get_active_export_format()
+        if (not source_path or export_format is None
+                or engine_path != self.get_export_target_path(source_path, export_format)):
+            info(f"Exported model no longer matches the current settings, not loading it: {engine_path}")
+            return
+
+        # Deserializing and warming up an engine takes seconds, so it runs on the loader thread like any other load
+        self.status_bar.showMessage(f"Loading exported model: {os.path.basename(engine_path)}", 5000)
+        self.start_model_loader({model_type: engine_path}, self.inference_device, supersede=False)
+
+    def on_tensorrt_export_failed(self, model_type, message):
+        """Keeps the PyTorch model in use when the export fails."""
+        self.status_bar.showMessage(f"Model export failed for {model_type}, using PyTorch model", 5000)
+        warning(f"Model export failed for {model_type}: {message}")
+
+    def create_model(self, model_path, device):
+        """
+        Loads a model based on its file extension; errors propagate to the caller.
+        """
+        from ultralytics import YOLO
+        model = YOLO(model_path, task="detect")
+
+        # Apply device settings based on format
+        if os.path.splitext(model_path)[1].lower() in ['.pt', '.pth']:
+            model.to(device)
+            self.optimize_pytorch_model(model, device)
+
+        return model
+
+    def optimize_pytorch_model(self, model, device):
+        """
+        Freezes the parameters, fuses Conv+BN layers and, on CUDA, converts the weights to FP16 channels-last
+        when half precision is enabled, then compiles the network with torch.compile if enabled.
+        """
+        import torch
+
+        # Nothing here trains, so parameters never need autograd bookkeeping
+        model.model.eval()
+        model.model.requires_grad_(False)
 
         try:
-            from ultralytics import YOLO
-            model = YOLO(model_path, task="detect")
+            model.fuse()
+        except Exception as e:
+            debug(f"Model fusion skipped: {e}")
+
+        # Converted once here so tensor-core kernels run without per-frame weight casts
+        if device == DEVICE_CUDA and self.settings["inference_settings"].get("half", DEFAULT_HALF_PRECISION):
+            model.model.half()
+            model.model.to(memory_format=torch.channels_last)
+
+        # Shapes are fixed by imgsz and batch size, so a static graph lets inductor use CUDA graphs
+        if (device == DEVICE_CUDA and hasattr(torch, "compile")
+                and self.settings["inference_settings"].get("torch_compile", DEFAULT_TORCH_COMPILE)):
+            try:
+                model.model = torch.compile(model.model, mode="reduce-overhead", fullgraph=False, dynamic=False)
+            except Exception as e:
+                warning(f"torch.compile unavailable, running the model eagerly: {e}")
 
-            # Apply device settings based on format
-            if os.path.splitext(model_path)[1].lower() in ['.pt', '.pth']:
-                model.to(device)
+    def warmup_model(self, model, device):
+        """
+        Runs two dummy batches through a freshly loaded model at the configured imgsz and batch size,
+        so cuDNN autotuning, compilation and engine setup are done before the first video frame.
+        """
+        import numpy as np
+        import torch
+
+        inference_settings = self.settings["inference_settings"]
+        imgsz = inference_settings["imgsz"]
+        batch_size = inference_settings.get("batch_size", DEFAULT_BATCH_SIZE)
+        if device == DEVICE_CUDA:
+            # Same shape and layout as the pinned preprocessor's batches, so tuned kernels and graphs are reused
+            dummy = torch.zeros((batch_size, 3, imgsz, imgsz), device=device).contiguous(memory_format=torch.channels_last)
+        else:
+            dummy = [np.zeros((imgsz, imgsz, 3), dtype=np.uint8)] * batch_size
 
-            return model
+        try:
+            with torch.inference_mode():
+                # The first pass selects kernels and records graphs, the second runs on them
+                for _ in range(2):
+                    model(dummy, imgsz=imgsz, device=device, half=inference_settings.get("half", DEFAULT_HALF_PRECISION),
+                          verbose=False)
+            if device == DEVICE_CUDA:
+                torch.cuda.synchronize()
         except Exception as e:
-            QMessageBox.critical(self, "Model Load Error", f"Failed to load model {model_path}: {str(e)}")
-            error(f"Error loading model {model_path}: {str(e)}")
-            exception("Model loading exception")
-            return None
+            warning(f"Model warm-up failed: {e}")
 
     def browse_model_path(self, line_edit, setting_key):
         """Opens a file dialog to browse for model files with extended format support."""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Select Model File", "",
-            "Model Files (*.pt *.pth *.onnx *.engine *.mlpackage);;PyTorch Models (*.pt *.pth);;ONNX Models (*.onnx);;TensorRT Engines (*.engine);;CoreML Models (*.mlpackage);;All Files (*)"
+            "Model Files (*.pt *.pth *.onnx *.engine *.mlpackage *.torchscript);;PyTorch Models (*.pt *.pth);;ONNX Models (*.onnx);;TensorRT Engines (*.engine);;CoreML Models (*.mlpackage);;TorchScript Models (*.torchscript);;All Files (*)"
         )
         if file_path:
             line_edit.setText(file_path)
@@ -388,7 +780,28 @@ class ZoneManagerGUI(QMainWindow):
             self.status_bar.showMessage(f"Video selected: {filename}", 3000)
             info(f"Video selected: {filename}")
 
-            # Create Zone Manager with current settings
+            # Calibrate any deferred INT8 engines on the newly selected footage
+            self.start_pending_int8_exports()
+
+            # Create or reconfigure the Zone Manager with current settings
+            self._ensure_zone_manager()
+
+            # Set up inference thread
+            if self.inference_thread is None:
+                self._create_inference_thread()
+            else:
+                self.inference_thread.zone_manager = self.zone_manager
+                self.inference_thread.video_path = self.video_path
+
+        else:
+            self.status_bar.showMessage("Video selection cancelled", 3000)
+            debug("Video selection cancelled by user")
+
+    def _ensure_zone_manager(self):
+        """Creates the Zone Manager on first use and reconfigures it in place afterwards."""
+        from manager import ZoneManager
+
+        if self.zone_manager is None:
             self.zone_manager = ZoneManager(
                 frame_width=-1,
                 frame_height=-1,
@@ -397,17 +810,44 @@ class ZoneManagerGUI(QMainWindow):
                 emergency_model=self.emergency_model,
                 accident_model=self.accident_model,
                 inference_settings=self.settings["inference_settings"],
-                heatmap_settings=self.settings["heatmap_settings"]
+                heatmap_settings=self.settings["heatmap_settings"],
+                preprocessor=self.frame_preprocessor,
+                cuda_streams=self.cuda_streams,
+                heatmap_device=self._get_heatmap_device()
+            )
+        else:
+            self.zone_manager.reconfigure(
+                video_path=self.video_path,
+                zone_model=self.zone_model,
+                emergency_model=self.emergency_model,
+                accident_model=self.accident_model,
+                inference_settings=self.settings["inference_settings"],
+                heatmap_settings=self.settings["heatmap_settings"],
+                preprocessor=self.frame_preprocessor,
+                cuda_streams=self.cuda_streams,
+                heatmap_device=self._get_heatmap_device()
             )
 
-            # Set up inference thread
-            self.inference_thread = InferenceThread(self.zone_manager, self.video_path, self.settings["inference_settings"])
-            self.inference_thread.frame_processed_signal.connect(self.update_displays_from_thread)
-            self.inference_thread.status_message_signal.connect(self.status_bar.showMessage)
+    def _get_heatmap_device(self):
+        """Returns the device the heatmap accumulates on; only CUDA has a GPU heatmap path."""
+        return DEVICE_CUDA if self.inference_device == DEVICE_CUDA else DEVICE_CPU
 
-        else:
-            self.status_bar.showMessage("Video selection cancelled", 3000)
-            debug("Video selection cancelled by user")
+    def _create_inference_thread(self):
+        """Creates the inference thread and connects its signals."""
+        from inference import InferenceThread
+
+        # NVDEC decoding only helps when the GPU is already in use for inference
+        decode_backend = DECODE_BACKEND_OPENCV
+        if self.inference_device == DEVICE_CUDA:
+            decode_backend = self.settings["inference_settings"].get("decode_backend", DEFAULT_DECODE_BACKEND)
+
+        self.inference_thread = InferenceThread(self.zone_manager, self.video_path, self.settings["inference_settings"],
+                                                decode_backend=decode_backend)
+        self.inference_thread.set_display_fps(self.get_display_fps())
+        self.update_inference_display_sizes()
+        self.inference_thread.frame_processed_signal.connect(self.update_displays_from_thread)
+        self.inference_thread.detection_data_signal.connect(self.update_detection_data)
+        self.inference_thread.status_message_signal.connect(self.queue_status_message)
 
     def start_create_vehicle_zones(self):
         """Starts vehicle zone creation, disabling UI elements."""
@@ -437,17 +877,7 @@ class ZoneManagerGUI(QMainWindow):
         info(f"Starting creation of {num_zones} {zone_type} zones")
 
         try:
-            if self.zone_manager is None:
-                self.zone_manager = ZoneManager(
-                    frame_width=-1,
-                    frame_height=-1,
-                    video_path=self.video_path,
-                    zone_model=self.zone_model,
-                    emergency_model=self.emergency_model,
-                    accident_model=self.accident_model,
-                    inference_settings=self.settings["inference_settings"],
-                    heatmap_settings=self.settings["heatmap_settings"]
-                )
+            self._ensure_zone_manager()
             self.zone_manager.create_zones_interactive(
                 num_zones,
                 zone_type=zone_type,
@@ -526,16 +956,7 @@ class ZoneManagerGUI(QMainWindow):
             try:
                 self.status_bar.showMessage("Loading zones...", 0)
                 info(f"Loading zones from {file_path}")
-                self.zone_manager = ZoneManager(
-                    frame_width=-1,
-                    frame_height=-1,
-                    video_path=self.video_path,
-                    zone_model=self.zone_model,
-                    emergency_model=self.emergency_model,
-                    accident_model=self.accident_model,
-                    inference_settings=self.settings["inference_settings"],
-                    heatmap_settings=self.settings["heatmap_settings"]
-                )
+                self._ensure_zone_manager()
                 success = self.zone_manager.load_zones(file_path)
                 if success:
                     self.control_panel.start_inference_btn.setEnabled(True)
@@ -575,12 +996,15 @@ class ZoneManagerGUI(QMainWindow):
             self.status_bar.showMessage("Error: No zones defined for inference", 3000)
             warning("Inference attempted without zones defined")
             return
+        if self.model_loader and self.model_loader.isRunning():
+            # Started once the models are ready
+            self.start_inference_pending = True
+            self.status_bar.showMessage("Waiting for models to finish loading...", 0)
+            return
 
         # Always make sure we have an updated inference thread
         if not self.inference_thread:
-            self.inference_thread = InferenceThread(self.zone_manager, self.video_path, self.settings["inference_settings"])
-            self.inference_thread.frame_processed_signal.connect(self.update_displays_from_thread)
-            self.inference_thread.status_message_signal.connect(self.status_bar.showMessage)
+            self._create_inference_thread()
         else:
             # Update inference thread with latest settings
             self.inference_thread.zone_manager = self.zone_manager
@@ -670,86 +1094,127 @@ class ZoneManagerGUI(QMainWindow):
         self.inference_status_label.setText(" Status: Stopped ")
         info("Inference stopped successfully")
 
-    def update_displays_from_thread(self, annotated_frame, heatmap_frame, detection_data, fps):
-        """Updates video and heatmap display labels with processed frames, throttled, and updates FPS."""
-        current_time = time.time()
-        if current_time - self.last_update_time >= self.update_interval:
-            self.update_display_labels(annotated_frame, heatmap_frame)
-
-            # Update FPS label
-            self.fps_label.setText(f" FPS: {fps:.1f} ")
-
-            # Update zone-specific counts and alerts in monitoring tab
-            if self.monitoring_tab:
-                # Update zone-specific counts
-                self.monitoring_tab.update_zone_vehicle_counts(
-                    detection_data.get("zone_vehicle_counts", {})
-                )
-                self.monitoring_tab.update_zone_pedestrian_counts(
-                    detection_data.get("zone_pedestrian_counts", {})
-                )
-
-                # Update alert indicators
-                self.monitoring_tab.set_emergency_detected(
-                    detection_data.get("emergency_detected", False)
-                )
-                self.monitoring_tab.set_accident_detected(
-                    detection_data.get("accident_detected", False)
-                )
-
-                # Update traffic light status if available
-                if "intersections" in detection_data:
-                    self.monitoring_tab.update_traffic_light_status(
-                        detection_data.get("intersections", {})
-                    )
-                    # Enable traffic light toggle button if traffic lights are configured
-                    has_traffic_lights = bool(detection_data.get("intersections", {}))
-                    if has_traffic_lights:
-                        self.control_panel.enable_traffic_light_controls(True)
-
-            self.last_update_time = current_time
-
-    def update_display_labels(self, annotated_frame, heatmap_frame):
-        """Updates video and heatmap display labels with processed frames."""
-        video_pixmap = self.convert_cv_frame_to_pixmap(annotated_frame)
-        heatmap_pixmap = self.convert_cv_frame_to_pixmap(heatmap_frame)
-        aspect_ratio_mode = self.get_aspect_ratio_mode()
-        video_container_size = self.video_label.size()
-        heatmap_container_size = self.heatmap_label.size()
-
-        scaled_video_pixmap = video_pixmap.scaled(
-            video_container_size.width(),
-            video_container_size.height(),
-            aspect_ratio_mode,
-            Qt.TransformationMode.SmoothTransformation
-        )
+    def update_displays_from_thread(self, annotated_image, heatmap_image, fps):
+        """
+        Updates video and heatmap display labels. The inference thread paces this to the display rate,
+        using the acknowledgement sent from here to slow down when the GUI falls behind.
+        """
+        try:
+            self.update_display_labels(annotated_image, heatmap_image)
+        finally:
+            # Always acknowledge, or the inference thread would stop sending frames
+            if self.inference_thread:
+                self.inference_thread.frame_displayed()
+
+        # Update FPS label
+        self.pending_fps = fps
+        self._schedule_status_refresh()
+
+    def queue_status_message(self, message):
+        """Shows a status message from the inference thread, coalescing bursts of messages."""
+        self.pending_status_message = message
+        self._schedule_status_refresh()
+
+    def _schedule_status_refresh(self):
+        """Applies pending status updates now if none were applied recently, otherwise when the timer fires."""
+        if not self.status_refresh_timer.isActive():
+            self._flush_status()
+
+    def _flush_status(self):
+        """Applies the latest pending status message and FPS value, then holds off further updates."""
+        if self.pending_status_message is None and self.pending_fps is None:
+            return
+        if self.pending_status_message is not None:
+            self.status_bar.showMessage(self.pending_status_message)
+            self.pending_status_message = None
+        if self.pending_fps is not None:
+            self.fps_label.setText(f" FPS: {self.pending_fps:.1f} ")
+            self.pending_fps = None
+        self.status_refresh_timer.start()
+
+    def _on_tab_changed(self, index):
+        """Tracks whether the monitoring tab is the one currently shown."""
+        self._monitoring_visible = self.monitoring_tab is not None and self.tabs.currentWidget() is self.monitoring_tab
+
+    def update_detection_data(self, vehicle_counts, pedestrian_counts, alert_flags, intersections):
+        """
+        Updates the monitoring tab from per-frame detection arrays, throttled to the display rate.
+        Count rows follow the zone manager's vehicle_zone_names and pedestrian_zone_names.
+        """
+        # Enable traffic light toggle button if traffic lights are configured
+        if intersections:
+            self.control_panel.enable_traffic_light_controls(True)
 
-        scaled_heatmap_pixmap = heatmap_pixmap.scaled(
-            heatmap_container_size.width(),
-            heatmap_container_size.height(),
-            aspect_ratio_mode,
-            Qt.TransformationMode.SmoothTransformation
-        )
+        # Hidden monitoring widgets are not updated; the next frame refreshes them once shown
+        if not self._monitoring_visible:
+            return
 
-        self.video_label.setPixmap(scaled_video_pixmap)
-        self.heatmap_label.setPixmap(scaled_heatmap_pixmap)
+        current_time = time.time()
+        if current_time - self.last_update_time < self.update_interval:
+            return
+        self.last_update_time = current_time
 
-    def convert_cv_frame_to_pixmap(self, frame):
-        """Converts a OpenCV frame to a QPixmap for display."""
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_frame.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-        return QPixmap.fromImage(qt_image)
+        # Hand the monitoring tab one snapshot; it only rebuilds the sections whose values changed
+        if self.zone_manager:
+            self.monitoring_tab.apply_detection_snapshot({
+                "vehicle_zones": (tuple(self.zone_manager.vehicle_zone_names),
+                                  tuple(map(tuple, vehicle_counts.tolist()))),
+                "pedestrian_zones": (tuple(self.zone_manager.pedestrian_zone_names),
+                                     tuple(pedestrian_counts.tolist())),
+                "emergency": bool(alert_flags[ALERT_EMERGENCY]),
+                "accident": bool(alert_flags[ALERT_ACCIDENT]),
+                "intersections": intersections,
+            })
+
+    def update_display_labels(self, annotated_image, heatmap_image):
+        """Updates video and heatmap displays with the QImages built by the inference thread."""
+        self.video_label.set_image(annotated_image)
+        self.heatmap_label.set_image(heatmap_image)
+
+    def _view_pixel_size(self, view):
+        """Returns the device-pixel size a view draws frames at, or None before its first frame."""
+        size = view.target_size()
+        if size is None:
+            return None
+        ratio = view.devicePixelRatioF()
+        return round(size[0] * ratio), round(size[1] * ratio)
+
+    def update_inference_display_sizes(self, *_):
+        """Tells the inference thread the sizes frames are drawn at so it can downscale before emitting."""
+        if getattr(self, "inference_thread", None):
+            self.inference_thread.set_display_sizes(self._view_pixel_size(self.video_label),
+                                                    self._view_pixel_size(self.heatmap_label))
+
+    def get_display_fps(self):
+        """Returns the configured display rate, capped at the screen refresh rate when it is known."""
+        display_fps = self.settings["display_settings"]["display_fps"]
+        if self.screen_refresh_rate and self.screen_refresh_rate > 0:
+            return min(display_fps, self.screen_refresh_rate)
+        return display_fps
+
+    def _on_refresh_rate_changed(self, refresh_rate):
+        """Re-caps the display rate when the screen switches refresh rate."""
+        self.screen_refresh_rate = refresh_rate
+        if self.inference_thread:
+            self.inference_thread.set_display_fps(self.get_display_fps())
+
+    def update_display_settings(self):
+        """Resolves display settings used on every frame; called whenever the settings change."""
+        self._aspect_ratio_mode_cached = self._resolve_aspect_ratio_mode()
+        if getattr(self, "inference_thread", None):
+            self.inference_thread.set_display_fps(self.get_display_fps())
+        if hasattr(self, "video_label"):
+            self.video_label.set_aspect_ratio_mode(self._aspect_ratio_mode_cached)
+            self.heatmap_label.set_aspect_ratio_mode(self._aspect_ratio_mode_cached)
+
+    def _resolve_aspect_ratio_mode(self):
+        """Maps the aspect ratio mode in the settings to its Qt enum."""
+        return _ASPECT_MODE_MAP.get(self.settings["display_settings"]["aspect_ratio_mode"],
+                                    Qt.AspectRatioMode.KeepAspectRatio)
 
     def get_aspect_ratio_mode(self):
-        """Returns the Qt aspect ratio mode based on settings."""
-        aspect_ratio_mode_str = self.settings["display_settings"]["aspect_ratio_mode"]
-        if aspect_ratio_mode_str == "KeepAspectRatio":
-            return Qt.AspectRatioMode.KeepAspectRatio
-        elif aspect_ratio_mode_str == "IgnoreAspectRatio":
-            return Qt.AspectRatioMode.IgnoreAspectRatio
-        return Qt.AspectRatioMode.KeepAspectRatio
+        """Returns the Qt aspect ratio mode based on settings, as resolved on the last settings change."""
+        return self._aspect_ratio_mode_cached
 
     def restart_application(self):
         """Restarts the application to apply settings changes."""
@@ -760,9 +1225,9 @@ class ZoneManagerGUI(QMainWindow):
         if self.is_inferencing:
             self.stop_inference()
 
-        # Stop data collection if active
+        # Stop data collection and write out queued records now; exec and exit skip interpreter teardown
         if hasattr(self, 'data_collector') and self.data_collector:
-            self.data_collector.stop_collection()
+            self.data_collector.shutdown()
             info("Data collection stopped during application restart")
 
         # Close any open resources
@@ -771,35 +1236,54 @@ class ZoneManagerGUI(QMainWindow):
 
         # Get the command that was used to start the program
         python = sys.executable
-        script = os.path.abspath(sys.argv[0])
-        args = sys.argv[1:]
+        script = _SCRIPT_PATH
+        args = _LAUNCH_ARGV
         info(f"Restarting with: {python} {script} {' '.join(args)}")
 
         # Close the current instance
         self.close()
 
-        # Start a new instance
-        subprocess.Popen([python, script] + args)
+        if os.name == "nt":
+            # On Windows execv starts a separate process rather than replacing this one
+            subprocess.Popen([python, script] + args)
+            info("Exiting current instance for restart")
+            sys.exit(0)
 
-        # Exit the current instance
-        info("Exiting current instance for restart")
-        sys.exit(0)
+        # Replace this process in place so the old and new instance never hold models and GPU memory at once.
+        # exec skips interpreter shutdown, so log handlers are flushed explicitly first.
+        info("Replacing current instance for restart")
+        logging.shutdown()
+        os.execv(python, [python, script] + args)
+
+    def release_models(self):
+        """
+        Drops every reference to the loaded models and returns cached GPU memory to the driver,
+        so a restarted instance can load its models while this process is still exiting.
+        """
+        for model_type in (MODEL_TYPE_ZONE, MODEL_TYPE_EMERGENCY, MODEL_TYPE_ACCIDENT):
+            setattr(self, model_type, None)
+            if getattr(self, 'zone_manager', None):
+                setattr(self.zone_manager, model_type, None)
+        self.frame_preprocessor = None
+        self.cuda_streams = None
+        gc.collect()
+
+        # torch is only imported once a model was loaded; don't import it just to clear its cache
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+            info("Released CUDA memory held by the models")
 
     def show_data_viewer(self):
         """This functionality has been removed."""
-        QMessageBox.information(self, "Information",
-            "The data viewer has been removed. The data is still being collected in the SQLite database.")
+        QMessageBox.information(self, "Information", self._DATA_VIEWER_MSG)
 
     def _update_health_status(self, alert_active: bool):
-        """Updates the visual indicator for health status."""
-        color = "#FF0000" if alert_active else "#00FF00" # Red for alert, Green for OK
-        self.health_status_indicator.setStyleSheet(f"""
-            QFrame {{
-                border: 1px solid gray;
-                border-radius: 7px;
-                background-color: {color};
-            }}
-        """)
+        """Updates the visual indicator for health status; unchanged states skip the stylesheet re-parse."""
+        if alert_active == self._health_alert_active:
+            return
+        self._health_alert_active = alert_active
+        self.health_status_indicator.setStyleSheet(self._health_styles[alert_active])
 
     def _health_alert_callback(self, title: str, data: dict):
         """Callback triggered by HealthMonitor for alerts."""
@@ -825,16 +1309,56 @@ class ZoneManagerGUI(QMainWindow):
         if hasattr(self, 'data_collector') and self.data_collector:
             self.data_collector.stop_collection()
 
+        # Write out settings changes that are still waiting on the save timer
+        if self.settings_save_timer.isActive():
+            self.flush_settings()
+
+        # Model loading stops after the model it is loading
+        self.pending_model_load = None
+        if self.model_loader and self.model_loader.isRunning():
+            self.model_loader.requestInterruption()
+            self.model_loader.wait()
+
+        # TensorRT exports cannot be interrupted, wait for them to finish
+        for export_thread in list(self.export_threads.values()):
+            info("Waiting for TensorRT export to finish...")
+            export_thread.wait()
+
+        self.release_models()
+
         info("Cleanup finished. Closing application.")
         event.accept()
 
 def main():
-    app = QApplication(sys.argv)
+    """Parses command line arguments before any heavy module is imported, then starts the GUI."""
+    parser = argparse.ArgumentParser(description="Traffic Vision - zone-based traffic monitoring and analysis.")
+    # Unrecognized arguments are left for Qt (e.g. -platform, -style)
+    _, qt_args = parser.parse_known_args()
+    _execute([sys.argv[0]] + qt_args)
+
+def _execute(qt_argv):
+    """Creates the application and main window; torch, OpenCV and the models are imported on first use."""
+    app = QApplication(qt_argv)
     app.setWindowIcon(QIcon("static/icons/traffic-light.png"))
     info("Starting Traffic Vision main window")
     zone_manager_gui = ZoneManagerGUI()
     zone_manager_gui.show()
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    zone_manager_gui.data_collector.shutdown()
+    exit_process(exit_code)
+
+def exit_process(exit_code):
+    """
+    Exits without running interpreter teardown, which walks every model tensor and CUDA object
+    and dominates shutdown time. Pending data must already be flushed; logs are flushed here.
+    Set TRAFFIC_VISION_CLEAN_EXIT=1 to exit through sys.exit instead, e.g. when debugging.
+    """
+    if os.environ.get("TRAFFIC_VISION_CLEAN_EXIT"):
+        sys.exit(exit_code)
+    logging.shutdown()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(exit_code)
 
 if __name__ == "__main__":
     main()
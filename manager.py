@@ -1,14 +1,26 @@
 import cv2
 import numpy as np
 import supervision as sv
+import torch
+import torch.nn.functional as F
 import json
+import math
 from typing import Dict, Tuple, Callable
 import time
-from collections import defaultdict
+import traceback
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 from utils.constants import *
 from utils.notifier import TelegramNotifier
-from logger import logger
+from utils.json_io import load_json_file, save_json_file
+from utils.heatmap_stamp import pack_kernels, stamp_kernels
+from logger import get_logger
+
+logger = get_logger()
+
+# Make sure OpenCV's SIMD-optimized code paths are enabled for resizing and blending
+cv2.setUseOptimized(True)
 
 class ZoneManager:
     """
@@ -16,22 +28,23 @@ class ZoneManager:
     Supports separate vehicle and pedestrian zones.
     """
     def __init__(self, frame_width: int, frame_height: int, video_path: str, zone_model,
-                 emergency_model, accident_model, inference_settings, heatmap_settings):
+                 emergency_model, accident_model, inference_settings, heatmap_settings,
+                 preprocessor=None, cuda_streams=None, heatmap_device=DEVICE_CPU):
         self.frame_width = frame_width
         self.frame_height = frame_height
         self.video_path = video_path
         self.zones: Dict[str, Dict[str, any]] = {ZONE_TYPE_VEHICLE: {}, ZONE_TYPE_PEDESTRIAN: {}}
 
-        # Add zone-specific counters
-        self.zone_vehicle_counts = {}
-        self.zone_pedestrian_counts = {}
+        # Zone-specific counters, stored as arrays indexed by zone position
+        self._allocate_zone_counters()
+        self.alert_flags = np.zeros(2, dtype=np.uint8)
 
         self.zone_model = zone_model
         self.emergency_model = emergency_model
         self.accident_model = accident_model
 
-        # Get FPS for tracker configuration
-        self.fps = self.get_video_fps()
+        # Get FPS for tracker configuration; the frame size is read from the same capture when not given
+        self.probe_video(update_dimensions=self.frame_width <= 0 or self.frame_height <= 0)
 
         # Initialize trackers with default settings
         self.zone_tracker = sv.ByteTrack()
@@ -41,10 +54,16 @@ class ZoneManager:
         self.inference_settings = inference_settings
         self.heatmap_settings = heatmap_settings
 
-        self.vehicle_counts = {
-            "bicycle": 0, "car": 0, "motorcycle": 0, "bus": 0, "truck": 0
-        }
-        self.pedestrian_count = 0
+        # Optional preprocessor that letterboxes each batch once for all models (pinned on CUDA)
+        self.preprocessor = preprocessor
+
+        # Optional per-model CUDA streams; when set the three models run concurrently
+        self.cuda_streams = cuda_streams
+        self._model_executor = None
+
+        # Box and label annotators, built once per color instead of on every frame
+        self._detection_annotators = {}
+
         self.emergency_detected = False
         self.accident_detected = False
 
@@ -52,57 +71,119 @@ class ZoneManager:
         self.telegram_notifier = None
         self.last_accident_notification_time = 0
         self.accident_notification_cooldown = 30
-        self.accident_frames = []
+        # Notifications are uploaded from a background thread so network latency never stalls frames
+        self._notify_executor = None
+        self._notification_future = None
+        # Most recent annotated frames of an ongoing accident, oldest dropped first
+        self.accident_frames = deque(maxlen=5)
 
         # Speed estimation attributes
         self.track_history = {}
         self.emergency_track_history = {}
         self.vehicle_classes = ["bicycle", "car", "motorcycle", "bus", "truck"]
+        # Per-class-id lookup arrays for the zone model, rebuilt when the model changes
+        self._class_tables_model = None
+        self._class_tables = None
         self.ppm = 8.8
         self.speed_smoothing_window = 5
-        self.speed_data = defaultdict(list)
-        self.emergency_speed_data = defaultdict(list)
+        self.track_history_length = 30
+        # Per-track ring buffers; appending past their length drops the oldest entry in O(1)
+        self.speed_data = defaultdict(self._new_speed_window)
+        self.emergency_speed_data = defaultdict(self._new_speed_window)
 
-        if self.frame_width <= 0 or self.frame_height <= 0:
-            self.infer_frame_dimensions_from_video()
+        # Contrast equalizer reused by every heatmap render
+        self._clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
 
-        self.persistent_heatmap = np.zeros((self.frame_height, self.frame_width), dtype=np.float32)
-        self.gaussian_kernels = {}
+        # On CUDA the heatmap accumulates on the GPU and only the rendered uint8 map is copied back
+        self.heatmap_device = heatmap_device
+        self.reset_heatmap()
 
         # Track maintenance attributes
         self.last_track_cleanup_time = time.time()
+        # Time of the latest processed frame, in the same time base as the track history
+        self.latest_frame_time = None
         self.track_cleanup_interval = 5.0
 
         # Add traffic light integration
         self.traffic_light_controller = None
         self.show_traffic_lights = False
 
-    def get_video_fps(self):
-        """Gets the FPS of the video file."""
-        try:
-            cap = cv2.VideoCapture(self.video_path)
-            if cap.isOpened():
-                fps = cap.get(cv2.CAP_PROP_FPS)
-                cap.release()
-                return fps if fps > 0 else 30.0
-            return 30.0
-        except Exception as e:
-            logger.error(f"Error getting FPS: {e}")
-            return 30.0
+    def reconfigure(self, video_path: str, zone_model, emergency_model, accident_model,
+                    inference_settings, heatmap_settings, preprocessor=None, cuda_streams=None,
+                    heatmap_device=DEVICE_CPU):
+        """
+        Updates models and settings in place. Switching to a different video clears zones,
+        counts and tracks, and reallocates the heatmap only if the frame size changed.
+        """
+        self.zone_model = zone_model
+        self.emergency_model = emergency_model
+        self.accident_model = accident_model
+        self.inference_settings = inference_settings
+        self.heatmap_settings = heatmap_settings
+        self.preprocessor = preprocessor
+        self.cuda_streams = cuda_streams
+        self.set_heatmap_device(heatmap_device)
+
+        if video_path == self.video_path:
+            return
+
+        previous_size = (self.frame_width, self.frame_height)
+        self.video_path = video_path
+        self.probe_video(update_dimensions=True)
+
+        self.zones = {ZONE_TYPE_VEHICLE: {}, ZONE_TYPE_PEDESTRIAN: {}}
+        self._allocate_zone_counters()
+        self.accident_frames.clear()
+        self.reset_trackers()
 
-    def infer_frame_dimensions_from_video(self):
-        """Infers frame width and height from the video file."""
+        if (self.frame_width, self.frame_height) != previous_size:
+            self.reset_heatmap()
+
+    def probe_video(self, update_dimensions: bool = False):
+        """
+        Reads the FPS, and optionally the frame width and height, from one capture of the video file.
+        FPS falls back to 30 when unavailable; the dimensions raise if the video cannot be opened.
+        """
         cap = cv2.VideoCapture(self.video_path)
-        if cap.isOpened():
-            self.frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            self.frame_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        try:
+            opened = cap.isOpened()
+            fps = cap.get(cv2.CAP_PROP_FPS) if opened else 0
+            if update_dimensions:
+                if not opened:
+                    raise ValueError("Could not determine frame dimensions from video and no dimensions provided.")
+                self.frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+                self.frame_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        finally:
             cap.release()
-        else:
-            raise ValueError("Could not determine frame dimensions from video and no dimensions provided.")
+        self.fps = fps if fps > 0 else 30.0
 
     def reset_heatmap(self):
-        """Resets the persistent heatmap to zero."""
-        self.persistent_heatmap = np.zeros((self.frame_height, self.frame_width), dtype=np.float32)
+        """Resets the persistent heatmap to zero on the heatmap device."""
+        shape = (self.frame_height, self.frame_width)
+        # Cached kernels live on the same device as the heatmap
+        self.gaussian_kernels = {}
+        # Render scratch buffers, reused every frame
+        self._heatmap_u8 = np.empty(shape, dtype=np.uint8)
+        self._heatmap_colored = np.empty(shape + (3,), dtype=np.uint8)
+        if self.heatmap_device == DEVICE_CUDA:
+            self.persistent_heatmap = torch.zeros(shape, dtype=torch.float32, device=self.heatmap_device)
+            self._heatmap_host = torch.empty(shape, dtype=torch.uint8, pin_memory=True)
+            blur_1d = cv2.getGaussianKernel(5, 0).astype(np.float32)
+            self._heatmap_blur_kernel = torch.from_numpy(blur_1d @ blur_1d.T).to(self.heatmap_device).view(1, 1, 5, 5)
+        else:
+            self.persistent_heatmap = np.zeros(shape, dtype=np.float32)
+
+    def set_heatmap_device(self, heatmap_device):
+        """Moves heatmap accumulation to another device, starting from an empty heatmap."""
+        if heatmap_device != self.heatmap_device:
+            self.heatmap_device = heatmap_device
+            self.reset_heatmap()
+
+    def get_heatmap_array(self) -> np.ndarray:
+        """Returns the accumulated heatmap as a float32 numpy array."""
+        if isinstance(self.persistent_heatmap, torch.Tensor):
+            return self.persistent_heatmap.cpu().numpy()
+        return self.persistent_heatmap
 
     def create_zones_interactive(self, num_zones: int, zone_type: str, callback: Callable[[bool, str], None]):
         """
@@ -122,7 +203,7 @@ class ZoneManager:
             callback(False, zone_type)
             return
 
-        resized_frame = cv2.resize(frame, (self.frame_width, self.frame_height))
+        resized_frame = self._resize_to_frame(frame)
         zone_name_prefix = zone_type.capitalize() + " Zone"
         window_name = f"Creating {zone_type.capitalize()} Zones"
         cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
@@ -144,11 +225,53 @@ class ZoneManager:
 
         # Store created zones
         for zone_name, polygon in all_polygons:
-            self.zones[zone_type][zone_name] = {
-                'zone': sv.PolygonZone(polygon=polygon)
-            }
+            self.zones[zone_type][zone_name] = self._create_zone_info(polygon)
+        self._allocate_zone_counters()
         callback(True, zone_type)
 
+    def _create_zone_info(self, polygon: np.ndarray) -> dict:
+        """
+        Builds the stored entry for a zone: the supervision zone used for annotation and its polygon
+        rasterized to a frame-sized mask, so membership tests are a single array lookup per detection.
+        """
+        mask = np.zeros((self.frame_height, self.frame_width), dtype=np.uint8)
+        cv2.fillPoly(mask, [polygon.astype(np.int32)], 1)
+        return {
+            'zone': sv.PolygonZone(polygon=polygon),
+            'mask': mask.astype(bool)
+        }
+
+    def _zone_anchor_points(self, detections):
+        """Returns the (x, y) pixel indices of the detections' bottom-center anchors, as PolygonZone tests them."""
+        xyxy = detections.xyxy
+        xs = np.clip(np.ceil((xyxy[:, 0] + xyxy[:, 2]) / 2).astype(int), 0, self.frame_width - 1)
+        ys = np.clip(np.ceil(xyxy[:, 3]).astype(int), 0, self.frame_height - 1)
+        return xs, ys
+
+    def _detections_in_zone(self, zone_info, detections) -> np.ndarray:
+        """Returns a boolean array telling which detections are inside the zone."""
+        if len(detections) == 0:
+            return np.zeros(0, dtype=bool)
+        xs, ys = self._zone_anchor_points(detections)
+        return zone_info['mask'][ys, xs]
+
+    def _zones_containing(self, detections) -> list:
+        """
+        Returns the names of the zones, vehicle zones first, that contain at least one detection.
+        All zones are tested against all detections with one lookup into the stacked zone masks.
+        """
+        if self._stacked_zone_masks is None:
+            zone_infos = [(name, info) for zone_type in self.zones for name, info in self.zones[zone_type].items()]
+            self._stacked_zone_names = [name for name, _ in zone_infos]
+            self._stacked_zone_masks = (np.stack([info['mask'] for _, info in zone_infos]) if zone_infos
+                                        else np.zeros((0, self.frame_height, self.frame_width), dtype=bool))
+        if len(detections) == 0 or not self._stacked_zone_names:
+            return []
+
+        xs, ys = self._zone_anchor_points(detections)
+        zone_hits = self._stacked_zone_masks[:, ys, xs].any(axis=1)
+        return [name for name, hit in zip(self._stacked_zone_names, zone_hits.tolist()) if hit]
+
     def create_single_polygon(self, frame: np.ndarray, zone_name: str, window_name: str) -> np.ndarray:
         """
         Interactively creates a polygon zone using mouse clicks within a given window.
@@ -172,8 +295,15 @@ class ZoneManager:
         cv2.setMouseCallback(window_name, mouse_callback)
         cv2.imshow(window_name, clone)
 
+        # pollKey services window events without waiting; older OpenCV builds only have waitKey
+        poll_key = getattr(cv2, "pollKey", lambda: cv2.waitKey(1))
         while True:
-            key = cv2.waitKey(1) & 0xFF
+            key = poll_key()
+            if key == -1:
+                # Nothing pressed; yield briefly instead of spinning on the event queue
+                time.sleep(0.005)
+                continue
+            key &= 0xFF
             if key == 13: # Enter key
                 if len(points) >= 3:
                     return np.array(points)
@@ -196,11 +326,25 @@ class ZoneManager:
                     cv2.imshow(window_name, clone)
 
 
-    def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    def _resize_to_frame(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Resizes a frame to the zone manager's frame size, using area interpolation when shrinking.
+        Frames that already have that size are returned as they are.
+        """
+        height, width = frame.shape[:2]
+        if width == self.frame_width and height == self.frame_height:
+            return frame
+        shrinking = width >= self.frame_width and height >= self.frame_height
+        interpolation = cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR
+        return cv2.resize(frame, (self.frame_width, self.frame_height), interpolation=interpolation)
+
+    def process_frame(self, frame: np.ndarray, frame_index: int = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Processes a single video frame for object detection, tracking, and heatmap, considering zone types.
+        A frame that already has the zone manager's size is annotated in place.
+        frame_index is the frame's 1-based position in the video; speeds are timed by wall clock without it.
         """
-        resized_frame = cv2.resize(frame, (self.frame_width, self.frame_height))
+        resized_frame = self._resize_to_frame(frame)
         common_inference_params = self.get_common_inference_params()
 
         # Periodically clean up stale tracks
@@ -210,18 +354,64 @@ class ZoneManager:
             self.last_track_cleanup_time = current_time
 
         # Run detections for available models
-        zone_results = self.run_detection(self.zone_model, resized_frame, MODEL_TYPE_ZONE, common_inference_params) if self.zone_model else None
-        emergency_results = self.run_detection(self.emergency_model, resized_frame, MODEL_TYPE_EMERGENCY, common_inference_params) if self.emergency_model else None
-        accident_results = self.run_detection(self.accident_model, resized_frame, MODEL_TYPE_ACCIDENT, common_inference_params) if self.accident_model else None
+        zone_batch, emergency_batch, accident_batch = self._run_models([resized_frame], 1, common_inference_params)
+        zone_results, emergency_results, accident_results = zone_batch[0], emergency_batch[0], accident_batch[0]
+
+        return self._process_frame_results(resized_frame, zone_results, emergency_results, accident_results,
+                                           current_time, self._frame_time(frame_index, current_time))
+
+    def process_batch(self, frames, frame_indices=None):
+        """
+        Processes several frames with one model call per model, then post-processes them in order.
+        Yields (annotated_frame, heatmap_frame) per frame; counts and tracker state reflect
+        each frame at the time it is yielded. Frames that already have the zone manager's size are annotated in place.
+        frame_indices are the frames' 1-based positions in the video and time the speed estimates.
+        """
+        resized_frames = [self._resize_to_frame(frame) for frame in frames]
+        common_inference_params = self.get_common_inference_params()
+        self._perform_maintenance()
+        current_time = time.time()
+
+        # Short batches are padded with the last frame so static-batch engines get a full batch
+        batch_size = self.inference_settings.get("batch_size", DEFAULT_BATCH_SIZE) if self.inference_settings else 1
+        batch_input = resized_frames + [resized_frames[-1]] * max(0, batch_size - len(resized_frames))
+
+        # Preprocess and upload once; all models share the same device tensor
+        if self.preprocessor is not None:
+            batch_input = self.preprocessor(batch_input)
+
+        zone_batch, emergency_batch, accident_batch = self._run_models(
+            batch_input, len(resized_frames), common_inference_params)
+
+        if frame_indices is None:
+            frame_indices = [None] * len(resized_frames)
+        for resized_frame, frame_index, zone_results, emergency_results, accident_results in zip(
+                resized_frames, frame_indices, zone_batch, emergency_batch, accident_batch):
+            yield self._process_frame_results(resized_frame, zone_results, emergency_results, accident_results,
+                                              current_time, self._frame_time(frame_index, current_time))
 
+    def _frame_time(self, frame_index, current_time):
+        """
+        Returns the time a frame was captured in seconds of video, from its index and the video FPS.
+        Frames of one batch are processed at almost the same moment, so wall-clock time is only
+        used when the index is unknown.
+        """
+        if frame_index is None:
+            return current_time
+        return frame_index / self.fps
+
+    def _process_frame_results(self, resized_frame, zone_results, emergency_results, accident_results, current_time,
+                               frame_time):
+        """Tracks, annotates and counts the raw model results of a single frame."""
         # Process detection results
         zone_detections, emergency_detections, accident_detections = self._process_detection_results(
             zone_results, emergency_results, accident_results)
 
         # Calculate speeds
-        vehicle_speeds, emergency_speeds = self._calculate_speeds(zone_detections, emergency_detections)
+        vehicle_speeds, emergency_speeds = self._calculate_speeds(zone_detections, emergency_detections, frame_time)
+        self.latest_frame_time = frame_time
 
-        # Generate visual output
+        # Generate visual output; the heatmap blends the clean frame before it is annotated in place
         heatmap_frame = self.generate_heatmap(resized_frame, zone_detections)
         annotated_frame = self._create_annotated_frame(
             resized_frame, zone_detections, emergency_detections,
@@ -236,14 +426,13 @@ class ZoneManager:
         self.emergency_detected = len(emergency_detections) > 0
         prev_accident_detected = self.accident_detected
         self.accident_detected = len(accident_detections) > 0
+        self.alert_flags[ALERT_EMERGENCY] = self.emergency_detected
+        self.alert_flags[ALERT_ACCIDENT] = self.accident_detected
 
         # Handle accident notifications
         if self.accident_detected:
-            if len(self.accident_frames) < 5:
-                self.accident_frames.append(annotated_frame.copy())
-            else:
-                self.accident_frames.pop(0)
-                self.accident_frames.append(annotated_frame.copy())
+            # Each frame's annotated image is a fresh array that is never modified later
+            self.accident_frames.append(annotated_frame)
 
             # Send notification if this is a new accident detection or cooldown has passed
             if (not prev_accident_detected or
@@ -260,6 +449,10 @@ class ZoneManager:
         if not self.telegram_notifier:
             return
 
+        # Only one notification is in flight at a time
+        if self._notification_future is not None and not self._notification_future.done():
+            return
+
         # Get the best frame to send (middle frame of accident sequence if available)
         notification_frame = frame
         if len(self.accident_frames) >= 3:
@@ -270,13 +463,16 @@ class ZoneManager:
         # Get accident location information
         location_info = self._determine_accident_location()
 
-        # Send notification
-        success = self.telegram_notifier.send_accident_notification(
-            image=notification_frame,
-            location=location_info,
-            details=f"Accident detected in video: {os.path.basename(self.video_path)}"
-        )
+        # Send notification; buffered frames are never modified, so the worker can read them without a copy
+        if self._notify_executor is None:
+            self._notify_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notify")
+        self._notification_future = self._notify_executor.submit(
+            self._send_accident_notification_blocking, self.telegram_notifier, notification_frame, location_info,
+            f"Accident detected in video: {os.path.basename(self.video_path)}")
 
+    def _send_accident_notification_blocking(self, notifier, frame, location_info, details):
+        """Encodes and uploads an accident notification; runs on the notification thread."""
+        success = notifier.send_accident_notification(image=frame, location=location_info, details=details)
         if success:
             self.last_accident_notification_time = time.time()
             logger.info(f"Accident notification sent at {time.strftime('%H:%M:%S')}")
@@ -285,10 +481,9 @@ class ZoneManager:
         """Determine the location of the accident based on active zones."""
         # If we have accident detections and zones, try to locate the accident in a specific zone
         if hasattr(self, 'accident_detections') and len(self.accident_detections) > 0:
-            for zone_type in self.zones:
-                for zone_name, zone_info in self.zones[zone_type].items():
-                    if zone_info['zone'].trigger(self.accident_detections):
-                        return f"Zone: {zone_name}"
+            accident_zones = self._zones_containing(self.accident_detections)
+            if accident_zones:
+                return f"Zone: {accident_zones[0]}"
 
         # Fall back to video filename if no specific zone
         if self.video_path:
@@ -325,9 +520,9 @@ class ZoneManager:
     def _process_detection_results(self, zone_results, emergency_results, accident_results):
         """Process raw detection results into filtered, tracked detections."""
         # Convert results to detections
-        zone_detections = sv.Detections.from_ultralytics(zone_results) if zone_results is not None else sv.Detections.empty()
-        emergency_detections = sv.Detections.from_ultralytics(emergency_results) if emergency_results is not None else sv.Detections.empty()
-        accident_detections = sv.Detections.from_ultralytics(accident_results) if accident_results is not None else sv.Detections.empty()
+        zone_detections = self._results_to_detections(zone_results)
+        emergency_detections = self._results_to_detections(emergency_results)
+        accident_detections = self._results_to_detections(accident_results)
 
         # Apply filtering
         zone_detections = self.filter_zone_detections_by_class(zone_detections)
@@ -346,8 +541,19 @@ class ZoneManager:
 
         return tracked_zone, tracked_emergency, tracked_accident
 
-    def _calculate_speeds(self, zone_detections, emergency_detections):
-        """Calculate speeds for detected objects."""
+    def _results_to_detections(self, results):
+        """Converts Ultralytics results to detections in frame coordinates."""
+        if results is None:
+            return sv.Detections.empty()
+
+        detections = sv.Detections.from_ultralytics(results)
+        # Results of preprocessed tensors are in letterboxed model-input coordinates
+        if self.preprocessor is not None and results.orig_shape == (self.preprocessor.imgsz, self.preprocessor.imgsz):
+            detections.xyxy = self.preprocessor.scale_boxes(detections.xyxy)
+        return detections
+
+    def _calculate_speeds(self, zone_detections, emergency_detections, frame_time):
+        """Calculate speeds for detected objects; frame_time is when the frame was captured, in seconds."""
         # Clean up tracking history
         if len(zone_detections) > 0:
             self.clean_tracking_history(
@@ -359,36 +565,54 @@ class ZoneManager:
         # Calculate vehicle speeds
         vehicle_speeds = {}
         if zone_detections and len(zone_detections) > 0:
-            for i, (xyxy, tracker_id, class_id) in enumerate(
-                    zip(zone_detections.xyxy, zone_detections.tracker_id, zone_detections.class_id)):
-                class_name = self.zone_model.names[class_id] if self.zone_model else "unknown"
-                if class_name in self.vehicle_classes:
-                    center = self._get_bbox_center(xyxy)
-                    speed = self.calculate_speed(
-                        tracker_id, center, self.track_history, self.speed_data)
-                    vehicle_speeds[tracker_id] = speed
+            vehicle_mask = self._get_class_tables()["vehicle_index"][zone_detections.class_id] >= 0
+            vehicle_speeds = self._calculate_detection_speeds(
+                zone_detections.xyxy[vehicle_mask], zone_detections.tracker_id[vehicle_mask],
+                self.track_history, self.speed_data, frame_time)
 
         # Calculate emergency vehicle speeds
         emergency_speeds = {}
         if emergency_detections and len(emergency_detections) > 0:
-            for i, (xyxy, tracker_id) in enumerate(
-                    zip(emergency_detections.xyxy, emergency_detections.tracker_id)):
-                center = self._get_bbox_center(xyxy)
-                speed = self.calculate_speed(
-                    tracker_id, center, self.emergency_track_history, self.emergency_speed_data)
-                emergency_speeds[tracker_id] = speed
+            emergency_speeds = self._calculate_detection_speeds(
+                emergency_detections.xyxy, emergency_detections.tracker_id,
+                self.emergency_track_history, self.emergency_speed_data, frame_time)
 
         return vehicle_speeds, emergency_speeds
 
-    def _get_bbox_center(self, xyxy):
-        """Calculate the center point of a bounding box."""
-        x1, y1, x2, y2 = xyxy
-        return ((x1 + x2) / 2, (y1 + y2) / 2)
+    def _calculate_detection_speeds(self, xyxy, tracker_ids, history_dict, speed_data_dict, frame_time):
+        """Computes all bounding box centers at once, then updates each track's speed; returns {tracker_id: km/h}."""
+        centers = (xyxy[:, :2] + xyxy[:, 2:]) * 0.5
+        return {
+            tracker_id: self.calculate_speed(tracker_id, tuple(center), history_dict, speed_data_dict, frame_time)
+            for tracker_id, center in zip(tracker_ids.tolist(), centers.tolist())
+        }
+
+    def _get_class_tables(self):
+        """
+        Returns lookup arrays indexed by the zone model's class ids: whether the class is tracked
+        in zones and heatmaps, its VEHICLE_CLASSES column (-1 otherwise), whether it is a person,
+        and its heatmap intensity multiplier. Rebuilt only when the zone model changes.
+        """
+        if self._class_tables is None or self._class_tables_model is not self.zone_model:
+            self._class_tables_model = self.zone_model
+            names = self.zone_model.names if self.zone_model else {}
+            class_names = [names.get(class_id, "") for class_id in range(max(names, default=-1) + 1)]
+            self._class_tables = {
+                "target": np.array([name in TARGET_ZONE_CLASSES for name in class_names], dtype=bool),
+                "vehicle_index": np.array([VEHICLE_CLASS_INDEX.get(name, -1) for name in class_names], dtype=int),
+                "person": np.array([name == "person" for name in class_names], dtype=bool),
+                "intensity": np.array([HEATMAP_CLASS_INTENSITY.get(name, 1.0) for name in class_names],
+                                      dtype=np.float32),
+            }
+        return self._class_tables
 
     def _create_annotated_frame(self, frame, zone_detections, emergency_detections,
                               accident_detections, vehicle_speeds, emergency_speeds):
-        """Create a frame with all detections, zones, and data visualized."""
-        annotated_frame = frame.copy()
+        """
+        Create a frame with all detections, zones, and data visualized.
+        The annotators draw into the given frame, which callers must not need unannotated afterwards.
+        """
+        annotated_frame = frame
 
         # Annotate all types of detections
         annotated_frame = self.annotate_detections(
@@ -410,21 +634,17 @@ class ZoneManager:
 
         # Update traffic light controller with latest data
         self.traffic_light_controller.update_traffic_data(
-            self.zone_vehicle_counts,
-            self.zone_pedestrian_counts
+            self.get_zone_vehicle_counts(),
+            self.get_zone_pedestrian_counts()
         )
 
         # Process emergency vehicle priority
         if hasattr(self, 'emergency_detections') and len(self.emergency_detections) > 0:
             # Find zones with emergency vehicles
-            emergency_zones = set()
-            for zone_type in self.zones:
-                for zone_name, zone_info in self.zones[zone_type].items():
-                    for i in range(len(self.emergency_detections)):
-                        if zone_info['zone'].trigger(self.emergency_detections[i:i+1]):
-                            # Report emergency in this zone
-                            self.traffic_light_controller.report_emergency_vehicle(zone_name, True)
-                            emergency_zones.add(zone_name)
+            emergency_zones = set(self._zones_containing(self.emergency_detections))
+            for zone_name in emergency_zones:
+                # Report emergency in this zone
+                self.traffic_light_controller.report_emergency_vehicle(zone_name, True)
 
             for zone_type in self.zones:
                 for zone_name in [name for name, info in self.zones[zone_type].items() if name not in emergency_zones]:
@@ -438,15 +658,12 @@ class ZoneManager:
         # Process accident detection
         if hasattr(self, 'zone_detections') and self.accident_detected:
             # Find zones where accidents are detected
-            accident_zones = set()
-            for zone_type in self.zones:
-                for zone_name, zone_info in self.zones[zone_type].items():
-                    if hasattr(self, 'accident_detections') and len(self.accident_detections) > 0:
-                        for i in range(len(self.accident_detections)):
-                            if zone_info['zone'].trigger(self.accident_detections[i:i+1]):
-                                # Report accident in this zone
-                                self.traffic_light_controller.report_accident(True, zone_name)
-                                accident_zones.add(zone_name)
+            accident_zones = []
+            if hasattr(self, 'accident_detections') and len(self.accident_detections) > 0:
+                accident_zones = self._zones_containing(self.accident_detections)
+            for zone_name in accident_zones:
+                # Report accident in this zone
+                self.traffic_light_controller.report_accident(True, zone_name)
 
             # If accident is detected but no specific zone is identified
             if not accident_zones:
@@ -487,18 +704,7 @@ class ZoneManager:
         if model is None:
             return None
 
-        default_model_settings = {
-            "confidence_threshold": DEFAULT_CONFIDENCE_THRESHOLD,
-            "iou_threshold": DEFAULT_IOU_THRESHOLD
-        }
-
-        # Get model-specific settings with fallback
-        model_settings = (self.inference_settings.get(model_type, {})
-                          if isinstance(self.inference_settings, dict)
-                          else default_model_settings)
-
-        conf = model_settings.get("confidence_threshold", DEFAULT_CONFIDENCE_THRESHOLD)
-        iou = model_settings.get("iou_threshold", DEFAULT_IOU_THRESHOLD)
+        conf, iou = self._get_model_thresholds(model_type)
 
         try:
             return model(
@@ -510,25 +716,134 @@ class ZoneManager:
             )[0]
         except Exception as e:
             logger.error(f"Error during detection with {model_type}: {str(e)}")
-            import traceback
             traceback.print_exc()
             return None
 
+    def is_fused_model(self) -> bool:
+        """Returns True when one multi-head model serves as zone, emergency and accident model."""
+        return (self.zone_model is not None and
+                self.zone_model is self.emergency_model and
+                self.zone_model is self.accident_model)
+
+    def _run_models(self, batch_input, num_frames, common_params):
+        """Returns per-frame result lists for the zone, emergency and accident models."""
+        if self.is_fused_model():
+            return self._run_fused_model(batch_input, num_frames, common_params)
+
+        if self.cuda_streams:
+            return self._run_models_on_streams(batch_input, num_frames, common_params)
+
+        zone_batch = self.run_batch_detection(self.zone_model, batch_input, num_frames, MODEL_TYPE_ZONE, common_params)
+        emergency_batch = self.run_batch_detection(self.emergency_model, batch_input, num_frames, MODEL_TYPE_EMERGENCY, common_params)
+        accident_batch = self.run_batch_detection(self.accident_model, batch_input, num_frames, MODEL_TYPE_ACCIDENT, common_params)
+        return zone_batch, emergency_batch, accident_batch
+
+    def _run_models_on_streams(self, batch_input, num_frames, common_params):
+        """
+        Runs the zone, emergency and accident models concurrently, each from its own worker
+        thread on its own CUDA stream so their kernels and pre/post-processing overlap.
+        """
+        if self._model_executor is None:
+            self._model_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="model")
+
+        # The input may still be in flight on the current stream; every model stream waits for it
+        input_stream = torch.cuda.current_stream()
+
+        def run(model, model_type):
+            stream = self.cuda_streams[model_type]
+            stream.wait_stream(input_stream)
+            # inference_mode is thread-local, so it is entered again in each worker
+            with torch.inference_mode(), torch.cuda.stream(stream):
+                results = self.run_batch_detection(model, batch_input, num_frames, model_type, common_params)
+            stream.synchronize()
+            return results
+
+        futures = [
+            self._model_executor.submit(run, model, model_type)
+            for model, model_type in ((self.zone_model, MODEL_TYPE_ZONE),
+                                      (self.emergency_model, MODEL_TYPE_EMERGENCY),
+                                      (self.accident_model, MODEL_TYPE_ACCIDENT))
+        ]
+        zone_batch, emergency_batch, accident_batch = (future.result() for future in futures)
+        return zone_batch, emergency_batch, accident_batch
+
+    def _run_fused_model(self, batch_input, num_frames, common_params):
+        """
+        Runs the fused model once and splits each frame's results by the class ids that
+        fused_class_map assigns to the zone, emergency and accident roles.
+        """
+        model_types = (MODEL_TYPE_ZONE, MODEL_TYPE_EMERGENCY, MODEL_TYPE_ACCIDENT)
+        thresholds = {model_type: self._get_model_thresholds(model_type) for model_type in model_types}
+        split_results = {model_type: [] for model_type in model_types}
+
+        # Predict at the lowest confidence of the three roles, then apply each role's own threshold
+        conf = min(model_conf for model_conf, _ in thresholds.values())
+        iou = thresholds[MODEL_TYPE_ZONE][1]
+        try:
+            results = self.zone_model(batch_input, conf=conf, iou=iou, verbose=False, **common_params)[:num_frames]
+        except Exception as e:
+            logger.error(f"Error during fused model detection: {str(e)}")
+            return [None] * num_frames, [None] * num_frames, [None] * num_frames
+
+        class_map = self.inference_settings.get("fused_class_map", {})
+        for frame_results in results:
+            class_ids = frame_results.boxes.cls.cpu().numpy().astype(int)
+            confidences = frame_results.boxes.conf.cpu().numpy()
+            for model_type in model_types:
+                mask = np.isin(class_ids, class_map.get(model_type, [])) & (confidences >= thresholds[model_type][0])
+                split_results[model_type].append(frame_results[np.flatnonzero(mask)])
+
+        return split_results[MODEL_TYPE_ZONE], split_results[MODEL_TYPE_EMERGENCY], split_results[MODEL_TYPE_ACCIDENT]
+
+    def run_batch_detection(self, model, batch_input, num_frames, model_type, common_params):
+        """
+        Runs object detection on a batch (list of frames or preprocessed tensor) in a single
+        model call and returns the results of the first num_frames entries.
+        """
+        if model is None:
+            return [None] * num_frames
+
+        conf, iou = self._get_model_thresholds(model_type)
+
+        try:
+            results = model(
+                batch_input,
+                conf=conf,
+                iou=iou,
+                verbose=False,
+                **common_params
+            )
+            return results[:num_frames]
+        except Exception as e:
+            logger.error(f"Error during batch detection with {model_type}: {str(e)}")
+            return [None] * num_frames
+
+    def _get_model_thresholds(self, model_type):
+        """Returns the (confidence, iou) thresholds configured for a model type."""
+        default_model_settings = {
+            "confidence_threshold": DEFAULT_CONFIDENCE_THRESHOLD,
+            "iou_threshold": DEFAULT_IOU_THRESHOLD
+        }
+
+        # Get model-specific settings with fallback
+        model_settings = (self.inference_settings.get(model_type, {})
+                          if isinstance(self.inference_settings, dict)
+                          else default_model_settings)
+
+        conf = model_settings.get("confidence_threshold", DEFAULT_CONFIDENCE_THRESHOLD)
+        iou = model_settings.get("iou_threshold", DEFAULT_IOU_THRESHOLD)
+        return conf, iou
+
     def filter_zone_detections_by_class(self, detections: sv.Detections) -> sv.Detections:
         """Filters zone detections to include only specified classes."""
         if self.zone_model and len(detections) > 0:
-            target_zone_classes = ["person", "bicycle", "car", "motorcycle", "bus", "truck"]
-            target_zone_class_ids = [class_id for class_id, name in self.zone_model.names.items() if name in target_zone_classes]
-            filtered_zone_indices = np.isin(detections.class_id, target_zone_class_ids)
-            return detections[filtered_zone_indices]
+            return detections[self._get_class_tables()["target"][detections.class_id]]
         return detections
 
     def annotate_detections(self, frame, detections, model, color, speeds=None):
         """Annotates detections on the frame with optional speed information."""
         if model and len(detections) > 0:
-            box_annotator = sv.BoxAnnotator(color=color)
-            label_annotator = sv.LabelAnnotator(color=color, text_color=sv.Color.BLACK,
-                                                text_scale=0.6, border_radius=10, smart_position=True)
+            box_annotator, label_annotator = self._get_detection_annotators(color)
 
             frame = box_annotator.annotate(frame, detections=detections)
 
@@ -546,17 +861,30 @@ class ZoneManager:
             frame = label_annotator.annotate(frame, detections=detections, labels=labels)
         return frame
 
+    def _get_detection_annotators(self, color):
+        """Returns the cached (box, label) annotator pair for a color."""
+        key = color.as_hex()
+        if key not in self._detection_annotators:
+            self._detection_annotators[key] = (
+                sv.BoxAnnotator(color=color),
+                sv.LabelAnnotator(color=color, text_color=sv.Color.BLACK,
+                                  text_scale=0.6, border_radius=10, smart_position=True),
+            )
+        return self._detection_annotators[key]
+
     def annotate_zones(self, frame, zone_detections):
         """Annotates vehicle and pedestrian zones on the frame."""
         for zone_name, zone_info in self.zones[ZONE_TYPE_VEHICLE].items():
-            frame = self.annotate_single_zone(frame, zone_info['zone'], zone_detections, sv.Color.WHITE)
+            frame = self.annotate_single_zone(frame, zone_info, zone_detections, sv.Color.WHITE)
         for zone_name, zone_info in self.zones[ZONE_TYPE_PEDESTRIAN].items():
-            frame = self.annotate_single_zone(frame, zone_info['zone'], zone_detections, sv.Color.YELLOW)
+            frame = self.annotate_single_zone(frame, zone_info, zone_detections, sv.Color.YELLOW)
         return frame
 
-    def annotate_single_zone(self, frame, zone, zone_detections, color):
+    def annotate_single_zone(self, frame, zone_info, zone_detections, color):
         """Annotates a single zone on the frame."""
-        zone.trigger(zone_detections)
+        # The annotator only reads the count, which the zone mask gives without running trigger
+        zone = zone_info['zone']
+        zone.current_count = int(np.count_nonzero(self._detections_in_zone(zone_info, zone_detections)))
         zone_annotator = sv.PolygonZoneAnnotator(
             zone=zone,
             color=color,
@@ -566,60 +894,46 @@ class ZoneManager:
         return zone_annotator.annotate(frame)
 
     def _get_gaussian_kernel(self, sigma):
-        """Cache and retrieve gaussian kernels for better performance."""
+        """
+        Cache and retrieve 1D gaussian kernels for better performance.
+        The 2D kernel is separable, so only one axis is stored and stamps are built as outer products.
+        """
         sigma_key = round(sigma * 2) / 2
 
         if sigma_key not in self.gaussian_kernels:
             size = max(1, int(3 * sigma_key + 1) | 1)
-            kernel_1d = cv2.getGaussianKernel(size, sigma_key)
-            self.gaussian_kernels[sigma_key] = kernel_1d @ kernel_1d.T
+            kernel = cv2.getGaussianKernel(size, sigma_key).ravel().astype(np.float32)
+            if self.heatmap_device == DEVICE_CUDA:
+                kernel = torch.from_numpy(kernel).to(self.heatmap_device)
+            self.gaussian_kernels[sigma_key] = kernel
 
         return self.gaussian_kernels[sigma_key]
 
-    def _get_dynamic_kernel(self, obj_size):
-        """Returns dynamic kernel sigma and kernel based on object dimensions."""
-        dynamic_sigma = max(min(
-            self.heatmap_settings["kernel_sigma"] * (obj_size / 100),
-            50), 5)
-        kernel = self._get_gaussian_kernel(dynamic_sigma)
-        kernel_half_size = kernel.shape[0] // 2
-        return dynamic_sigma, kernel, kernel_half_size
-
-    def _get_object_intensity(self, class_id, obj_size):
-        """Calculates intensity factor based on object class and size."""
-        class_name = self.zone_model.names[class_id]
+    def _get_object_intensities(self, class_ids, obj_sizes):
+        """Calculates intensity factors for all objects based on their class and size."""
         base_intensity = self.heatmap_settings["intensity_factor"]
 
         # Class-specific intensity adjustments
-        intensity_multiplier = {
-            'truck': 1.5, 'bus': 1.5,
-            'car': 1.2, 'motorcycle': 1.2,
-            'person': 0.8, 'bicycle': 0.8
-        }.get(class_name, 1.0)
+        intensity_multipliers = self._get_class_tables()["intensity"][class_ids]
 
         # Scale with object size, clamped to reasonable range
-        size_factor = np.clip(obj_size / 100, 0.5, 2.0)
-        return base_intensity * intensity_multiplier * size_factor
-
-    def _calculate_object_dimensions(self, xyxy):
-        """Calculate object dimensions from bounding box."""
-        x1, y1, x2, y2 = xyxy
-        obj_width = x2 - x1
-        obj_height = y2 - y1
-        return np.sqrt(obj_width * obj_height)
+        size_factors = np.clip(obj_sizes / 100, 0.5, 2.0)
+        return base_intensity * intensity_multipliers * size_factors
 
     def _apply_kernel_to_heatmap(self, center_x, center_y, kernel, kernel_half_size, intensity):
-        """Apply a gaussian kernel to the heatmap at specified position."""
+        """Apply a 1D gaussian kernel to the heatmap at specified position, as its 2D outer product."""
         # Calculate slices for the kernel and target matrix
         y_slice, x_slice, kernel_y_slice, kernel_x_slice = self._calculate_kernel_slices(
             center_x, center_y, kernel_half_size)
 
-        # Check dimensions match before applying
-        kernel_part = kernel[kernel_y_slice, kernel_x_slice]
+        # Only the part of the stamp inside the frame is built
+        outer = torch.outer if self.heatmap_device == DEVICE_CUDA else np.outer
+        kernel_part = outer(kernel[kernel_y_slice] * float(intensity), kernel[kernel_x_slice])
         target_shape = self.persistent_heatmap[y_slice, x_slice].shape
 
-        if kernel_part.shape == target_shape:
-            self.persistent_heatmap[y_slice, x_slice] += kernel_part * intensity
+        # Check dimensions match before applying
+        if tuple(kernel_part.shape) == tuple(target_shape):
+            self.persistent_heatmap[y_slice, x_slice] += kernel_part
 
     def _calculate_kernel_slices(self, center_x, center_y, kernel_half_size):
         """Calculate slices for applying a kernel to the heatmap."""
@@ -640,69 +954,92 @@ class ZoneManager:
     def _render_heatmap(self, frame):
         """Convert the heatmap data to a viewable colored overlay and blend with the frame."""
         # Convert to viewable image
-        heatmap = cv2.normalize(self.persistent_heatmap, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+        if self.heatmap_device == DEVICE_CUDA:
+            heatmap = self._normalize_heatmap_gpu()
+        else:
+            heatmap = cv2.normalize(self.persistent_heatmap, self._heatmap_u8, 0, 255, cv2.NORM_MINMAX, cv2.CV_8U)
 
         # Apply CLAHE for better contrast distribution
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-        heatmap = clahe.apply(heatmap)
+        heatmap = self._clahe.apply(heatmap, self._heatmap_u8)
 
         # Apply colormap and blend
         colormap_name = self.heatmap_settings["colormap"].upper()
         colormap_flag = getattr(cv2, f"COLORMAP_{colormap_name}", cv2.COLORMAP_PARULA)
-        heatmap_colored = cv2.applyColorMap(heatmap, colormap_flag)
+        heatmap_colored = cv2.applyColorMap(heatmap, colormap_flag, self._heatmap_colored)
 
         # Blend with original frame
         opacity = self.heatmap_settings["heatmap_opacity"]
         return cv2.addWeighted(frame, 1 - opacity, heatmap_colored, opacity, 0)
 
+    def _normalize_heatmap_gpu(self):
+        """Min-max scales the GPU heatmap to uint8 on the device and copies only that to the host."""
+        heatmap = self.persistent_heatmap
+        low, high = heatmap.min(), heatmap.max()
+        scaled = (heatmap - low).mul_(255.0 / (high - low).clamp_min(1e-6))
+        self._heatmap_host.copy_(scaled.to(torch.uint8))
+        return self._heatmap_host.numpy()
+
+    def _blur_heatmap_gpu(self):
+        """Applies the 5x5 gaussian blur to the GPU heatmap, reflecting at the borders like OpenCV."""
+        padded = F.pad(self.persistent_heatmap[None, None], (2, 2, 2, 2), mode="reflect")
+        return F.conv2d(padded, self._heatmap_blur_kernel)[0, 0]
+
     def _filter_heatmap_detections(self, detections):
         """Filter detections to include only those relevant for the heatmap."""
         if len(detections) == 0:
             return detections
 
-        target_heatmap_classes = ["person", "bicycle", "car", "motorcycle", "bus", "truck"]
         if self.zone_model:
-            target_heatmap_class_ids = [class_id for class_id, name in self.zone_model.names.items()
-                                    if name in target_heatmap_classes]
-            filtered_heatmap_indices = np.isin(detections.class_id, target_heatmap_class_ids)
-            return detections[filtered_heatmap_indices]
+            return detections[self._get_class_tables()["target"][detections.class_id]]
         return detections
 
     def _update_heatmap_with_detections(self, detections):
-        """Update the heatmap with detected objects."""
+        """
+        Update the heatmap with detected objects. Centers, sizes and kernel sigmas are computed
+        for all detections at once; the stamps are added in a numba loop on CPU when it is installed.
+        """
         if len(detections) == 0:
             return
 
-        # Process all relevant detections
-        for i in range(len(detections)):
-            xyxy = detections.xyxy[i].astype(int)
-            class_id = detections.class_id[i]
-
-            # Calculate object center and dimensions
-            x1, y1, x2, y2 = xyxy
-            center_x = (x1 + x2) // 2
-            center_y = (y1 + y2) // 2
-            obj_size = self._calculate_object_dimensions(xyxy)
-
-            # Get dynamic kernel based on object size
-            _, kernel, kernel_half_size = self._get_dynamic_kernel(obj_size)
-
-            # Calculate intensity factor based on object class
-            intensity = self._get_object_intensity(class_id, obj_size)
+        xyxy = detections.xyxy.astype(int)
+        widths = xyxy[:, 2] - xyxy[:, 0]
+        heights = xyxy[:, 3] - xyxy[:, 1]
+        centers_x = (xyxy[:, 0] + xyxy[:, 2]) // 2
+        centers_y = (xyxy[:, 1] + xyxy[:, 3]) // 2
+        obj_sizes = np.sqrt(widths * heights)
+        # Kernel spread follows object size, clamped to a usable range
+        sigmas = np.clip(self.heatmap_settings["kernel_sigma"] * (obj_sizes / 100), 5, 50)
+
+        intensities = self._get_object_intensities(detections.class_id, obj_sizes).tolist()
+        kernels = [self._get_gaussian_kernel(sigma) for sigma in sigmas.tolist()]
+
+        # With numba installed, all CPU stamps are added in one compiled loop
+        if stamp_kernels is not None and self.heatmap_device != DEVICE_CUDA:
+            unique_kernels = list({id(kernel): kernel for kernel in kernels}.values())
+            kernel_index = {id(kernel): index for index, kernel in enumerate(unique_kernels)}
+            packed_kernels, kernel_halves = pack_kernels(unique_kernels)
+            stamp_kernels(self.persistent_heatmap, packed_kernels, kernel_halves,
+                          np.array([kernel_index[id(kernel)] for kernel in kernels], dtype=np.int64),
+                          centers_x.astype(np.int64), centers_y.astype(np.int64),
+                          np.array(intensities, dtype=np.float32))
+            return
 
-            # Apply kernel to heatmap
-            self._apply_kernel_to_heatmap(center_x, center_y, kernel, kernel_half_size, intensity)
+        for center_x, center_y, kernel, intensity in zip(centers_x.tolist(), centers_y.tolist(), kernels, intensities):
+            self._apply_kernel_to_heatmap(center_x, center_y, kernel, kernel.shape[0] // 2, intensity)
 
     def generate_heatmap(self, frame: np.ndarray, detections: sv.Detections) -> np.ndarray:
         """
         Generates a heatmap based on object detections with
         intensity distribution and smoother transitions.
         """
-        heatmap_frame = frame.copy()
-
         # Apply decay even without detections
         decay_mask = self.persistent_heatmap > 0.1
-        self.persistent_heatmap[decay_mask] *= self.heatmap_settings["heatmap_decay"]
+        if self.heatmap_device == DEVICE_CUDA:
+            self.persistent_heatmap[decay_mask] *= self.heatmap_settings["heatmap_decay"]
+        else:
+            # Multiply in place under the mask instead of gathering and scattering the decayed values
+            np.multiply(self.persistent_heatmap, self.heatmap_settings["heatmap_decay"],
+                        out=self.persistent_heatmap, where=decay_mask)
 
         # Filter detections for heatmap
         heatmap_detections = self._filter_heatmap_detections(detections)
@@ -711,10 +1048,14 @@ class ZoneManager:
         self._update_heatmap_with_detections(heatmap_detections)
 
         # Apply gaussian blur for smoother transitions
-        self.persistent_heatmap = cv2.GaussianBlur(self.persistent_heatmap, (5, 5), 0)
+        if self.heatmap_device == DEVICE_CUDA:
+            self.persistent_heatmap = self._blur_heatmap_gpu()
+        else:
+            cv2.GaussianBlur(self.persistent_heatmap, (5, 5), 0, dst=self.persistent_heatmap)
 
         # Render the heatmap
-        return self._render_heatmap(heatmap_frame)
+        # Blending writes a new image, so the frame itself is left untouched
+        return self._render_heatmap(frame)
 
     def save_zones(self, file_path: str):
         """Saves zone configuration to a JSON file, including both vehicle and pedestrian zones."""
@@ -728,27 +1069,22 @@ class ZoneManager:
                 'polygon': zone_info['zone'].polygon.tolist()
             }
         try:
-            with open(file_path, 'w') as f:
-                json.dump(zone_data, f, indent=4)
+            save_json_file(zone_data, file_path)
         except Exception as e:
             raise Exception(f"Error saving zones to {file_path}: {e}")
 
     def load_zones(self, file_path: str) -> bool:
         """Loads zone configuration from a JSON file, loading both vehicle and pedestrian zones."""
         try:
-            with open(file_path, 'r') as f:
-                zone_data = json.load(f)
+            zone_data = load_json_file(file_path)
             self.zones = {ZONE_TYPE_VEHICLE: {}, ZONE_TYPE_PEDESTRIAN: {}}
             if 'vehicle_zones' in zone_data:
                 for zone_name, data in zone_data['vehicle_zones'].items():
-                    self.zones[ZONE_TYPE_VEHICLE][zone_name] = {
-                        'zone': sv.PolygonZone(polygon=np.array(data['polygon']))
-                    }
+                    self.zones[ZONE_TYPE_VEHICLE][zone_name] = self._create_zone_info(np.array(data['polygon']))
             if 'pedestrian_zones' in zone_data:
                 for zone_name, data in zone_data['pedestrian_zones'].items():
-                    self.zones[ZONE_TYPE_PEDESTRIAN][zone_name] = {
-                        'zone': sv.PolygonZone(polygon=np.array(data['polygon']))
-                    }
+                    self.zones[ZONE_TYPE_PEDESTRIAN][zone_name] = self._create_zone_info(np.array(data['polygon']))
+            self._allocate_zone_counters()
             return True
         except FileNotFoundError:
             logger.error(f"Zone configuration file not found: {file_path}")
@@ -760,56 +1096,67 @@ class ZoneManager:
             logger.error(f"Error loading zones from {file_path}: {e}")
             return False
 
+    def _allocate_zone_counters(self):
+        """Sizes the per-zone count arrays to the current zones; rows follow zone insertion order."""
+        # Zone masks are stacked again on the next lookup
+        self._stacked_zone_names = []
+        self._stacked_zone_masks = None
+        self.vehicle_zone_names = tuple(self.zones[ZONE_TYPE_VEHICLE])
+        self.pedestrian_zone_names = tuple(self.zones[ZONE_TYPE_PEDESTRIAN])
+        self.zone_vehicle_count_array = np.zeros((len(self.vehicle_zone_names), len(VEHICLE_CLASSES)), dtype=np.int32)
+        self.zone_pedestrian_count_array = np.zeros(len(self.pedestrian_zone_names), dtype=np.int32)
+
     def update_counts(self, detections: sv.Detections):
         """Updates vehicle and pedestrian counts for each zone based on detections."""
-        # Reset all counters
-        self.vehicle_counts = {k: 0 for k in self.vehicle_counts}
-        self.pedestrian_count = 0
-
-        self.zone_vehicle_counts = {
-            zone_name: {k: 0 for k in self.vehicle_counts}
-            for zone_name in self.zones[ZONE_TYPE_VEHICLE]
-        }
-        self.zone_pedestrian_counts = {
-            zone_name: 0 for zone_name in self.zones[ZONE_TYPE_PEDESTRIAN]
-        }
+        # Reset all counters in place
+        self.zone_vehicle_count_array.fill(0)
+        self.zone_pedestrian_count_array.fill(0)
 
         if len(detections) == 0:
             return
 
-        # Count detections in each zone
-        for i, (_, class_id) in enumerate(zip(detections.xyxy, detections.class_id)):
-            class_name = self.zone_model.names[class_id]
-
-            # Check vehicle zones
-            for zone_name, zone_info in self.zones[ZONE_TYPE_VEHICLE].items():
-                if zone_info['zone'].trigger(detections[i:i+1]):
-                    if class_name in self.vehicle_counts:
-                        self.zone_vehicle_counts[zone_name][class_name] += 1
-                        self.vehicle_counts[class_name] += 1
-
-            # Check pedestrian zones
-            if class_name == "person":
-                for zone_name, zone_info in self.zones[ZONE_TYPE_PEDESTRIAN].items():
-                    if zone_info['zone'].trigger(detections[i:i+1]):
-                        self.zone_pedestrian_counts[zone_name] += 1
-                        self.pedestrian_count += 1
+        # Per-detection vehicle class column (-1 for non-vehicles) and pedestrian flag
+        class_tables = self._get_class_tables()
+        vehicle_indices = class_tables["vehicle_index"][detections.class_id]
+        is_vehicle = vehicle_indices >= 0
+        is_person = class_tables["person"][detections.class_id]
+
+        # Count detections in each zone with one mask lookup per zone
+        xs, ys = self._zone_anchor_points(detections)
+        for zone_index, zone_info in enumerate(self.zones[ZONE_TYPE_VEHICLE].values()):
+            in_zone = zone_info['mask'][ys, xs] & is_vehicle
+            self.zone_vehicle_count_array[zone_index] += np.bincount(
+                vehicle_indices[in_zone], minlength=len(VEHICLE_CLASSES))
+        for zone_index, zone_info in enumerate(self.zones[ZONE_TYPE_PEDESTRIAN].values()):
+            self.zone_pedestrian_count_array[zone_index] = np.count_nonzero(zone_info['mask'][ys, xs] & is_person)
+
+    def get_count_snapshot(self):
+        """
+        Returns copies of the per-zone vehicle counts (zones x VEHICLE_CLASSES), pedestrian counts
+        and alert flags, small enough to hand to the GUI thread every frame.
+        """
+        return (self.zone_vehicle_count_array.copy(),
+                self.zone_pedestrian_count_array.copy(),
+                self.alert_flags.copy())
 
     def get_zone_vehicle_counts(self):
         """Returns vehicle counts for each vehicle zone."""
-        return self.zone_vehicle_counts
+        return {
+            zone_name: dict(zip(VEHICLE_CLASSES, row))
+            for zone_name, row in zip(self.vehicle_zone_names, self.zone_vehicle_count_array.tolist())
+        }
 
     def get_zone_pedestrian_counts(self):
         """Returns pedestrian counts for each pedestrian zone."""
-        return self.zone_pedestrian_counts
+        return dict(zip(self.pedestrian_zone_names, self.zone_pedestrian_count_array.tolist()))
 
     def get_vehicle_counts(self):
         """Returns total vehicle counts across all zones."""
-        return self.vehicle_counts
+        return dict(zip(VEHICLE_CLASSES, self.zone_vehicle_count_array.sum(axis=0).tolist()))
 
     def get_pedestrian_count(self):
         """Returns total pedestrian count across all zones."""
-        return self.pedestrian_count
+        return int(self.zone_pedestrian_count_array.sum())
 
     def is_emergency_detected(self):
         """Returns whether any emergency vehicle is detected."""
@@ -835,28 +1182,31 @@ class ZoneManager:
         """Returns whether an accident is detected."""
         return self.accident_detected
 
-    def calculate_speed(self, track_id, center_point, history_dict, speed_data_dict):
-        """Calculates speed of an object based on its movement history."""
-        if track_id not in history_dict:
-            history_dict[track_id] = []
+    def _new_speed_window(self):
+        """Creates the ring buffer of recent speeds that a track's speed is averaged over."""
+        return deque(maxlen=self.speed_smoothing_window)
 
-        history_dict[track_id].append((center_point, time.time()))
+    def calculate_speed(self, track_id, center_point, history_dict, speed_data_dict, timestamp=None):
+        """Calculates speed of an object based on its movement history."""
+        if timestamp is None:
+            timestamp = time.time()
+        history = history_dict.get(track_id)
+        if history is None:
+            history = history_dict[track_id] = deque(maxlen=self.track_history_length)
 
-        max_history = 30
-        if len(history_dict[track_id]) > max_history:
-            history_dict[track_id] = history_dict[track_id][-max_history:]
+        history.append((center_point, timestamp))
 
-        if len(history_dict[track_id]) < 2:
+        if len(history) < 2:
             return 0.0
 
         # Calculate speed based on pixel distance and time difference
-        prev_pos, prev_time = history_dict[track_id][-2]
-        curr_pos, curr_time = history_dict[track_id][-1]
+        prev_pos, prev_time = history[-2]
+        curr_pos, curr_time = history[-1]
         time_diff = curr_time - prev_time
         if time_diff <= 0:
             return 0.0
 
-        pixel_distance = np.sqrt((curr_pos[0] - prev_pos[0])**2 + (curr_pos[1] - prev_pos[1])**2)
+        pixel_distance = math.hypot(curr_pos[0] - prev_pos[0], curr_pos[1] - prev_pos[1])
 
         # Convert pixels to meters using pixels per meter ratio
         meters = pixel_distance / self.ppm
@@ -866,24 +1216,20 @@ class ZoneManager:
         speed_kmh = speed_mps * 3.6
 
         # Apply smoothing using moving average
-        speed_data_dict[track_id].append(speed_kmh)
-        if len(speed_data_dict[track_id]) > self.speed_smoothing_window:
-            speed_data_dict[track_id] = speed_data_dict[track_id][-self.speed_smoothing_window:]
-
-        smoothed_speed = sum(speed_data_dict[track_id]) / len(speed_data_dict[track_id])
+        speeds = speed_data_dict[track_id]
+        speeds.append(speed_kmh)
+        smoothed_speed = sum(speeds) / len(speeds)
         return max(0, min(200, smoothed_speed))
 
     def clean_tracking_history(self, active_track_ids, history_dict, speed_data_dict):
         """Removes history for tracks that are no longer active."""
-        tracked_ids = list(history_dict.keys())
-        current_tracks = set(active_track_ids)
+        if isinstance(active_track_ids, np.ndarray):
+            active_track_ids = active_track_ids.tolist()
+        stale_ids = history_dict.keys() - set(active_track_ids)
 
-        for track_id in tracked_ids:
-            if track_id not in current_tracks:
-                if track_id in history_dict:
-                    del history_dict[track_id]
-                if track_id in speed_data_dict:
-                    del speed_data_dict[track_id]
+        for track_id in stale_ids:
+            del history_dict[track_id]
+            speed_data_dict.pop(track_id, None)
 
     def filter_detections_by_confidence(self, detections, threshold):
         """Filter detections based on confidence threshold."""
@@ -895,8 +1241,10 @@ class ZoneManager:
 
     def _cleanup_stale_tracks(self):
         """Performs periodic cleanup of tracking data structures to prevent memory leaks."""
-        # Get current time for age-based cleanup
-        current_time = time.time()
+        # Track timestamps are frame times, so tracks are aged against the latest frame rather than the wall clock
+        current_time = self.latest_frame_time
+        if current_time is None:
+            return
         max_age = 60
 
         # Clean track history dictionaries
@@ -908,8 +1256,9 @@ class ZoneManager:
                     continue
 
                 # Check age of the most recent position
+                # Times ahead of the latest frame were left by an earlier run of the video
                 _, last_update_time = history_dict[track_id][-1]
-                if current_time - last_update_time > max_age:
+                if current_time - last_update_time > max_age or last_update_time > current_time:
                     del history_dict[track_id]
 
         # Clean speed data dictionaries
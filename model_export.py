@@ -0,0 +1,237 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+import hashlib
+import json
+import os
+from functools import lru_cache
+
+from utils.constants import (CALIBRATION_DIR, DEFAULT_BATCH_SIZE, DEFAULT_INT8_CALIBRATION_FRAMES,
+                             EXPORT_FORMAT_ENGINE, EXPORT_FORMAT_ONNX, EXPORT_FORMAT_OPENVINO,
+                             EXPORT_FORMAT_TORCHSCRIPT)
+from logger import get_logger
+
+logger = get_logger()
+
+EXPORT_FORMAT_NAMES = {
+    EXPORT_FORMAT_ENGINE: "TensorRT",
+    EXPORT_FORMAT_ONNX: "ONNX",
+    EXPORT_FORMAT_TORCHSCRIPT: "TorchScript",
+    EXPORT_FORMAT_OPENVINO: "OpenVINO INT8",
+}
+
+@lru_cache(maxsize=16)
+def _file_digest(model_path: str, mtime: float, size: int) -> str:
+    """Returns a short content hash of a weights file; cached per path, mtime and size."""
+    digest = hashlib.sha1()
+    with open(model_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:10]
+
+def get_model_digest(model_path: str) -> str:
+    """Returns the content hash used to key calibrated engines to their source weights."""
+    stat = os.stat(model_path)
+    return _file_digest(model_path, stat.st_mtime, stat.st_size)
+
+def get_engine_path(model_path: str, imgsz: int, batch: int, int8: bool = False, half: bool = True) -> str:
+    """
+    Returns the cached TensorRT engine path stored next to the given weights.
+    Engines are built with static shapes, so they are keyed by precision, image size and batch size.
+    INT8 engines are also keyed by weights hash, since calibration is expensive.
+    """
+    stem, _ = os.path.splitext(model_path)
+    if int8:
+        return f"{stem}_int8_{imgsz}_b{batch}_{get_model_digest(model_path)}.engine"
+    precision = "fp16" if half else "fp32"
+    return f"{stem}_{precision}_{imgsz}_b{batch}.engine"
+
+def get_export_path(model_path: str, imgsz: int, batch: int, export_format: str) -> str:
+    """
+    Returns the cached ONNX or TorchScript model path stored next to the given weights.
+    Both are exported with static shapes, so the path is keyed by image size and batch size.
+    """
+    stem, _ = os.path.splitext(model_path)
+    return f"{stem}_{imgsz}_b{batch}.{export_format}"
+
+def get_openvino_int8_path(model_path: str, imgsz: int, batch: int) -> str:
+    """
+    Returns the cached INT8 OpenVINO model directory for the given weights, keyed like INT8 engines.
+    The _openvino_model suffix is how Ultralytics recognises the format when loading.
+    """
+    stem, _ = os.path.splitext(model_path)
+    return f"{stem}_int8_{imgsz}_b{batch}_{get_model_digest(model_path)}_openvino_model"
+
+def has_calibration_data(inference_settings: dict) -> bool:
+    """Returns True when a calibration dataset YAML is configured and exists."""
+    calibration_data = inference_settings.get("int8_calibration_data", "")
+    return bool(calibration_data) and os.path.exists(calibration_data)
+
+def get_export_precision(inference_settings: dict, calibration_video: str = None):
+    """
+    Returns the (int8, half) precision the engine will be built with.
+    INT8 is only used when a calibration dataset or a video to sample one from is available.
+    """
+    if inference_settings.get("tensorrt_int8", False):
+        if has_calibration_data(inference_settings) or calibration_video:
+            return True, False
+        logger.warning("INT8 export requested without calibration data, exporting FP16 instead")
+        return False, True
+    return False, inference_settings.get("half", True)
+
+def build_calibration_dataset(video_path: str, names: dict, imgsz: int,
+                              num_frames: int = DEFAULT_INT8_CALIBRATION_FRAMES) -> str:
+    """
+    Samples frames evenly across a video into an image folder and writes a dataset YAML
+    for Ultralytics INT8 calibration. Returns the YAML path; existing datasets are reused.
+    """
+    import cv2
+
+    video_stem = os.path.splitext(os.path.basename(video_path))[0]
+    dataset_dir = os.path.abspath(os.path.join(CALIBRATION_DIR, video_stem))
+    images_dir = os.path.join(dataset_dir, "images")
+    yaml_path = os.path.join(dataset_dir, "calib.yaml")
+    if os.path.exists(yaml_path):
+        return yaml_path
+
+    os.makedirs(images_dir, exist_ok=True)
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise IOError(f"Could not open calibration video: {video_path}")
+
+    try:
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        step = max(1, total_frames // num_frames) if total_frames > 0 else 1
+        saved = 0
+        frame_index = 0
+        while saved < num_frames:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            if frame_index % step == 0:
+                # Store at model resolution; the calibrator letterboxes to imgsz anyway
+                scale = imgsz / max(frame.shape[:2])
+                if scale < 1.0:
+                    frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+                cv2.imwrite(os.path.join(images_dir, f"{saved:05d}.jpg"), frame)
+                saved += 1
+            frame_index += 1
+    finally:
+        cap.release()
+
+    if saved == 0:
+        raise IOError(f"No frames could be read from calibration video: {video_path}")
+
+    with open(yaml_path, "w") as f:
+        f.write(f"path: {json.dumps(dataset_dir)}\n")
+        f.write("train: images\n")
+        f.write("val: images\n")
+        f.write("names:\n")
+        for class_id, name in names.items():
+            f.write(f"  {class_id}: {json.dumps(name)}\n")
+
+    logger.info(f"Built INT8 calibration set with {saved} frames: {yaml_path}")
+    return yaml_path
+
+class ModelExportThread(QThread):
+    """
+    Thread for exporting a PyTorch model to a TensorRT engine, ONNX, TorchScript or INT8 OpenVINO
+    without blocking the GUI.
+    The exported file is moved next to the source weights under a precision- or size-tagged name.
+    """
+    export_finished_signal = pyqtSignal(str, str)
+    export_failed_signal = pyqtSignal(str, str)
+    status_message_signal = pyqtSignal(str)
+
+    def __init__(self, model_type, model_path, inference_settings, calibration_video=None,
+                 export_format=EXPORT_FORMAT_ENGINE):
+        super().__init__()
+        self.model_type = model_type
+        self.model_path = model_path
+        self.inference_settings = inference_settings
+        self.calibration_video = calibration_video
+        self.export_format = export_format
+
+    def _export_options(self, model):
+        """Builds the Ultralytics export arguments from the inference settings."""
+        if self.export_format == EXPORT_FORMAT_ONNX:
+            # Static shapes let ONNX Runtime plan its memory once; FP16 only pays off on GPUs
+            return {
+                "format": "onnx",
+                "imgsz": self.inference_settings["imgsz"],
+                "half": False,
+                "dynamic": False,
+                "simplify": True,
+                "batch": self.inference_settings.get("batch_size", DEFAULT_BATCH_SIZE),
+                "device": "cpu",
+            }
+        if self.export_format == EXPORT_FORMAT_TORCHSCRIPT:
+            # Traced at a fixed shape; the traced graph drops the Python control flow of the eager model
+            return {
+                "format": "torchscript",
+                "imgsz": self.inference_settings["imgsz"],
+                "batch": self.inference_settings.get("batch_size", DEFAULT_BATCH_SIZE),
+                "device": "cpu",
+            }
+        if self.export_format == EXPORT_FORMAT_OPENVINO:
+            # Statically quantized with NNCF on frames from the calibration set
+            return {
+                "format": "openvino",
+                "imgsz": self.inference_settings["imgsz"],
+                "int8": True,
+                "dynamic": False,
+                "batch": self.inference_settings.get("batch_size", DEFAULT_BATCH_SIZE),
+                "device": "cpu",
+                "data": self._calibration_data(model),
+            }
+
+        int8, half = get_export_precision(self.inference_settings, self.calibration_video)
+        options = {
+            "format": "engine",
+            "imgsz": self.inference_settings["imgsz"],
+            "half": half,
+            "int8": int8,
+            "device": 0,
+            "workspace": self.inference_settings.get("tensorrt_workspace", 4),
+            "dynamic": False,
+            "batch": self.inference_settings.get("batch_size", DEFAULT_BATCH_SIZE),
+        }
+        if int8:
+            options["data"] = self._calibration_data(model)
+        return options
+
+    def _calibration_data(self, model):
+        """Returns the configured calibration dataset, or one sampled from the calibration video."""
+        if has_calibration_data(self.inference_settings):
+            return self.inference_settings["int8_calibration_data"]
+        self.status_message_signal.emit("Sampling video frames for INT8 calibration...")
+        return build_calibration_dataset(self.calibration_video, model.names, self.inference_settings["imgsz"])
+
+    def _target_path(self, options):
+        """Returns the cache path the exported file is stored under."""
+        if self.export_format == EXPORT_FORMAT_OPENVINO:
+            return get_openvino_int8_path(self.model_path, options["imgsz"], options["batch"])
+        if self.export_format != EXPORT_FORMAT_ENGINE:
+            return get_export_path(self.model_path, options["imgsz"], options["batch"], self.export_format)
+        return get_engine_path(self.model_path, options["imgsz"], options["batch"],
+                               int8=options["int8"], half=options["half"])
+
+    def run(self):
+        """Exports the model and reports the resulting engine path."""
+        format_name = EXPORT_FORMAT_NAMES[self.export_format]
+        try:
+            from ultralytics import YOLO
+
+            # Export from a separate model instance so the loaded one keeps serving inference
+            model = YOLO(self.model_path, task="detect")
+            options = self._export_options(model)
+            engine_path = self._target_path(options)
+            self.status_message_signal.emit(f"Exporting {os.path.basename(self.model_path)} to {format_name}...")
+            logger.info(f"Exporting {self.model_path} to {format_name} model {engine_path}")
+
+            exported_path = model.export(**options)
+            os.replace(exported_path, engine_path)
+
+            logger.info(f"{format_name} export finished: {engine_path}")
+            self.export_finished_signal.emit(self.model_type, engine_path)
+        except Exception as e:
+            logger.error(f"{format_name} export failed for {self.model_path}: {e}")
+            self.export_failed_signal.emit(self.model_type, str(e))
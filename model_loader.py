@@ -0,0 +1,63 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+import os
+
+from utils.constants import MODEL_TYPE_ZONE, MODEL_TYPE_EMERGENCY, MODEL_TYPE_ACCIDENT, MODEL_TYPE_FUSED
+from logger import get_logger
+
+logger = get_logger()
+
+class ModelLoaderWorker(QThread):
+    """
+    Thread for loading and warming up the detection models without blocking the GUI.
+    Each model is reported as soon as it is ready. A fused model stands in for all three,
+    so the individual models are only loaded when it is not configured or fails to load.
+    An interruption request stops the load before the next model.
+    """
+    model_loaded = pyqtSignal(str, object)
+    model_failed = pyqtSignal(str, str, str)
+    status_message_signal = pyqtSignal(str)
+    all_done = pyqtSignal()
+
+    def __init__(self, model_paths, device, load_fn, warmup_fn):
+        super().__init__()
+        self.model_paths = dict(model_paths)
+        self.device = device
+        self.load_fn = load_fn
+        self.warmup_fn = warmup_fn
+
+    def _load(self, model_type, model_path):
+        """Loads and warms up one model, emitting the result; returns the model or None."""
+        label = model_type.replace("_model", "")
+        if not model_path:
+            logger.debug(f"{label.capitalize()} model path not set")
+            return None
+        if not os.path.exists(model_path):
+            message = f"{label.capitalize()} model path not found: {model_path}"
+            logger.warning(message)
+            self.status_message_signal.emit(message)
+            return None
+
+        self.status_message_signal.emit(f"Loading {label} model...")
+        try:
+            model = self.load_fn(model_path, self.device)
+        except Exception as e:
+            logger.error(f"Error loading model {model_path}: {e}")
+            self.model_failed.emit(model_type, model_path, str(e))
+            return None
+
+        # Pay compilation and kernel selection costs here rather than on the first video frame
+        self.warmup_fn(model, self.device)
+        self.model_loaded.emit(model_type, model)
+        return model
+
+    def run(self):
+        """Loads the fused model if configured, otherwise the three individual models."""
+        try:
+            if self._load(MODEL_TYPE_FUSED, self.model_paths.get(MODEL_TYPE_FUSED)):
+                return
+            for model_type in (MODEL_TYPE_ZONE, MODEL_TYPE_EMERGENCY, MODEL_TYPE_ACCIDENT):
+                if self.isInterruptionRequested():
+                    return
+                self._load(model_type, self.model_paths.get(model_type))
+        finally:
+            self.all_done.emit()
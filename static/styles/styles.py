@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+@lru_cache(maxsize=1)
 def get_stylesheet() -> str:
     """Returns the updated stylesheet for the application with brown and beige theme styling."""
     return """
@@ -0,0 +1,57 @@
+"""
+Traffic Vision log reader.
+Decodes the binary msgpack log files written by the application into readable text.
+"""
+import argparse
+import logging
+import sys
+import time
+
+import msgpack
+
+def format_entry(entry: dict) -> str:
+    """Renders one decoded record in the same layout as the text log file."""
+    created = entry.get("t", 0.0)
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created))
+    msecs = int((created - int(created)) * 1000)
+    line = (
+        f"{timestamp},{msecs:03d} - {entry.get('n', '')} - "
+        f"{logging.getLevelName(entry.get('lvl', logging.NOTSET))} - "
+        f"{entry.get('f', '')}:{entry.get('l', 0)} - {entry.get('m', '')}"
+    )
+    if entry.get("x"):
+        line = f"{line}\n{entry['x']}"
+    return line
+
+def cat_file(path: str, min_level: int, out=sys.stdout):
+    """Streams records from a log file without loading the whole file into memory."""
+    with open(path, "rb") as f:
+        unpacker = msgpack.Unpacker(f, raw=False)
+        for entry in unpacker:
+            if entry.get("lvl", logging.NOTSET) >= min_level:
+                out.write(format_entry(entry) + "\n")
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Decode Traffic Vision msgpack log files.")
+    parser.add_argument("files", nargs="+", help="Log files (.mpk) to decode")
+    parser.add_argument("--level", default="DEBUG",
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+                        help="Minimum level to print")
+    args = parser.parse_args()
+
+    min_level = logging.getLevelName(args.level)
+    try:
+        for path in args.files:
+            cat_file(path, min_level)
+    except BrokenPipeError:
+        # Output was piped into a pager or head that closed early
+        sys.stderr.close()
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"Error reading log: {e}\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
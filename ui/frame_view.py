@@ -0,0 +1,109 @@
+from PyQt6.QtCore import Qt, QRect, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QPainter
+from PyQt6.QtWidgets import QSizePolicy, QWidget
+
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget as _FrameViewBase
+except ImportError:
+    # Without OpenGL support the frames are drawn by the raster paint engine instead
+    _FrameViewBase = QWidget
+
+SMOOTH_REPAINT_DELAY_MS = 120
+
+class FrameView(_FrameViewBase):
+    """
+    Displays video frames by drawing them straight onto an OpenGL viewport.
+    Frames arrive as QImages built off the GUI thread, and the GPU resamples them
+    to the widget size, so no scaled QPixmap is built per frame.
+    display_size_changed reports the size frames are drawn at, so producers can downscale to it.
+    """
+    display_size_changed = pyqtSignal(int, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setMinimumSize(320, 240)
+        self.aspect_ratio_mode = Qt.AspectRatioMode.KeepAspectRatio
+        self.background = QColor(Qt.GlobalColor.black)
+
+        self._image = None
+        self._target_rect = QRect()
+
+        # Smooth scaling is free when OpenGL samples the texture. The raster fallback draws
+        # with fast scaling while frames stream in and repaints smoothly once they pause.
+        self._smooth = _FrameViewBase is not QWidget
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(SMOOTH_REPAINT_DELAY_MS)
+        self._smooth_timer.timeout.connect(self._repaint_smooth)
+
+    def set_aspect_ratio_mode(self, aspect_ratio_mode):
+        """Sets how frames are fitted into the view."""
+        if aspect_ratio_mode != self.aspect_ratio_mode:
+            self.aspect_ratio_mode = aspect_ratio_mode
+            self._update_target_rect()
+            self.update()
+
+    def set_image(self, image: QImage):
+        """Shows a frame; the image must own its pixels, since it is kept until the next one arrives."""
+        size_changed = self._image is None or self._image.size() != image.size()
+        self._image = image
+        if size_changed:
+            self._update_target_rect()
+        if _FrameViewBase is QWidget:
+            self._smooth = False
+            self._smooth_timer.start()
+        self.update()
+
+    def _repaint_smooth(self):
+        """Redraws the current frame with smooth scaling after the stream has paused."""
+        self._smooth = True
+        self.update()
+
+    def clear(self):
+        """Removes the current frame from the view."""
+        self._image = None
+        self.update()
+
+    def _update_target_rect(self):
+        """Recomputes where the frame is drawn; only needed when the view, frame size or mode changes."""
+        if self._image is None:
+            return
+        target_size = self._image.size().scaled(self.size(), self.aspect_ratio_mode)
+        previous_size = self._target_rect.size()
+        self._target_rect = QRect(
+            (self.width() - target_size.width()) // 2,
+            (self.height() - target_size.height()) // 2,
+            target_size.width(),
+            target_size.height()
+        )
+        if target_size != previous_size:
+            self.display_size_changed.emit(target_size.width(), target_size.height())
+
+    def target_size(self):
+        """Returns the (width, height) frames are drawn at, or None before the first frame."""
+        if self._target_rect.isEmpty():
+            return None
+        return self._target_rect.width(), self._target_rect.height()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_target_rect()
+
+    def _paint_frame(self):
+        """Draws the current frame centered in the view."""
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.background)
+        if self._image is not None:
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, self._smooth)
+            painter.drawImage(self._target_rect, self._image)
+        painter.end()
+
+    def paintGL(self):
+        self._paint_frame()
+
+    def paintEvent(self, event):
+        if _FrameViewBase is QWidget:
+            self._paint_frame()
+        else:
+            super().paintEvent(event)
@@ -1,6 +1,9 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QGroupBox, QGridLayout,
                              QLabel, QFrame, QScrollArea)
-from typing import Dict
+from typing import Sequence
+import numpy as np
+
+from utils.constants import VEHICLE_CLASSES
 
 class MonitoringTab(QWidget):
     def __init__(self, parent=None):
@@ -18,6 +21,8 @@ class MonitoringTab(QWidget):
         self.accident_detected = False
         self.zone_vehicle_counts = {}
         self.zone_pedestrian_counts = {}
+        # Last snapshot applied; sections whose values are unchanged are not rebuilt
+        self._last_snapshot = {}
 
     def setup_ui(self):
         layout = QVBoxLayout()
@@ -80,19 +85,51 @@ class MonitoringTab(QWidget):
         layout.addWidget(scroll)
         self.setLayout(layout)
 
-    def update_zone_vehicle_counts(self, zone_counts: Dict[str, Dict[str, int]]):
-        """Updates statistics for vehicle zones, showing all zones even if empty."""
+    def apply_detection_snapshot(self, snapshot: dict):
+        """
+        Applies one frame's monitoring state in a single call, refreshing only the sections that changed.
+        snapshot holds vehicle_zones and pedestrian_zones as (zone names, count rows) tuples,
+        emergency and accident flags, and the intersections info (None when no controller is set).
+        """
+        last = self._last_snapshot
+
+        vehicle_zones = snapshot["vehicle_zones"]
+        if vehicle_zones != last.get("vehicle_zones"):
+            names, counts = vehicle_zones
+            self.update_zone_vehicle_counts(names, np.asarray(counts, dtype=np.int64))
+
+        pedestrian_zones = snapshot["pedestrian_zones"]
+        if pedestrian_zones != last.get("pedestrian_zones"):
+            names, counts = pedestrian_zones
+            self.update_zone_pedestrian_counts(names, np.asarray(counts, dtype=np.int64))
+
+        if snapshot["emergency"] != last.get("emergency"):
+            self.set_emergency_detected(snapshot["emergency"])
+        if snapshot["accident"] != last.get("accident"):
+            self.set_accident_detected(snapshot["accident"])
+
+        intersections = snapshot["intersections"]
+        if intersections is not None and intersections != last.get("intersections"):
+            self.update_traffic_light_status(intersections)
+
+        self._last_snapshot = snapshot
+
+    def update_zone_vehicle_counts(self, zone_names: Sequence[str], zone_counts: np.ndarray):
+        """
+        Updates statistics for vehicle zones, showing all zones even if empty.
+        zone_counts holds one row per zone and one column per entry of VEHICLE_CLASSES.
+        """
         self.clear_layout(self.vehicle_zones_layout)
 
-        if not zone_counts:
+        if not zone_names:
             self.vehicle_zones_layout.addWidget(self.create_no_zones_message("vehicle"))
             return
 
-        for zone_name, counts in zone_counts.items():
+        for zone_name, counts in zip(zone_names, zone_counts.tolist()):
             zone_group = QGroupBox(zone_name)
             zone_layout = QGridLayout()
 
-            total_vehicles = sum(counts.values())
+            total_vehicles = sum(counts)
             density = self.calculate_traffic_density(total_vehicles)
 
             # Add density indicator
@@ -101,22 +138,22 @@ class MonitoringTab(QWidget):
             zone_layout.addWidget(density_label, 0, 0, 1, 2)
 
             # Add all vehicle counts with consistent styling
-            for row, (vehicle_type, count) in enumerate(counts.items(), 1):
+            for row, (vehicle_type, count) in enumerate(zip(VEHICLE_CLASSES, counts), 1):
                 count_style = "font-weight: bold; color: #4a90e2;" if count > 0 else "color: gray;"
                 self.add_count_row(zone_layout, vehicle_type.capitalize(), count, count_style, row)
 
             zone_group.setLayout(zone_layout)
             self.vehicle_zones_layout.addWidget(zone_group)
 
-    def update_zone_pedestrian_counts(self, zone_counts: Dict[str, int]):
+    def update_zone_pedestrian_counts(self, zone_names: Sequence[str], zone_counts: np.ndarray):
         """Updates statistics for pedestrian zones, showing all zones even if empty."""
         self.clear_layout(self.pedestrian_zones_layout)
 
-        if not zone_counts:
+        if not zone_names:
             self.pedestrian_zones_layout.addWidget(self.create_no_zones_message("pedestrian"))
             return
 
-        for zone_name, count in zone_counts.items():
+        for zone_name, count in zip(zone_names, zone_counts.tolist()):
             zone_group = QGroupBox(zone_name)
             zone_layout = QGridLayout()
 
@@ -70,6 +70,15 @@ class SettingsTab(QScrollArea):
         accident_model_path_button.clicked.connect(lambda: self.main_window.browse_model_path(self.accident_model_path_edit, MODEL_TYPE_ACCIDENT))
         model_paths_grid.addWidget(accident_model_path_button, 2, 2)
 
+        model_paths_grid.addWidget(QLabel("Fused:"), 3, 0)
+        self.fused_model_path_edit = QLineEdit(self.main_window.settings["model_paths"].get(MODEL_TYPE_FUSED, ""))
+        self.fused_model_path_edit.setToolTip("Optional multi-head model replacing all three models; classes are assigned via fused_class_map in settings.json")
+        model_paths_grid.addWidget(self.fused_model_path_edit, 3, 1)
+        fused_model_path_button = QPushButton("Browse")
+        fused_model_path_button.setToolTip("Select fused multi-head model file")
+        fused_model_path_button.clicked.connect(lambda: self.main_window.browse_model_path(self.fused_model_path_edit, MODEL_TYPE_FUSED))
+        model_paths_grid.addWidget(fused_model_path_button, 3, 2)
+
         return model_paths_group
 
     def create_model_specific_settings_group(self, model_type, title):
@@ -166,6 +175,14 @@ class SettingsTab(QScrollArea):
 
         common_inference_settings_grid.addWidget(self.vid_stride_spin, row_idx, 1)
         row_idx += 1
+
+        common_inference_settings_grid.addWidget(QLabel("Batch Size:"), row_idx, 0)
+        self.batch_size_spin = QSpinBox()
+        self.batch_size_spin.setRange(1, 16)
+        self.batch_size_spin.setValue(self.main_window.settings["inference_settings"].get("batch_size", DEFAULT_BATCH_SIZE))
+        self.batch_size_spin.setToolTip("Number of frames sent to each model per call (higher = better throughput, more latency)")
+        common_inference_settings_grid.addWidget(self.batch_size_spin, row_idx, 1)
+        row_idx += 1
         common_inference_settings_grid.setRowMinimumHeight(row_idx, 30)
         row_idx += 1
 
@@ -192,6 +209,85 @@ class SettingsTab(QScrollArea):
         common_inference_settings_grid.addWidget(self.stream_buffer_check, row_idx, 1)
         common_inference_settings_grid.setRowMinimumHeight(row_idx, 30)
         row_idx += 1
+
+        common_inference_settings_grid.addWidget(QLabel("Hardware Decoding:"), row_idx, 0)
+        self.hw_decode_check = QCheckBox()
+        self.hw_decode_check.setChecked(self.main_window.settings["inference_settings"].get("hw_decode", DEFAULT_HW_DECODE))
+        self.hw_decode_check.setToolTip("Decode video on the GPU through FFmpeg when supported")
+        common_inference_settings_grid.addWidget(self.hw_decode_check, row_idx, 1)
+        common_inference_settings_grid.setRowMinimumHeight(row_idx, 30)
+        row_idx += 1
+
+        common_inference_settings_grid.addWidget(QLabel("Decode Backend:"), row_idx, 0)
+        self.decode_backend_combo = QComboBox()
+        self.decode_backend_combo.addItems(AVAILABLE_DECODE_BACKENDS)
+        self.decode_backend_combo.setCurrentText(
+            self.main_window.settings["inference_settings"].get("decode_backend", DEFAULT_DECODE_BACKEND))
+        self.decode_backend_combo.setToolTip("Video decoder used on CUDA; GPU backends fall back to OpenCV when unavailable")
+        common_inference_settings_grid.addWidget(self.decode_backend_combo, row_idx, 1)
+        common_inference_settings_grid.setRowMinimumHeight(row_idx, 30)
+        row_idx += 1
+
+        common_inference_settings_grid.addWidget(QLabel("TensorRT Export:"), row_idx, 0)
+        self.tensorrt_export_check = QCheckBox()
+        self.tensorrt_export_check.setChecked(
+            self.main_window.settings["inference_settings"].get("tensorrt_export", DEFAULT_TENSORRT_EXPORT))
+        self.tensorrt_export_check.setToolTip("On CUDA, export PyTorch models to cached TensorRT engines for faster inference (requires the tensorrt package)")
+        common_inference_settings_grid.addWidget(self.tensorrt_export_check, row_idx, 1)
+        common_inference_settings_grid.setRowMinimumHeight(row_idx, 30)
+        row_idx += 1
+
+        common_inference_settings_grid.addWidget(QLabel("ONNX Export:"), row_idx, 0)
+        self.onnx_export_check = QCheckBox()
+        self.onnx_export_check.setChecked(
+            self.main_window.settings["inference_settings"].get("onnx_export", DEFAULT_ONNX_EXPORT))
+        self.onnx_export_check.setToolTip("On CPU, export PyTorch models to cached ONNX models for faster inference (requires onnx, onnxslim and onnxruntime)")
+        common_inference_settings_grid.addWidget(self.onnx_export_check, row_idx, 1)
+        common_inference_settings_grid.setRowMinimumHeight(row_idx, 30)
+        row_idx += 1
+
+        common_inference_settings_grid.addWidget(QLabel("torch.compile:"), row_idx, 0)
+        self.torch_compile_check = QCheckBox()
+        self.torch_compile_check.setChecked(
+            self.main_window.settings["inference_settings"].get("torch_compile", DEFAULT_TORCH_COMPILE))
+        self.torch_compile_check.setToolTip("On CUDA, compile PyTorch models with torch.compile (slower first load)")
+        common_inference_settings_grid.addWidget(self.torch_compile_check, row_idx, 1)
+        common_inference_settings_grid.setRowMinimumHeight(row_idx, 30)
+        row_idx += 1
+
+        common_inference_settings_grid.addWidget(QLabel("TorchScript Export:"), row_idx, 0)
+        self.jit_compile_check = QCheckBox()
+        self.jit_compile_check.setChecked(
+            self.main_window.settings["inference_settings"].get("jit_compile", DEFAULT_JIT_COMPILE))
+        self.jit_compile_check.setToolTip("On MPS (or CPU without ONNX), run PyTorch models as cached TorchScript graphs")
+        common_inference_settings_grid.addWidget(self.jit_compile_check, row_idx, 1)
+        common_inference_settings_grid.setRowMinimumHeight(row_idx, 30)
+        row_idx += 1
+
+        common_inference_settings_grid.addWidget(QLabel("CPU INT8 Quantization:"), row_idx, 0)
+        self.quantize_int8_check = QCheckBox()
+        self.quantize_int8_check.setChecked(
+            self.main_window.settings["inference_settings"].get("quantize_int8", DEFAULT_QUANTIZE_INT8))
+        self.quantize_int8_check.setToolTip("On CPU, run PyTorch models as INT8 OpenVINO models (uses the calibration data)")
+        common_inference_settings_grid.addWidget(self.quantize_int8_check, row_idx, 1)
+        common_inference_settings_grid.setRowMinimumHeight(row_idx, 30)
+        row_idx += 1
+
+        common_inference_settings_grid.addWidget(QLabel("TensorRT INT8:"), row_idx, 0)
+        self.tensorrt_int8_check = QCheckBox()
+        self.tensorrt_int8_check.setChecked(
+            self.main_window.settings["inference_settings"].get("tensorrt_int8", DEFAULT_TENSORRT_INT8))
+        self.tensorrt_int8_check.setToolTip("Build INT8 engines (requires calibration data)")
+        common_inference_settings_grid.addWidget(self.tensorrt_int8_check, row_idx, 1)
+        common_inference_settings_grid.setRowMinimumHeight(row_idx, 30)
+        row_idx += 1
+
+        common_inference_settings_grid.addWidget(QLabel("INT8 Calibration Data:"), row_idx, 0)
+        self.int8_calibration_edit = QLineEdit(
+            self.main_window.settings["inference_settings"].get("int8_calibration_data", DEFAULT_INT8_CALIBRATION_DATA))
+        self.int8_calibration_edit.setToolTip("Dataset YAML with representative images used to calibrate INT8 engines")
+        common_inference_settings_grid.addWidget(self.int8_calibration_edit, row_idx, 1)
+        row_idx += 1
         return common_inference_settings_group
 
     def create_heatmap_settings_group(self):
@@ -250,6 +346,13 @@ class SettingsTab(QScrollArea):
         self.aspect_ratio_combo.addItems(AVAILABLE_ASPECT_RATIO_MODES)
         self.aspect_ratio_combo.setCurrentText(self.main_window.settings["display_settings"]["aspect_ratio_mode"])
         display_settings_grid.addWidget(self.aspect_ratio_combo, 0, 1)
+
+        display_settings_grid.addWidget(QLabel("Display FPS:"), 1, 0)
+        self.display_fps_spin = QSpinBox()
+        self.display_fps_spin.setRange(1, 240)
+        self.display_fps_spin.setValue(self.main_window.settings["display_settings"].get("display_fps", DEFAULT_DISPLAY_FPS))
+        self.display_fps_spin.setToolTip("Maximum rate at which processed frames are drawn; lowered automatically when the GUI falls behind")
+        display_settings_grid.addWidget(self.display_fps_spin, 1, 1)
         return display_settings_group
 
     def add_telegram_notification_settings(self):
@@ -348,6 +451,7 @@ class SettingsTab(QScrollArea):
         self.main_window.settings["model_paths"][MODEL_TYPE_ZONE] = self.zone_model_path_edit.text()
         self.main_window.settings["model_paths"][MODEL_TYPE_EMERGENCY] = self.emergency_model_path_edit.text()
         self.main_window.settings["model_paths"][MODEL_TYPE_ACCIDENT] = self.accident_model_path_edit.text()
+        self.main_window.settings["model_paths"][MODEL_TYPE_FUSED] = self.fused_model_path_edit.text()
 
         # Model-specific inference settings using a loop for each model type
         for model_type in [MODEL_TYPE_ZONE, MODEL_TYPE_EMERGENCY, MODEL_TYPE_ACCIDENT]:
@@ -360,9 +464,19 @@ class SettingsTab(QScrollArea):
         self.main_window.settings["inference_settings"]["imgsz"] = self.imgsz_spin.value()
         self.main_window.settings["inference_settings"]["max_det"] = self.max_det_spin.value()
         self.main_window.settings["inference_settings"]["vid_stride"] = self.vid_stride_spin.value()
+        self.main_window.settings["inference_settings"]["batch_size"] = self.batch_size_spin.value()
         self.main_window.settings["inference_settings"]["half"] = self.half_check.isChecked()
         self.main_window.settings["inference_settings"]["agnostic_nms"] = self.agnostic_nms_check.isChecked()
         self.main_window.settings["inference_settings"]["stream_buffer"] = self.stream_buffer_check.isChecked()
+        self.main_window.settings["inference_settings"]["hw_decode"] = self.hw_decode_check.isChecked()
+        self.main_window.settings["inference_settings"]["decode_backend"] = self.decode_backend_combo.currentText()
+        self.main_window.settings["inference_settings"]["tensorrt_export"] = self.tensorrt_export_check.isChecked()
+        self.main_window.settings["inference_settings"]["onnx_export"] = self.onnx_export_check.isChecked()
+        self.main_window.settings["inference_settings"]["jit_compile"] = self.jit_compile_check.isChecked()
+        self.main_window.settings["inference_settings"]["torch_compile"] = self.torch_compile_check.isChecked()
+        self.main_window.settings["inference_settings"]["quantize_int8"] = self.quantize_int8_check.isChecked()
+        self.main_window.settings["inference_settings"]["tensorrt_int8"] = self.tensorrt_int8_check.isChecked()
+        self.main_window.settings["inference_settings"]["int8_calibration_data"] = self.int8_calibration_edit.text()
 
         # Heatmap settings
         self.main_window.settings["heatmap_settings"]["kernel_sigma"] = self.heatmap_sigma_spin.value()
@@ -373,6 +487,8 @@ class SettingsTab(QScrollArea):
 
         # Display settings
         self.main_window.settings["display_settings"]["aspect_ratio_mode"] = self.aspect_ratio_combo.currentText()
+        self.main_window.settings["display_settings"]["display_fps"] = self.display_fps_spin.value()
+        self.main_window.update_display_settings()
 
         # Save Telegram notification settings
         if "telegram_settings" not in self.main_window.settings:
@@ -385,7 +501,6 @@ class SettingsTab(QScrollArea):
         # Save to file
         self.main_window.save_settings()
 
-        from PyQt6.QtWidgets import QMessageBox
         # Ask the user if they want to restart the application
         restart_msg = QMessageBox()
         restart_msg.setIcon(QMessageBox.Icon.Question)
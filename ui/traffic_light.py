@@ -1,14 +1,15 @@
-import cv2
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
                             QLabel, QPushButton, QSpinBox, QComboBox,
                             QTableWidget, QTableWidgetItem, QHeaderView,
                             QMessageBox, QFileDialog, QDialog, QFormLayout,
                             QLineEdit, QDialogButtonBox, QScrollArea, QCheckBox)
 from PyQt6.QtCore import Qt, QCoreApplication
-from logger import logger
+from logger import get_logger
 
 from controller.light_controller import TrafficLightController, TrafficLightConfig
 
+logger = get_logger()
+
 
 class TrafficLightPositionSelector:
     """
@@ -23,6 +24,8 @@ class TrafficLightPositionSelector:
 
     def select_position(self, light_name: str) -> tuple:
         """Interactively select a position on the video frame."""
+        import cv2
+
         cap = cv2.VideoCapture(self.video_path)
         if not cap.isOpened():
             logger.error("Error opening video stream")
@@ -97,6 +100,8 @@ class TrafficLightPositionSelector:
 
     def _draw_instructions(self, frame):
         """Helper method to draw instruction text on frame."""
+        import cv2
+
         font = cv2.FONT_HERSHEY_SIMPLEX
         cv2.putText(frame, "Click to position traffic light.", (10, 30),
                    font, 0.7, (255, 255, 255), 2, cv2.LINE_AA)
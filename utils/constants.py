@@ -1,5 +1,6 @@
 # Constants for settings and UI elements
 SETTINGS_FILE = "configs/settings.json"
+SETTINGS_SAVE_DELAY_MS = 500
 DEFAULT_CONFIDENCE_THRESHOLD = 0.40
 DEFAULT_IOU_THRESHOLD = 0.45
 DEFAULT_IMG_SIZE = 640
@@ -8,12 +9,29 @@ DEFAULT_VIDEO_STRIDE = 1
 DEFAULT_HALF_PRECISION = False
 DEFAULT_AGNOSTIC_NMS = False
 DEFAULT_STREAM_BUFFER = False
+DEFAULT_BATCH_SIZE = 4
+DEFAULT_CAMERA_BUFFER_LEN = 8
+DEFAULT_HW_DECODE = True
+DEFAULT_DECODE_BACKEND = "torchcodec"
+DEFAULT_TENSORRT_EXPORT = False
+DEFAULT_TENSORRT_INT8 = False
+DEFAULT_INT8_CALIBRATION_DATA = ""
+DEFAULT_TENSORRT_WORKSPACE = 4
+DEFAULT_ONNX_EXPORT = False
+DEFAULT_JIT_COMPILE = True
+DEFAULT_TORCH_COMPILE = True
+DEFAULT_QUANTIZE_INT8 = False
+DEFAULT_INT8_CALIBRATION_FRAMES = 500
+CALIBRATION_DIR = "calibration"
 DEFAULT_KERNEL_SIGMA = 10
 DEFAULT_INTENSITY_FACTOR = 0.3
 DEFAULT_HEATMAP_OPACITY = 0.6
 DEFAULT_COLORMAP = "JET"
 DEFAULT_HEATMAP_DECAY = 0.4
 DEFAULT_ASPECT_RATIO_MODE = "KeepAspectRatio"
+DEFAULT_DISPLAY_FPS = 30
+DISPLAY_DELAY_SMOOTHING = 0.2
+STATUS_REFRESH_INTERVAL_MS = 200
 
 # Ensure settings directory exists
 import os
@@ -22,18 +40,47 @@ os.makedirs(os.path.dirname(SETTINGS_FILE), exist_ok=True)
 AVAILABLE_COLORMAPS = ["JET", "PARULA", "TURBO", "VIRIDIS", "INFERNO"]
 AVAILABLE_ASPECT_RATIO_MODES = ["KeepAspectRatio", "IgnoreAspectRatio"]
 
+# Video decode backends; the GPU backends are only used when inference runs on CUDA
+DECODE_BACKEND_OPENCV = "opencv"
+DECODE_BACKEND_TORCHCODEC = "torchcodec"
+DECODE_BACKEND_PYAV_CUDA = "pyav_cuda"
+AVAILABLE_DECODE_BACKENDS = [DECODE_BACKEND_OPENCV, DECODE_BACKEND_TORCHCODEC, DECODE_BACKEND_PYAV_CUDA]
+
 MODEL_TYPE_ZONE = "zone_model"
 MODEL_TYPE_EMERGENCY = "emergency_model"
 MODEL_TYPE_ACCIDENT = "accident_model"
+MODEL_TYPE_FUSED = "fused_model"
 
 ZONE_TYPE_VEHICLE = 'vehicle'
 ZONE_TYPE_PEDESTRIAN = 'pedestrian'
 
+# Column order of the per-zone vehicle count arrays
+VEHICLE_CLASSES = ("bicycle", "car", "motorcycle", "bus", "truck")
+VEHICLE_CLASS_INDEX = {name: i for i, name in enumerate(VEHICLE_CLASSES)}
+# Zone model classes counted in zones and drawn into the heatmap
+TARGET_ZONE_CLASSES = ("person",) + VEHICLE_CLASSES
+HEATMAP_CLASS_INTENSITY = {
+    "truck": 1.5, "bus": 1.5,
+    "car": 1.2, "motorcycle": 1.2,
+    "person": 0.8, "bicycle": 0.8
+}
+
+# Indices into the per-frame alert flag array
+ALERT_EMERGENCY = 0
+ALERT_ACCIDENT = 1
+
 # Model format constants
 MODEL_FORMAT_PYTORCH = "pytorch"
 MODEL_FORMAT_ONNX = "onnx"
 MODEL_FORMAT_TENSORRT = "tensorrt"
 MODEL_FORMAT_COREML = "coreml"
+MODEL_FORMAT_TORCHSCRIPT = "torchscript"
+
+# Ultralytics export formats used for cached models
+EXPORT_FORMAT_ENGINE = "engine"
+EXPORT_FORMAT_ONNX = "onnx"
+EXPORT_FORMAT_TORCHSCRIPT = "torchscript"
+EXPORT_FORMAT_OPENVINO = "openvino"
 
 # Device handling constants
 DEVICE_CPU = "cpu"
@@ -57,6 +104,10 @@ MODEL_FORMAT_INFO = {
     MODEL_FORMAT_COREML: {
         "extensions": ['.mlpackage'],
         "supported_devices": [DEVICE_MPS, DEVICE_CPU]
+    },
+    MODEL_FORMAT_TORCHSCRIPT: {
+        "extensions": ['.torchscript'],
+        "supported_devices": [DEVICE_CPU, DEVICE_CUDA, DEVICE_MPS]
     }
 }
 
@@ -3,7 +3,9 @@ import traceback
 from typing import Optional
 
 from PyQt6.QtWidgets import QMessageBox, QApplication
-from logger import logger
+from logger import get_logger
+
+logger = get_logger()
 
 def show_error_dialog(title: str, message: str, details: Optional[str] = None):
     """Shows an error dialog to the user."""
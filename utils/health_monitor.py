@@ -1,22 +1,27 @@
 import time
-import threading
 import psutil
 import platform
 from typing import Dict, Any, Callable
-import torch
+from PyQt6.QtCore import QProcess, QTimer
 
-from logger import logger
+from logger import get_logger
+
+logger = get_logger()
+
+# nvidia-smi runs asynchronously; a query still running after this many seconds is treated as hung
+NVIDIA_SMI_TIMEOUT = 5.0
 
 class HealthMonitor:
     """
     Monitors system health metrics like CPU usage, memory usage, GPU utilization,
     and disk space. Can trigger alerts when thresholds are exceeded.
+    Checks run from a QTimer on the Qt event loop, so alert callbacks may update widgets directly.
+    Must be created and started from the GUI thread.
     """
     def __init__(self, check_interval: float = 60.0):
         self.check_interval = check_interval
-        self.monitoring_thread = None
+        self.timer = None
         self.is_monitoring = False
-        self.stop_event = threading.Event()
 
         # Alert thresholds
         self.thresholds = {
@@ -35,6 +40,13 @@ class HealthMonitor:
         self.check_count = 0
         self.last_metrics = None
 
+        # GPU temperature is read by an nvidia-smi process that reports back to the event loop;
+        # querying stops when nvidia-smi is missing or hangs
+        self.query_gpu_temperature = True
+        self.gpu_temperature = None
+        self.temperature_process = None
+        self.temperature_query_started = 0.0
+
     def set_alert_callback(self, callback: Callable[[str, Dict[str, Any]], None]):
         """Set a callback function to be called when alerts are triggered."""
         self.alert_callback = callback
@@ -45,54 +57,47 @@ class HealthMonitor:
             self.thresholds[metric] = value
 
     def start_monitoring(self):
-        """Start the health monitoring thread."""
+        """Start periodic health checks, running the first one as soon as the event loop is idle."""
         if self.is_monitoring:
             return False
 
         self.is_monitoring = True
-        self.stop_event.clear()
-        self.monitoring_thread = threading.Thread(
-            target=self._monitoring_loop,
-            daemon=True
-        )
-        self.monitoring_thread.start()
+        self.timer = QTimer()
+        self.timer.setInterval(int(self.check_interval * 1000))
+        self.timer.timeout.connect(self.run_check)
+        self.timer.start()
+        QTimer.singleShot(0, self.run_check)
         logger.info("Health monitoring started")
         return True
 
     def stop_monitoring(self):
-        """Stop the health monitoring thread."""
+        """Stop periodic health checks."""
         if not self.is_monitoring:
             return False
 
         self.is_monitoring = False
-        self.stop_event.set()
-        if self.monitoring_thread:
-            self.monitoring_thread.join(timeout=2.0)
-            self.monitoring_thread = None
+        if self.timer:
+            self.timer.stop()
+            self.timer = None
+        if self.temperature_process is not None:
+            self.temperature_process.kill()
         logger.info("Health monitoring stopped")
         return True
 
-    def _monitoring_loop(self):
-        """Main monitoring loop that runs in the background thread."""
-        while not self.stop_event.is_set():
-            try:
-                # Get current metrics
-                metrics = self.get_system_metrics()
-                self.last_metrics = metrics
-                self.check_count += 1
-
-                # Check for threshold violations and trigger alerts
-                self._check_thresholds(metrics)
-
-                # Sleep until next check, but allow for early termination
-                for _ in range(int(self.check_interval / 0.1)):
-                    if self.stop_event.is_set():
-                        break
-                    time.sleep(0.1)
-
-            except Exception as e:
-                logger.error(f"Error in health monitoring: {e}")
-                time.sleep(5.0)  # Wait a bit before retrying
+    def run_check(self):
+        """Collects one metrics snapshot and triggers alerts for exceeded thresholds."""
+        if not self.is_monitoring:
+            return
+        try:
+            # Get current metrics
+            metrics = self.get_system_metrics()
+            self.last_metrics = metrics
+            self.check_count += 1
+
+            # Check for threshold violations and trigger alerts
+            self._check_thresholds(metrics)
+        except Exception as e:
+            logger.error(f"Error in health monitoring: {e}")
 
     def _check_thresholds(self, metrics: Dict[str, Any]):
         """Check if any metrics have exceeded their thresholds."""
@@ -151,7 +156,9 @@ class HealthMonitor:
             "python_version": platform.python_version()
         }
 
-        # Get GPU metrics if available
+        # Get GPU metrics if available; torch is imported here so creating the monitor stays cheap
+        import torch
+
         if torch.cuda.is_available():
             try:
                 gpu_count = torch.cuda.device_count()
@@ -168,23 +175,53 @@ class HealthMonitor:
                     metrics["gpu_memory_allocated"] = allocated
                     metrics["gpu_memory_percent"] = (allocated / total) * 100
 
-                    # Try to get temperature on Linux with nvidia-smi
-                    if platform.system() == "Linux":
-                        try:
-                            import subprocess
-                            result = subprocess.run(
-                                ['nvidia-smi', '--query-gpu=temperature.gpu', '--format=csv,noheader'],
-                                capture_output=True, text=True, check=True
-                            )
-                            temp = float(result.stdout.strip())
-                            metrics["gpu_temperature"] = temp
-                        except (subprocess.SubprocessError, ValueError) as e:
-                            logger.debug(f"Could not get GPU temperature: {e}")
+                    # On Linux, report the latest nvidia-smi reading and request a fresh one for the next check
+                    if platform.system() == "Linux" and self.query_gpu_temperature:
+                        self._request_gpu_temperature()
+                        if self.gpu_temperature is not None:
+                            metrics["gpu_temperature"] = self.gpu_temperature
             except Exception as e:
                 logger.debug(f"Error getting GPU metrics: {e}")
 
         return metrics
 
+    def _request_gpu_temperature(self):
+        """Starts an nvidia-smi temperature query without waiting for it; the result arrives in a slot."""
+        # One process object is reused for every query, so none is destroyed while Qt still signals from it
+        if self.temperature_process is None:
+            self.temperature_process = QProcess()
+            self.temperature_process.finished.connect(self._on_gpu_temperature_finished)
+            self.temperature_process.errorOccurred.connect(self._on_gpu_temperature_error)
+        elif self.temperature_process.state() != QProcess.ProcessState.NotRunning:
+            if time.time() - self.temperature_query_started >= NVIDIA_SMI_TIMEOUT:
+                self._disable_gpu_temperature("nvidia-smi did not respond")
+            return
+
+        self.temperature_query_started = time.time()
+        self.temperature_process.start("nvidia-smi", ["--query-gpu=temperature.gpu", "--format=csv,noheader"])
+
+    def _on_gpu_temperature_finished(self, exit_code, exit_status):
+        """Stores the temperature of the first GPU from a finished nvidia-smi query."""
+        output = bytes(self.temperature_process.readAllStandardOutput()).decode(errors="replace")
+        try:
+            if exit_status != QProcess.ExitStatus.NormalExit or exit_code != 0:
+                raise ValueError(f"nvidia-smi exited with code {exit_code}")
+            self.gpu_temperature = float(output.strip().splitlines()[0])
+        except (ValueError, IndexError) as e:
+            logger.debug(f"Could not get GPU temperature: {e}")
+
+    def _on_gpu_temperature_error(self, process_error):
+        """Stops querying when nvidia-smi cannot be started."""
+        if process_error == QProcess.ProcessError.FailedToStart:
+            self._disable_gpu_temperature("nvidia-smi could not be started")
+
+    def _disable_gpu_temperature(self, reason):
+        """Stops GPU temperature queries for the rest of the session."""
+        self.query_gpu_temperature = False
+        if self.temperature_process.state() != QProcess.ProcessState.NotRunning:
+            self.temperature_process.kill()
+        logger.warning(f"GPU temperature monitoring disabled: {reason}")
+
     def get_report(self) -> Dict[str, Any]:
         """Get a report of system health and monitoring statistics."""
         report = {
@@ -0,0 +1,45 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _stamp_kernels(heatmap, kernels, kernel_halves, kernel_ids, centers_x, centers_y, intensities):
+    """
+    Adds one separable gaussian stamp per object to the heatmap, clipped at the frame border.
+    kernels holds the 1D kernels as rows padded to a common odd length, centered in the row,
+    and kernel_halves the half-width of each unpadded kernel.
+    """
+    height, width = heatmap.shape
+    center = kernels.shape[1] // 2
+    for i in range(centers_x.shape[0]):
+        kernel = kernels[kernel_ids[i]]
+        half = kernel_halves[kernel_ids[i]]
+        center_x = centers_x[i]
+        center_y = centers_y[i]
+        y_start = max(0, center_y - half)
+        y_end = min(height, center_y + half + 1)
+        x_start = max(0, center_x - half)
+        x_end = min(width, center_x + half + 1)
+        for y in range(y_start, y_end):
+            row_weight = kernel[center + y - center_y] * intensities[i]
+            for x in range(x_start, x_end):
+                heatmap[y, x] += row_weight * kernel[center + x - center_x]
+
+# Stamps overlap, so objects are added one after another rather than in parallel
+stamp_kernels = njit(cache=True, fastmath=True)(_stamp_kernels) if njit is not None else None
+
+def pack_kernels(kernels):
+    """
+    Stacks 1D kernels of different odd lengths into one float32 array, each centered in its row.
+    Returns the packed kernels and the half-width of each.
+    """
+    length = max(kernel.shape[0] for kernel in kernels)
+    packed = np.zeros((len(kernels), length), dtype=np.float32)
+    halves = np.empty(len(kernels), dtype=np.int64)
+    for row, kernel in enumerate(kernels):
+        offset = (length - kernel.shape[0]) // 2
+        packed[row, offset:offset + kernel.shape[0]] = kernel
+        halves[row] = kernel.shape[0] // 2
+    return packed, halves
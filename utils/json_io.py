@@ -0,0 +1,32 @@
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def load_json_file(file_path: str):
+    """
+    Reads and parses a JSON file, using orjson's C parser when it is installed.
+    Decoding errors are raised as json.JSONDecodeError either way.
+    """
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+def save_json_file(data, file_path: str):
+    """
+    Writes data as indented JSON, using orjson when it is installed.
+    The file is written to a temporary path and swapped in, so readers never see a partial file.
+    """
+    tmp_path = file_path + ".tmp"
+    if orjson is not None:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=4)
+    os.replace(tmp_path, file_path)
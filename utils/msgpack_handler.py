@@ -0,0 +1,79 @@
+import logging
+from logging.handlers import RotatingFileHandler
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Used only for rendering tracebacks; message formatting is left to the reader tool
+_exception_formatter = logging.Formatter()
+
+
+class MsgpackFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that writes each record as a msgpack map instead of
+    formatted text. Records are self-delimiting, so the file is a plain stream
+    of maps that traffic_vision_logcat.py decodes back into text.
+
+    Keys: t=created timestamp, lvl=level number, n=logger name, f=filename,
+    l=line number, m=message, x=traceback (only when present).
+
+    Records below WARNING stay in the stream's buffer until it fills, rolls over or is closed;
+    warnings and errors are flushed at once, so they survive a native crash right after them.
+    The file size is tracked from the bytes written rather than queried per record.
+    """
+    @staticmethod
+    def is_supported() -> bool:
+        """Returns True when the msgpack package is installed."""
+        return msgpack is not None
+
+    def __init__(self, filename, maxBytes=0, backupCount=0):
+        if msgpack is None:
+            raise ImportError("msgpack is required for MsgpackFileHandler")
+        self._size = 0
+        super().__init__(filename, mode="ab", maxBytes=maxBytes, backupCount=backupCount)
+        self._packer = msgpack.Packer()
+
+    def _open(self):
+        """Opens the log file and starts the size count at its current length."""
+        stream = super()._open()
+        self._size = stream.tell()
+        return stream
+
+    def shouldRollover(self, record):
+        """Checks the tracked file size only; records are never formatted just to measure them."""
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        return self._size >= self.maxBytes
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+
+            entry = {
+                "t": record.created,
+                "lvl": record.levelno,
+                "n": record.name,
+                "f": record.filename,
+                "l": record.lineno,
+                "m": record.getMessage(),
+            }
+            if record.exc_info:
+                if not record.exc_text:
+                    record.exc_text = _exception_formatter.formatException(record.exc_info)
+            if record.exc_text:
+                entry["x"] = record.exc_text
+
+            data = self._packer.pack(entry)
+            self.stream.write(data)
+            self._size += len(data)
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
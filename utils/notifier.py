@@ -1,8 +1,6 @@
 import requests
 import cv2
-import os
 import time
-import tempfile
 import logging
 from typing import Optional
 from datetime import datetime
@@ -69,17 +67,18 @@ class TelegramNotifier:
                 message += f"\nDetails: {details}\n"
 
             if image is not None:
-                # Save image temporarily
-                temp_image_path = self._save_temp_image(image)
+                # Encode in memory rather than round-tripping through a temporary file
+                ok, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, 85])
+                if not ok:
+                    self.logger.error("Failed to encode accident image")
+                    return False
 
                 # Send photo with caption
-                with open(temp_image_path, "rb") as photo:
-                    url = f"{self.base_url}/sendPhoto"
-                    files = {"photo": photo}
-                    data = {"chat_id": self.chat_id, "caption": message}
-                    response = requests.post(url, files=files, data=data, timeout=10)
-
-                self._remove_temp_file(temp_image_path)
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                url = f"{self.base_url}/sendPhoto"
+                files = {"photo": (f"accident_{timestamp}.jpg", encoded.tobytes(), "image/jpeg")}
+                data = {"chat_id": self.chat_id, "caption": message}
+                response = requests.post(url, files=files, data=data, timeout=10)
 
             else:
                 # Send text message if no image
@@ -99,27 +98,3 @@ class TelegramNotifier:
         except Exception as e:
             self.logger.error(f"Error sending Telegram notification: {e}")
             return False
-
-    def _save_temp_image(self, image: cv2.Mat) -> str:
-        """Save image to temporary file and return the path."""
-        # Get system temp directory
-        temp_dir = tempfile.gettempdir()
-
-        # Create a subdirectory for our accident images
-        accident_dir = os.path.join(temp_dir, "accident_images")
-        os.makedirs(accident_dir, exist_ok=True)
-
-        # Create filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_path = os.path.join(accident_dir, f"accident_{timestamp}.jpg")
-        cv2.imwrite(file_path, image)
-        return file_path
-
-
-    def _remove_temp_file(self, file_path: str):
-        """Remove temporary file after sending."""
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-        except Exception as e:
-            self.logger.error(f"Error removing temporary file {file_path}: {e}")
@@ -0,0 +1,133 @@
+import cv2
+import numpy as np
+import torch
+
+from logger import get_logger
+
+logger = get_logger()
+
+LETTERBOX_FILL = 114
+
+class FramePreprocessor:
+    """
+    Letterboxes BGR frames once into a reused host buffer and converts them to a normalized
+    RGB BCHW tensor on the device. All models are fed the same tensor, so the batch is
+    resized and letterboxed once per batch instead of once per model.
+    """
+    def __init__(self, batch_size: int, imgsz: int, device: str = "cpu"):
+        self.imgsz = imgsz
+        self.device = torch.device(device)
+        self.frame_shape = None
+        self.ratio = 1.0
+        self.pad = (0, 0)
+        self.resized_size = (imgsz, imgsz)
+        self._allocate(batch_size)
+
+    def _new_host_buffer(self, batch_size):
+        """Returns an uninitialized NHWC uint8 staging tensor."""
+        return torch.empty((batch_size, self.imgsz, self.imgsz, 3), dtype=torch.uint8)
+
+    def _allocate(self, batch_size):
+        """Allocates the uint8 staging buffer; uint8 keeps the host-to-device transfer 4x smaller than float."""
+        self.batch_size = batch_size
+        self.host_buffer = self._new_host_buffer(batch_size)
+        self.host_array = self.host_buffer.numpy()
+        self.host_array.fill(LETTERBOX_FILL)
+        self.frame_shape = None
+
+    def _update_geometry(self, frame_shape):
+        """Recomputes the letterbox ratio and padding when the frame size changes."""
+        h, w = frame_shape[:2]
+        self.ratio = min(self.imgsz / h, self.imgsz / w)
+        new_w, new_h = int(round(w * self.ratio)), int(round(h * self.ratio))
+        self.resized_size = (new_w, new_h)
+        self.pad = ((self.imgsz - new_w) // 2, (self.imgsz - new_h) // 2)
+        self.host_array.fill(LETTERBOX_FILL)
+        self.frame_shape = frame_shape
+
+    def _prepare(self, frames):
+        """Resizes the buffer or geometry for the batch if needed."""
+        if len(frames) > self.batch_size:
+            self._allocate(len(frames))
+        if frames[0].shape != self.frame_shape:
+            self._update_geometry(frames[0].shape)
+
+    def _letterbox(self, frames):
+        """Resizes the frames into the centre of the staging buffer."""
+        new_w, new_h = self.resized_size
+        pad_x, pad_y = self.pad
+        for i, frame in enumerate(frames):
+            self.host_array[i, pad_y:pad_y + new_h, pad_x:pad_x + new_w] = cv2.resize(frame, (new_w, new_h))
+
+    @staticmethod
+    def _normalize(batch):
+        """Converts an NHWC uint8 BGR batch to a normalized RGB BCHW float tensor."""
+        # The NHWC staging layout already is channels-last, which the converted model consumes directly
+        return batch.permute(0, 3, 1, 2).flip(1).float().div_(255.0).contiguous(memory_format=torch.channels_last)
+
+    def __call__(self, frames):
+        """Returns a normalized RGB BCHW tensor on the device for a list of same-sized BGR frames."""
+        self._prepare(frames)
+        self._letterbox(frames)
+        # float() copies, so the staging buffer can be refilled while the models still use the batch
+        return self._normalize(self.host_buffer[:len(frames)].to(self.device))
+
+    def scale_boxes(self, xyxy: np.ndarray) -> np.ndarray:
+        """Maps letterboxed xyxy boxes back to the coordinates of the original frames."""
+        if self.frame_shape is None or len(xyxy) == 0:
+            return xyxy
+        pad_x, pad_y = self.pad
+        boxes = (xyxy - np.array([pad_x, pad_y, pad_x, pad_y], dtype=xyxy.dtype)) / self.ratio
+        h, w = self.frame_shape[:2]
+        boxes[:, [0, 2]] = boxes[:, [0, 2]].clip(0, w)
+        boxes[:, [1, 3]] = boxes[:, [1, 3]].clip(0, h)
+        return boxes
+
+class PinnedFramePreprocessor(FramePreprocessor):
+    """
+    Letterboxes BGR frames into page-locked host buffers and uploads them to the GPU
+    with non-blocking copies on a dedicated CUDA stream. Two staging buffers are used
+    in turn, so the next batch is letterboxed while the previous upload is still running.
+    The resulting BCHW tensor can be passed to Ultralytics models directly.
+    """
+    def __init__(self, batch_size: int, imgsz: int, device: str = "cuda"):
+        super().__init__(batch_size, imgsz, device)
+        self.stream = torch.cuda.Stream(self.device)
+
+    def _new_host_buffer(self, batch_size):
+        """Returns a pinned staging tensor so the upload can run asynchronously."""
+        return torch.empty((batch_size, self.imgsz, self.imgsz, 3), dtype=torch.uint8, pin_memory=True)
+
+    def _allocate(self, batch_size):
+        """Allocates both pinned staging buffers, each with an event marking its last upload."""
+        self.host_buffers = []
+        for _ in range(2):
+            super()._allocate(batch_size)
+            self.host_buffers.append((self.host_buffer, self.host_array, torch.cuda.Event()))
+        self.buffer_index = 0
+
+    def _update_geometry(self, frame_shape):
+        """Recomputes the letterbox geometry and clears the padding of both staging buffers."""
+        for _, _, copy_done in self.host_buffers:
+            copy_done.synchronize()
+        super()._update_geometry(frame_shape)
+        for _, host_array, _ in self.host_buffers:
+            host_array.fill(LETTERBOX_FILL)
+
+    def __call__(self, frames):
+        """Returns a normalized RGB BCHW tensor on the device for a list of same-sized BGR frames."""
+        self._prepare(frames)
+
+        self.buffer_index ^= 1
+        self.host_buffer, self.host_array, copy_done = self.host_buffers[self.buffer_index]
+        # Only the upload from this buffer two batches ago has to finish before it is overwritten
+        copy_done.synchronize()
+        self._letterbox(frames)
+
+        with torch.cuda.stream(self.stream):
+            batch = self.host_buffer[:len(frames)].to(self.device, non_blocking=True)
+            copy_done.record(self.stream)
+            # FP32 output; the model backend casts to FP16 itself when it runs in half precision
+            batch = self._normalize(batch)
+        torch.cuda.current_stream(self.device).wait_stream(self.stream)
+        return batch
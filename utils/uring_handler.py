@@ -0,0 +1,232 @@
+import ctypes
+import ctypes.util
+import os
+import platform
+import re
+import sys
+import threading
+from logging.handlers import RotatingFileHandler
+
+# Upper bound for sizeof(struct io_uring); the ring is only accessed through liburing.
+_RING_STRUCT_SIZE = 512
+_STOP_REQUEST_ID = 0
+
+_liburing = None
+
+
+class _IoUringCqe(ctypes.Structure):
+    """Layout of struct io_uring_cqe."""
+    _fields_ = [
+        ("user_data", ctypes.c_uint64),
+        ("res", ctypes.c_int32),
+        ("flags", ctypes.c_uint32),
+    ]
+
+
+def _load_liburing():
+    """Loads liburing-ffi (liburing >= 2.4), which exports the inline prep helpers."""
+    global _liburing
+    if _liburing is not None:
+        return _liburing
+
+    library_path = ctypes.util.find_library("uring-ffi")
+    if not library_path:
+        return None
+
+    try:
+        lib = ctypes.CDLL(library_path, use_errno=True)
+    except OSError:
+        return None
+
+    lib.io_uring_queue_init.argtypes = [ctypes.c_uint, ctypes.c_void_p, ctypes.c_uint]
+    lib.io_uring_queue_init.restype = ctypes.c_int
+    lib.io_uring_queue_exit.argtypes = [ctypes.c_void_p]
+    lib.io_uring_queue_exit.restype = None
+    lib.io_uring_get_sqe.argtypes = [ctypes.c_void_p]
+    lib.io_uring_get_sqe.restype = ctypes.c_void_p
+    lib.io_uring_prep_write.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p,
+                                        ctypes.c_uint, ctypes.c_uint64]
+    lib.io_uring_prep_write.restype = None
+    lib.io_uring_prep_nop.argtypes = [ctypes.c_void_p]
+    lib.io_uring_prep_nop.restype = None
+    lib.io_uring_sqe_set_data64.argtypes = [ctypes.c_void_p, ctypes.c_uint64]
+    lib.io_uring_sqe_set_data64.restype = None
+    lib.io_uring_submit.argtypes = [ctypes.c_void_p]
+    lib.io_uring_submit.restype = ctypes.c_int
+    lib.io_uring_wait_cqe.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.POINTER(_IoUringCqe))]
+    lib.io_uring_wait_cqe.restype = ctypes.c_int
+    lib.io_uring_cqe_seen.argtypes = [ctypes.c_void_p, ctypes.POINTER(_IoUringCqe)]
+    lib.io_uring_cqe_seen.restype = None
+
+    _liburing = lib
+    return _liburing
+
+
+def _kernel_version():
+    """Returns the (major, minor) version of the running kernel."""
+    parts = re.findall(r"\d+", os.uname().release)[:2]
+    return tuple(int(part) for part in parts)
+
+
+class _IoUring:
+    """Minimal io_uring wrapper: one submitter side and one reaper side."""
+    def __init__(self, entries: int):
+        self.lib = _load_liburing()
+        if self.lib is None:
+            raise OSError("liburing-ffi is not available")
+
+        self.ring = ctypes.create_string_buffer(_RING_STRUCT_SIZE)
+        result = self.lib.io_uring_queue_init(entries, self.ring, 0)
+        if result < 0:
+            raise OSError(-result, os.strerror(-result))
+        self.submit_lock = threading.Lock()
+
+    def _get_sqe(self):
+        sqe = self.lib.io_uring_get_sqe(self.ring)
+        if not sqe:
+            # Submission queue full: hand the queued entries to the kernel and retry
+            self.lib.io_uring_submit(self.ring)
+            sqe = self.lib.io_uring_get_sqe(self.ring)
+            if not sqe:
+                raise OSError("io_uring submission queue is full")
+        return sqe
+
+    def submit_write(self, fd: int, buffer, length: int, offset: int, request_id: int):
+        """Queues a positional write and submits it without waiting for completion."""
+        with self.submit_lock:
+            sqe = self._get_sqe()
+            self.lib.io_uring_prep_write(sqe, fd, buffer, length, offset)
+            self.lib.io_uring_sqe_set_data64(sqe, request_id)
+            result = self.lib.io_uring_submit(self.ring)
+        if result < 0:
+            raise OSError(-result, os.strerror(-result))
+
+    def submit_nop(self, request_id: int):
+        """Queues a no-op, used to wake the reaper thread."""
+        with self.submit_lock:
+            sqe = self._get_sqe()
+            self.lib.io_uring_prep_nop(sqe)
+            self.lib.io_uring_sqe_set_data64(sqe, request_id)
+            self.lib.io_uring_submit(self.ring)
+
+    def wait_completion(self):
+        """Blocks until a completion is available and returns (request_id, result)."""
+        cqe = ctypes.POINTER(_IoUringCqe)()
+        result = self.lib.io_uring_wait_cqe(self.ring, ctypes.byref(cqe))
+        if result < 0:
+            raise OSError(-result, os.strerror(-result))
+        request_id, res = cqe.contents.user_data, cqe.contents.res
+        self.lib.io_uring_cqe_seen(self.ring, cqe)
+        return request_id, res
+
+    def close(self):
+        self.lib.io_uring_queue_exit(self.ring)
+
+
+class IoUringFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that submits log writes through io_uring.
+    emit() only queues a positional write; completions are reaped on a
+    background thread, so the logging caller never blocks on write().
+    """
+    RING_ENTRIES = 64
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Returns True when running on Linux 5.1+ with liburing-ffi installed."""
+        if platform.system() != "Linux":
+            return False
+        try:
+            if _kernel_version() < (5, 1):
+                return False
+        except ValueError:
+            return False
+        return _load_liburing() is not None
+
+    def __init__(self, filename, maxBytes=0, backupCount=0, encoding=None):
+        self._uring = _IoUring(self.RING_ENTRIES)
+        self._pending = {}
+        self._next_request_id = _STOP_REQUEST_ID + 1
+        self._completion = threading.Condition()
+        self._offset = 0
+        super().__init__(filename, mode="a", maxBytes=maxBytes,
+                         backupCount=backupCount, encoding=encoding)
+        self._reaper = threading.Thread(target=self._reap_completions, daemon=True)
+        self._reaper.start()
+
+    def _open(self):
+        # Writes carry explicit offsets, so the file must not be opened with O_APPEND
+        fd = os.open(self.baseFilename, os.O_WRONLY | os.O_CREAT, 0o644)
+        self._offset = os.fstat(fd).st_size
+        return os.fdopen(fd, "wb", buffering=0)
+
+    def _reap_completions(self):
+        """Background loop that releases write buffers as the kernel completes them."""
+        while True:
+            try:
+                request_id, result = self._uring.wait_completion()
+            except OSError as e:
+                sys.stderr.write(f"io_uring completion error: {e}\n")
+                continue
+
+            if request_id == _STOP_REQUEST_ID:
+                break
+
+            with self._completion:
+                buffer = self._pending.pop(request_id, None)
+                self._completion.notify_all()
+
+            if result < 0:
+                sys.stderr.write(f"io_uring log write failed: {os.strerror(-result)}\n")
+            elif buffer is not None and result < len(buffer):
+                sys.stderr.write("io_uring log write was truncated\n")
+
+    def _wait_for_pending(self):
+        """Blocks until every submitted write has completed."""
+        with self._completion:
+            while self._pending:
+                self._completion.wait()
+
+    def shouldRollover(self, record):
+        """Rollover decision based on the tracked write offset; avoids stat and seek."""
+        return self.maxBytes > 0 and self._offset >= self.maxBytes
+
+    def doRollover(self):
+        self._wait_for_pending()
+        super().doRollover()
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+
+            data = (self.format(record) + self.terminator).encode(self.encoding or "utf-8")
+            buffer = ctypes.create_string_buffer(data, len(data))
+            with self._completion:
+                while len(self._pending) >= self.RING_ENTRIES:
+                    self._completion.wait()
+                request_id = self._next_request_id
+                self._next_request_id += 1
+                self._pending[request_id] = buffer
+
+            self._uring.submit_write(self.stream.fileno(), buffer, len(data), self._offset, request_id)
+            self._offset += len(data)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self._wait_for_pending()
+
+    def close(self):
+        self.acquire()
+        try:
+            if self._reaper.is_alive():
+                self._wait_for_pending()
+                self._uring.submit_nop(_STOP_REQUEST_ID)
+                self._reaper.join(timeout=2.0)
+                self._uring.close()
+        finally:
+            self.release()
+        super().close()
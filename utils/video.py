@@ -0,0 +1,118 @@
+import os
+
+import cv2
+
+from utils.constants import DECODE_BACKEND_OPENCV, DECODE_BACKEND_TORCHCODEC
+from logger import get_logger
+
+logger = get_logger()
+
+class TorchCodecCapture:
+    """
+    Minimal VideoCapture-compatible reader that decodes on NVDEC through torchcodec.
+    Frames are decoded on the GPU and only the finished BGR image is copied back to the host,
+    which frees the CPU core software decoding would otherwise occupy.
+    """
+    def __init__(self, video_path: str, device: str = "cuda"):
+        from torchcodec.decoders import VideoDecoder
+
+        self.decoder = VideoDecoder(video_path, device=device, dimension_order="NHWC")
+        self.num_frames = len(self.decoder)
+        self.index = 0
+
+    def isOpened(self):
+        return self.decoder is not None
+
+    def read(self):
+        """Returns (ret, frame) like cv2.VideoCapture.read, with frame as a BGR uint8 array."""
+        if self.decoder is None or self.index >= self.num_frames:
+            return False, None
+        # Sequential indexing lets torchcodec decode forward without seeking
+        frame = self.decoder[self.index]
+        self.index += 1
+        return True, frame.flip(-1).cpu().numpy()
+
+    def release(self):
+        self.decoder = None
+
+class PyAVCapture:
+    """Minimal VideoCapture-compatible reader that decodes through PyAV with CUDA hardware acceleration."""
+    def __init__(self, video_path: str):
+        import av
+        from av.codec.hwaccel import HWAccel
+
+        self.container = av.open(video_path, hwaccel=HWAccel(device_type="cuda"))
+        self.frames = self.container.decode(video=0)
+
+    def isOpened(self):
+        return self.container is not None
+
+    def read(self):
+        """Returns (ret, frame) like cv2.VideoCapture.read, with frame as a BGR uint8 array."""
+        if self.container is None:
+            return False, None
+        try:
+            frame = next(self.frames)
+        except StopIteration:
+            return False, None
+        return True, frame.to_ndarray(format="bgr24")
+
+    def release(self):
+        if self.container is not None:
+            self.container.close()
+            self.container = None
+
+def is_live_source(video_path) -> bool:
+    """Returns whether a source is a live stream or camera rather than a video file on disk."""
+    return not os.path.isfile(str(video_path))
+
+def _open_gpu_decoder(video_path: str, decode_backend: str):
+    """
+    Opens the requested GPU decoder, falling back from torchcodec to PyAV.
+    Returns None when neither backend is available.
+    """
+    if decode_backend == DECODE_BACKEND_TORCHCODEC:
+        try:
+            cap = TorchCodecCapture(video_path)
+            logger.info("Using torchcodec NVDEC video decoding")
+            return cap
+        except Exception as e:
+            logger.debug(f"torchcodec decoding unavailable: {e}")
+
+    try:
+        cap = PyAVCapture(video_path)
+        logger.info("Using PyAV CUDA video decoding")
+        return cap
+    except Exception as e:
+        logger.debug(f"PyAV CUDA decoding unavailable: {e}")
+    return None
+
+def open_video_capture(video_path: str, hw_decode: bool = True, decode_backend: str = DECODE_BACKEND_OPENCV):
+    """
+    Opens a video with FFmpeg hardware-accelerated decoding when available,
+    falling back to OpenCV's default software decoding.
+    With a GPU decode backend, torchcodec and then PyAV are tried before OpenCV.
+    """
+    if hw_decode and decode_backend != DECODE_BACKEND_OPENCV:
+        cap = _open_gpu_decoder(video_path, decode_backend)
+        if cap is not None:
+            return cap
+
+    if hw_decode and hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+        # Acceleration must be requested at open time; setting it afterwards has no effect
+        params = [
+            cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY,
+            cv2.CAP_PROP_HW_DEVICE, 0,
+        ]
+        try:
+            cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, params)
+            if cap.isOpened():
+                acceleration = int(cap.get(cv2.CAP_PROP_HW_ACCELERATION))
+                if acceleration != cv2.VIDEO_ACCELERATION_NONE:
+                    logger.info(f"Using hardware video decoding (type {acceleration})")
+                return cap
+            cap.release()
+        except cv2.error as e:
+            logger.debug(f"Hardware video decoding unavailable: {e}")
+
+    return cv2.VideoCapture(video_path)
@@ -4,6 +4,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 import sqlite3
 import os
+import traceback
 
 # Enable pandas Copy-on-Write mode to prevent SettingWithCopyWarning
 pd.options.mode.copy_on_write = True
@@ -1388,7 +1389,6 @@ def main():
 
     except Exception as e:
         st.error(f"Error connecting to database: {e}")
-        import traceback
         st.exception(traceback.format_exc())
 
 if __name__ == "__main__":